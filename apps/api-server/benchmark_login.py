@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+로그인 DB 비용 마이크로벤치마크
+
+임시 사용자를 만들어 같은 로그인을 반복하면서, 로그인 1건당 실행되는 SQL
+문 수, 커밋 수, DB 실행 시간과 전체 지연을 기존 방식(사용자 갱신/세션
+생성/로그인 로그를 각각 커밋)과 단일 트랜잭션 방식
+(AUTH_LOGIN_UNIT_OF_WORK)으로 나누어 측정합니다.
+
+비밀번호 검증 시간은 두 방식에 동일하게 포함되므로 DB 비용은 "DB 시간"
+열로 비교합니다. 측정이 끝나면 임시 사용자와 생성된 세션/로그를 삭제합니다.
+
+사용법:
+    python benchmark_login.py
+    python benchmark_login.py --iterations 200
+    python benchmark_login.py --write-behind  # 로그인 로그를 일괄 기록
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from sqlalchemy import delete, event  # noqa: E402
+
+from src.core.config import settings  # noqa: E402
+from src.core.database import mgmt_engine, mgmt_session_local  # noqa: E402
+from src.core.security import get_password_hash  # noqa: E402
+from src.modules.mgmt.auth.authentication.schemas import (  # noqa: E402
+    LoginRequest,
+)
+from src.modules.mgmt.auth.authentication.service import (  # noqa: E402
+    AuthenticationService,
+)
+from src.modules.mgmt.idam.login_log.model import LoginLog  # noqa: E402
+from src.modules.mgmt.idam.session.model import Session  # noqa: E402
+from src.modules.mgmt.idam.user.model import User  # noqa: E402
+from src.services.mgmt.login_audit import login_audit  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+class StatementCounter:
+    """엔진 이벤트로 SQL 문 수, 커밋 수, 실행 시간 집계"""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        self.db_seconds = 0.0
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "commit", self._commit)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+        self.db_seconds = 0.0
+
+    def _before(self, conn, cursor, statement, parameters, context, many):
+        conn.info["benchmark_started"] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, many):
+        self.statements += 1
+        self.db_seconds += time.perf_counter() - conn.info.pop(
+            "benchmark_started"
+        )
+
+    def _commit(self, conn):
+        self.commits += 1
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def create_user() -> User:
+    """벤치마크용 임시 사용자 생성"""
+    suffix = uuid.uuid4().hex[:8]
+    salt = uuid.uuid4().hex
+    user = User(
+        email=f"benchmark-{suffix}@example.com",
+        username=f"benchmark-{suffix}",
+        password=get_password_hash(PASSWORD + salt),
+        salt_key=salt,
+        full_name="Login Benchmark",
+        user_type="MASTER",
+        status="ACTIVE",
+        created_at=datetime.now(),
+    )
+    with mgmt_session_local() as db:
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+    return user
+
+
+def remove_user(user: User) -> None:
+    """임시 사용자와 생성된 세션/로그인 로그 삭제"""
+    login_audit.flush()
+    with mgmt_session_local() as db:
+        db.execute(delete(LoginLog).where(LoginLog.user_id == user.id))
+        db.execute(delete(Session).where(Session.user_id == user.id))
+        db.execute(delete(User).where(User.id == user.id))
+        db.commit()
+
+
+async def run(username: str, iterations: int, counter: StatementCounter):
+    """로그인을 반복하고 건당 (SQL 문 수, 커밋 수, DB 시간, 전체 시간) 반환"""
+    login_data = LoginRequest(username=username, password=PASSWORD)
+    results = []
+    for _ in range(iterations):
+        with mgmt_session_local() as db:
+            counter.reset()
+            started = time.perf_counter()
+            await AuthenticationService.login(db, login_data)
+            elapsed = time.perf_counter() - started
+        results.append(
+            (
+                counter.statements,
+                counter.commits,
+                counter.db_seconds,
+                elapsed,
+            )
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로그인 DB 비용 측정")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--write-behind",
+        action="store_true",
+        help="로그인 로그를 일괄 기록 (기본값: 로그인 트랜잭션에서 기록)",
+    )
+    args = parser.parse_args()
+
+    settings.LOGIN_AUDIT_WRITE_BEHIND = args.write_behind
+    counter = StatementCounter(mgmt_engine)
+    user = create_user()
+
+    print("=== 로그인 DB 비용 측정 ===")
+    print(
+        f"반복 {args.iterations}회, 로그인 로그 "
+        f"{'일괄 기록' if args.write_behind else '동기 기록'}"
+    )
+    print()
+    print(
+        f"{'방식':<14}{'SQL 문':>8}{'커밋':>6}"
+        f"{'DB p50':>10}{'DB p99':>10}{'전체 p50':>10}{'전체 p99':>10}"
+    )
+
+    try:
+        for label, unit_of_work in (("기존", False), ("단일 트랜잭션", True)):
+            settings.AUTH_LOGIN_UNIT_OF_WORK = unit_of_work
+            asyncio.run(run(str(user.username), args.warmup, counter))
+            results = asyncio.run(
+                run(str(user.username), args.iterations, counter)
+            )
+            statements, commits, db_seconds, elapsed = zip(*results)
+            print(
+                f"{label:<14}"
+                f"{statistics.mean(statements):>8.1f}"
+                f"{statistics.mean(commits):>6.1f}"
+                f"{statistics.median(db_seconds) * 1000:>8.2f}ms"
+                f"{percentile(list(db_seconds), 99) * 1000:>8.2f}ms"
+                f"{statistics.median(elapsed) * 1000:>8.1f}ms"
+                f"{percentile(list(elapsed), 99) * 1000:>8.1f}ms"
+            )
+    finally:
+        remove_user(user)
+        login_audit.stop()
+
+    print()
+    print("비밀번호 검증 시간은 두 방식의 전체 지연에 동일하게 포함됩니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
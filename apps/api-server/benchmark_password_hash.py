@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 비용 산정 스크립트
+
+현재 호스트에서 bcrypt/argon2id 후보 파라미터별 해시 지연을 측정하고,
+예상 동시 로그인 수(--concurrency)가 비밀번호 해시 풀
+(PASSWORD_HASH_WORKERS)에 한꺼번에 몰렸을 때의 p99가 목표(--target-p99-ms)
+안에 드는 가장 강한 파라미터를 추천합니다.
+
+사용법:
+    python benchmark_password_hash.py
+    python benchmark_password_hash.py --concurrency 50 --target-p99-ms 300
+    python benchmark_password_hash.py --scheme argon2 --workers 8
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from passlib.hash import argon2  # noqa: E402
+
+from src.core.config import settings  # noqa: E402
+from src.core.security import build_password_context  # noqa: E402
+
+# 비용 오름차순 후보 (argon2: time_cost, memory_cost(KiB))
+BCRYPT_CANDIDATES = [10, 11, 12, 13, 14]
+ARGON2_CANDIDATES = [
+    (2, 19456),
+    (2, 47104),
+    (3, 65536),
+    (4, 65536),
+    (3, 131072),
+]
+
+PASSWORD = "benchmark-password" + "0" * 32  # password + salt_key 길이 근사
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def measure(context, samples: int, workers: int, concurrency: int, bursts):
+    """단일 검증 지연과 동시 요청 시 (대기 + 검증) 지연 측정 (초)"""
+    hashed = context.hash(PASSWORD)
+
+    single = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        single.append(time.perf_counter() - started)
+
+    def job(submitted: float) -> float:
+        context.verify(PASSWORD, hashed)
+        return time.perf_counter() - submitted
+
+    burst = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(bursts):
+            submitted = time.perf_counter()
+            futures = [
+                executor.submit(job, submitted) for _ in range(concurrency)
+            ]
+            burst.extend(future.result() for future in futures)
+
+    return single, burst
+
+
+def candidates(scheme: str):
+    if scheme in ("bcrypt", "all"):
+        for rounds in BCRYPT_CANDIDATES:
+            yield (
+                f"bcrypt rounds={rounds}",
+                {
+                    "PASSWORD_HASH_SCHEME": "bcrypt",
+                    "PASSWORD_BCRYPT_ROUNDS": rounds,
+                },
+                build_password_context("bcrypt", bcrypt_rounds=rounds),
+            )
+    if scheme in ("argon2", "all"):
+        if not argon2.has_backend():
+            print("⚠️  argon2-cffi가 설치되지 않아 argon2id는 건너뜁니다.")
+            return
+        for time_cost, memory_cost in ARGON2_CANDIDATES:
+            yield (
+                f"argon2id t={time_cost} m={memory_cost // 1024}MiB",
+                {
+                    "PASSWORD_HASH_SCHEME": "argon2",
+                    "PASSWORD_ARGON2_TIME_COST": time_cost,
+                    "PASSWORD_ARGON2_MEMORY_COST": memory_cost,
+                    "PASSWORD_ARGON2_PARALLELISM": 1,
+                },
+                build_password_context(
+                    "argon2",
+                    argon2_time_cost=time_cost,
+                    argon2_memory_cost=memory_cost,
+                    argon2_parallelism=1,
+                ),
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="비밀번호 해시 비용 산정")
+    parser.add_argument(
+        "--scheme", choices=["bcrypt", "argon2", "all"], default="all"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=20,
+        help="동시에 몰리는 로그인 수 (기본값: 20)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.PASSWORD_HASH_WORKERS,
+        help="비밀번호 해시 풀 크기 (기본값: PASSWORD_HASH_WORKERS)",
+    )
+    parser.add_argument(
+        "--target-p99-ms",
+        type=float,
+        default=500,
+        help="로그인 비밀번호 검증 p99 목표 (기본값: 500ms)",
+    )
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--bursts", type=int, default=3)
+    args = parser.parse_args()
+
+    print("=== 비밀번호 해시 비용 산정 ===")
+    print(
+        f"CPU {os.cpu_count()}개, 풀 {args.workers}스레드, "
+        f"동시 로그인 {args.concurrency}건, 목표 p99 {args.target_p99_ms}ms"
+    )
+    print()
+    print(f"{'파라미터':<28}{'단건 p50':>10}{'단건 p99':>10}{'동시 p99':>10}")
+
+    target = args.target_p99_ms / 1000
+    recommended: dict[str, tuple[str, dict]] = {}
+    too_slow: set[str] = set()
+    for label, env, context in candidates(args.scheme):
+        scheme = env["PASSWORD_HASH_SCHEME"]
+        if scheme in too_slow:
+            continue
+        single, burst = measure(
+            context,
+            args.samples,
+            args.workers,
+            args.concurrency,
+            args.bursts,
+        )
+        burst_p99 = percentile(burst, 99)
+        fits = burst_p99 <= target
+        print(
+            f"{label:<28}"
+            f"{statistics.median(single) * 1000:>8.0f}ms"
+            f"{percentile(single, 99) * 1000:>8.0f}ms"
+            f"{burst_p99 * 1000:>8.0f}ms"
+            f"{'  ✅' if fits else '  ❌'}"
+        )
+        if fits:
+            recommended[scheme] = (label, env)
+        elif statistics.median(single) > target:
+            # 단건도 목표를 넘으면 같은 스킴의 더 높은 비용은 측정하지 않음
+            too_slow.add(scheme)
+
+    print()
+    if not recommended:
+        print(
+            "❌ 목표를 만족하는 파라미터가 없습니다. "
+            "--workers를 늘리거나 목표 p99를 조정하세요."
+        )
+        return 1
+
+    for scheme, (label, env) in recommended.items():
+        print(f"✅ 추천 ({scheme}): {label}")
+        for key, value in env.items():
+            print(f"   {key}={value}")
+    print()
+    print("설정 변경 후 기존 해시는 각 사용자의 다음 로그인 시 재해시됩니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+애플리케이션 import 시간 측정
+
+새 인터프리터에서 `python -X importtime -c "import src.main"`을 실행하여
+모듈별 import 시간을 최상위 패키지 단위로 합산하고, 오래 걸린 모듈과
+패키지를 출력합니다. 여러 번 실행한 경우 가장 빠른 실행을 기준으로 합니다.
+
+CI에서 시작 시간 회귀를 막는 용도로, 전체 import 시간이 --max-ms를 넘거나
+시작 시 읽지 않아야 할 패키지(--forbid, 기본값: AI/GraphQL 의존성)가
+import되면 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmark_startup.py
+    python benchmark_startup.py --repeat 5 --max-ms 1500
+    python benchmark_startup.py --module src.core.config --top 10
+    LAZY_ROUTERS=false python benchmark_startup.py  # 즉시 등록과 비교
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FORBID = ["langchain", "openai", "pinecone", "strawberry"]
+
+
+def run_importtime(module: str) -> list[tuple[str, int, int]]:
+    """(모듈, self us, cumulative us) 목록 (import 순서)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:], file=sys.stderr)
+        raise SystemExit(f"{module} import 실패 (종료 코드 {result.returncode})")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 머리글 행
+        entries.append(
+            (fields[2].strip(), int(fields[0]), int(fields[1]))
+        )
+    return entries
+
+
+def summarize(entries, top: int) -> None:
+    packages: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in entries:
+        packages[name.split(".", 1)[0]] += self_us
+
+    print(f"\n패키지별 import 시간 (상위 {top})")
+    print(f"{'패키지':<32}{'시간(ms)':>12}")
+    for name, self_us in sorted(
+        packages.items(), key=lambda item: item[1], reverse=True
+    )[:top]:
+        print(f"{name:<32}{self_us / 1000:>12.1f}")
+
+    print(f"\n모듈별 누적 import 시간 (상위 {top})")
+    print(f"{'모듈':<48}{'자체(ms)':>12}{'누적(ms)':>12}")
+    for name, self_us, cumulative_us in sorted(
+        entries, key=lambda entry: entry[2], reverse=True
+    )[:top]:
+        print(
+            f"{name:<48}{self_us / 1000:>12.1f}{cumulative_us / 1000:>12.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="애플리케이션 import 시간")
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=0,
+        help="전체 import 시간 한도 (0이면 검사하지 않음)",
+    )
+    parser.add_argument(
+        "--forbid",
+        nargs="*",
+        default=DEFAULT_FORBID,
+        help="import되면 실패로 처리할 최상위 패키지",
+    )
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(max(args.repeat, 1)):
+        entries = run_importtime(args.module)
+        total_ms = sum(self_us for _, self_us, _ in entries) / 1000
+        runs.append((total_ms, entries))
+    runs.sort(key=lambda run: run[0])
+    total_ms, entries = runs[0]
+
+    print(f"=== {args.module} import 시간 ({len(runs)}회) ===")
+    print(
+        f"최소 {total_ms:.1f}ms / 최대 {runs[-1][0]:.1f}ms, "
+        f"모듈 {len(entries)}개"
+    )
+    summarize(entries, args.top)
+
+    failures = []
+    if args.max_ms and total_ms > args.max_ms:
+        failures.append(
+            f"import 시간 {total_ms:.1f}ms가 한도 {args.max_ms:.0f}ms 초과"
+        )
+    imported = {name.split(".", 1)[0] for name, _, _ in entries}
+    for package in args.forbid:
+        if package in imported:
+            failures.append(f"시작 시 import되면 안 되는 패키지: {package}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"실패: {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
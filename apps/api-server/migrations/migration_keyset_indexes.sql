@@ -0,0 +1,12 @@
+-- 커서(키셋) 페이지네이션용 복합 인덱스 추가
+-- (정렬 시각, id) 내림차순 인덱스로 깊은 페이지도 인덱스 범위 스캔으로 조회
+
+-- 사용 전 주의사항:
+-- 1. CONCURRENTLY 옵션은 트랜잭션 블록 안에서 실행할 수 없습니다
+-- 2. 대용량 테이블은 인덱스 생성에 시간이 걸리므로 부하가 적은 시간에 실행하세요
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_login_logs__created_id
+    ON idam.login_logs (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_sessions__last_activity_id
+    ON idam.sessions (last_activity_at DESC, id DESC);
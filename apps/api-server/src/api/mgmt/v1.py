@@ -1,13 +1,9 @@
-from fastapi import APIRouter
+from src.core.lazy_router import RouterSpec
 
-from ...modules.mgmt.auth.router import router as auth_router
-from ...modules.mgmt.idam.router import router as idam_router
-from ...modules.mgmt.tnnt.router import router as tnnt_router
-
-# ... import other module routers
-
-router = APIRouter()
-# Note: Each module router already includes its own prefix
-router.include_router(idam_router)  # Now includes logs and sessions
-router.include_router(tnnt_router)
-router.include_router(auth_router)
+# 관리자 시스템 모듈 라우터 (각 모듈 라우터에 접두사 포함)
+# 라우터 모듈은 첫 요청 또는 예열 시 import (src/core/lazy_router.py)
+ROUTERS = (
+    RouterSpec("/api/v1/mgmt/idam", "src.modules.mgmt.idam.router"),
+    RouterSpec("/api/v1/mgmt/tnnt", "src.modules.mgmt.tnnt.router"),
+    RouterSpec("/api/v1/mgmt/auth", "src.modules.mgmt.auth.router"),
+)
@@ -1,9 +1,11 @@
-from fastapi import APIRouter
+from src.core.lazy_router import RouterSpec
 
-from ...modules.tnnt.auth.router import router as auth_router
-
-# ... import other module routers
-
-router = APIRouter()
-# Note: no version prefix here, main.py attaches prefix '/api/v1/tnnt'
-router.include_router(auth_router, prefix="/api/v1/tnnt/auth")
+# 사용자 시스템 모듈 라우터 (접두사는 등록 시 추가)
+# 라우터 모듈은 첫 요청 또는 예열 시 import (src/core/lazy_router.py)
+ROUTERS = (
+    RouterSpec(
+        "/api/v1/tnnt/auth",
+        "src.modules.tnnt.auth.router",
+        prefix="/api/v1/tnnt/auth",
+    ),
+)
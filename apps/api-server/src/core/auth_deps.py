@@ -1,17 +1,41 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import APIKeyHeader, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
-from src.modules.mgmt.auth.service import AuthService
+from src.core.config import settings
+from src.core.database import get_mgmt_db_async
+from src.modules.mgmt.auth.authentication.service import (
+    AuthenticationService,
+)
+from src.modules.mgmt.idam.api_key.model import ApiKey as ApiKeyModel
+from src.modules.mgmt.idam.api_key.service import ApiKeyService
 from src.modules.mgmt.idam.session.model import Session as SessionModel
+from src.services.mgmt.permission_resolver import permission_resolver
 
 security = HTTPBearer()
+api_key_header = APIKeyHeader(name=settings.API_KEY_HEADER, auto_error=False)
+
+
+async def _validate_credentials(
+    db: AsyncSession, credentials: str
+) -> SessionModel | None:
+    """Bearer 자격 증명(세션 토큰 또는 액세스 토큰)으로 세션 검증
+
+    AUTH_STATELESS_JWT이면 JWT 형식의 액세스 토큰은 DB 조회 없이 검증하고,
+    그 외에는 자격 증명을 세션 토큰으로 보고 기존 방식으로 검증합니다.
+    """
+    if settings.AUTH_STATELESS_JWT and credentials.count(".") == 2:
+        return await AuthenticationService.validate_access_token_async(
+            db, credentials
+        )
+    return await AuthenticationService.validate_session_token_async(
+        db, credentials
+    )
 
 
 async def get_current_session(
     token: str = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ) -> SessionModel:
     """현재 활성 세션 조회"""
     credentials_exception = HTTPException(
@@ -21,11 +45,8 @@ async def get_current_session(
     )
 
     try:
-        # Bearer 토큰에서 세션 토큰 추출
-        session_token = token.credentials
-
-        # 세션 유효성 검증
-        session = AuthService.validate_session_token(db, session_token)
+        # Bearer 토큰으로 세션 유효성 검증
+        session = await _validate_credentials(db, token.credentials)
 
         if session is None:
             raise credentials_exception
@@ -38,14 +59,79 @@ async def get_current_session(
 
 async def get_optional_session(
     token: str | None = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ) -> SessionModel | None:
     """선택적 세션 조회 (인증이 필요 없는 경우)"""
     if not token:
         return None
 
     try:
-        session_token = token.credentials
-        return AuthService.validate_session_token(db, session_token)
+        return await _validate_credentials(db, token.credentials)
     except Exception:
         return None
+
+
+async def get_current_api_key(
+    request: Request,
+    api_key: str | None = Depends(api_key_header),
+    db: AsyncSession = Depends(get_mgmt_db_async),
+) -> ApiKeyModel:
+    """API 키 헤더로 인증된 API 키 조회 (기계 클라이언트용)
+
+    검증 결과는 api_key_authenticator 캐시를 사용하므로 같은 키의 반복
+    호출은 DB를 조회하지 않습니다. 인증된 키의 식별 값은 request.state에
+    기록됩니다.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid API key",
+        headers={"WWW-Authenticate": "ApiKey"},
+    )
+    if not api_key:
+        raise credentials_exception
+
+    ip_address = AuthenticationService._client_ip(request)
+    try:
+        key = await ApiKeyService.authenticate_api_key(
+            db, api_key, ip_address
+        )
+    except Exception:
+        raise credentials_exception
+    if key is None:
+        raise credentials_exception
+
+    request.state.api_key_id = key.id
+    request.state.user_id = key.user_id
+    if key.tenant_context:
+        request.state.tenant_id = key.tenant_context
+    return key
+
+
+def require_permission(*permission_codes: str):
+    """지정한 권한을 모두 보유한 세션만 허용하는 의존성 생성
+
+    사용 예:
+        @router.post(
+            "/", dependencies=[Depends(require_permission("USER_CREATE"))]
+        )
+
+    권한 집합은 permission_resolver 캐시에서 조회하며, 세션의 테넌트
+    컨텍스트가 있으면 해당 테넌트 범위 역할도 포함합니다.
+    """
+
+    async def dependency(
+        session: SessionModel = Depends(get_current_session),
+        db: AsyncSession = Depends(get_mgmt_db_async),
+    ) -> SessionModel:
+        granted = await permission_resolver.resolve(
+            db, session.user_id, session.tenant_context
+        )
+        missing = [code for code in permission_codes if code not in granted]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing permissions: {', '.join(missing)}",
+            )
+        return session
+
+    return dependency
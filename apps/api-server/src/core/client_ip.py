@@ -0,0 +1,42 @@
+"""
+요청 IP 주소 확인
+
+직접 연결한 주소가 TRUSTED_PROXIES(리버스 프록시)에 속할 때만
+X-Forwarded-For를 사용합니다. 클라이언트는 헤더의 왼쪽 항목을 임의로 채울
+수 있으므로, 오른쪽부터 따라가며 신뢰하는 프록시가 아닌 첫 주소(마지막
+프록시가 기록한 실제 접속 주소)를 요청 IP로 봅니다.
+"""
+
+import ipaddress
+
+from src.core.config import settings
+
+_TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(network, strict=False)
+    for network in settings.TRUSTED_PROXIES
+)
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _TRUSTED_PROXIES)
+
+
+def resolve_client_ip(
+    peer: str | None, forwarded_for: str | None
+) -> str | None:
+    """직접 연결한 주소(peer)와 X-Forwarded-For로 요청 IP 주소 결정"""
+    if not peer or not forwarded_for or not _is_trusted_proxy(peer):
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    # 모든 항목이 프록시이면 가장 앞의 주소
+    return hops[0] if hops else peer
+
+
+__all__ = ["resolve_client_ip"]
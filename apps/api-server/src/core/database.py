@@ -1,40 +1,127 @@
 from fastapi import Request
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
+from src.core.db_pool import instrument_pool, pool_options
+from src.core.db_replica import ReplicaRouter
+from src.core.opentelemetry import instrument_engine
+from src.core.query_stats import instrument_query_stats
 
-# 두 개의 DB 엔진 생성 (시간대 설정 포함)
+# 두 개의 DB 엔진 생성 (시간대는 접속 옵션으로 설정)
 mgmt_engine = create_engine(
     settings.DATABASE_URL_MANAGES,
-    pool_pre_ping=True,
     connect_args={"options": "-c timezone=Asia/Seoul"},
+    **pool_options("mgmt"),
 )
 tnnt_engine = create_engine(
     settings.DATABASE_URL_TENANTS,
-    pool_pre_ping=True,
     connect_args={"options": "-c timezone=Asia/Seoul"},
+    **pool_options("tnnt"),
+)
+
+mgmt_session_local = sessionmaker(
+    autocommit=False, autoflush=False, bind=mgmt_engine
+)
+tnnt_session_local = sessionmaker(
+    autocommit=False, autoflush=False, bind=tnnt_engine
 )
 
 
-# 세션 생성 시마다 시간대 설정
-@event.listens_for(mgmt_engine, "connect")
-def set_timezone_mgmt(dbapi_connection, connection_record):
-    with dbapi_connection.cursor() as cursor:
-        cursor.execute("SET timezone='Asia/Seoul'")
+def _to_async_url(url: str):
+    """동기 DSN을 비동기 드라이버 DSN으로 변환 (postgresql -> asyncpg)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.set(drivername="postgresql+asyncpg")
 
 
-@event.listens_for(tnnt_engine, "connect")
-def set_timezone_tnnt(dbapi_connection, connection_record):
-    with dbapi_connection.cursor() as cursor:
-        cursor.execute("SET timezone='Asia/Seoul'")
+def _async_connect_args(url: str) -> dict:
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {"server_settings": {"timezone": "Asia/Seoul"}}
 
 
-mgmt_session_local = sessionmaker(
-    autocommit=False, autoflush=False, bind=mgmt_engine
+# 비동기 DB 엔진 (asyncpg) - API 요청 처리용
+# 동기 엔진은 seed_idam.py 등 스크립트와 동기 서비스에서 계속 사용
+mgmt_async_engine = create_async_engine(
+    _to_async_url(settings.DATABASE_URL_MANAGES),
+    connect_args=_async_connect_args(settings.DATABASE_URL_MANAGES),
+    **pool_options("mgmt_async", is_async=True),
 )
-tnnt_session_local = sessionmaker(
-    autocommit=False, autoflush=False, bind=tnnt_engine
+tnnt_async_engine = create_async_engine(
+    _to_async_url(settings.DATABASE_URL_TENANTS),
+    connect_args=_async_connect_args(settings.DATABASE_URL_TENANTS),
+    **pool_options("tnnt_async", is_async=True),
+)
+
+instrument_pool("mgmt", mgmt_engine)
+instrument_pool("tnnt", tnnt_engine)
+instrument_pool("mgmt_async", mgmt_async_engine)
+instrument_pool("tnnt_async", tnnt_async_engine)
+instrument_engine("mgmt", mgmt_engine)
+instrument_engine("tnnt", tnnt_engine)
+instrument_engine("mgmt", mgmt_async_engine)
+instrument_engine("tnnt", tnnt_async_engine)
+instrument_query_stats("mgmt", mgmt_engine)
+instrument_query_stats("tnnt", tnnt_engine)
+instrument_query_stats("mgmt_async", mgmt_async_engine)
+instrument_query_stats("tnnt_async", tnnt_async_engine)
+
+
+def _create_replica(name: str, url: str):
+    """복제본 URL이 설정된 경우 비동기 엔진, 세션 팩토리, 라우터 생성"""
+    if not url:
+        return None, None
+    engine = create_async_engine(
+        _to_async_url(url),
+        connect_args=_async_connect_args(url),
+        **pool_options(name, is_async=True),
+    )
+    instrument_pool(name, engine)
+    instrument_engine(name, engine)
+    instrument_query_stats(name, engine)
+    session_local = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    router = ReplicaRouter(
+        name,
+        engine,
+        max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+        check_interval=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    )
+    return session_local, router
+
+
+# 읽기 전용 복제본 (선택) - 목록/통계 조회용
+mgmt_replica_session_local, mgmt_replica_router = _create_replica(
+    "mgmt_replica", settings.DATABASE_URL_MANAGES_REPLICA
+)
+tnnt_replica_session_local, tnnt_replica_router = _create_replica(
+    "tnnt_replica", settings.DATABASE_URL_TENANTS_REPLICA
+)
+
+# 커밋 후 속성 만료 시 응답 직렬화 중 지연 로딩(I/O)이 발생하므로 비활성화
+mgmt_async_session_local = async_sessionmaker(
+    bind=mgmt_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+tnnt_async_session_local = async_sessionmaker(
+    bind=tnnt_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
 
@@ -63,3 +150,46 @@ def get_tnnt_db():
         yield db
     finally:
         db.close()
+
+
+async def get_mgmt_db_async():
+    """Management 데이터베이스 비동기 세션"""
+    async with mgmt_async_session_local() as db:
+        yield db
+
+
+async def get_tnnt_db_async():
+    """Tenant 데이터베이스 비동기 세션"""
+    async with tnnt_async_session_local() as db:
+        yield db
+
+
+async def get_mgmt_db_readonly():
+    """Management 데이터베이스 읽기 전용 비동기 세션
+
+    복제본이 설정되어 있고 지연이 허용치 이내이면 복제본, 아니면 primary
+    세션을 제공합니다. 쓰기 작업에는 사용하지 않습니다.
+    """
+    session_local = mgmt_async_session_local
+    if mgmt_replica_router and await mgmt_replica_router.is_usable():
+        session_local = mgmt_replica_session_local
+    async with session_local() as db:
+        yield db
+
+
+async def get_tnnt_db_readonly():
+    """Tenant 데이터베이스 읽기 전용 비동기 세션 (복제본 우선)"""
+    session_local = tnnt_async_session_local
+    if tnnt_replica_router and await tnnt_replica_router.is_usable():
+        session_local = tnnt_replica_session_local
+    async with session_local() as db:
+        yield db
+
+
+async def dispose_async_engines():
+    """비동기 엔진 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    await mgmt_async_engine.dispose()
+    await tnnt_async_engine.dispose()
+    for router in (mgmt_replica_router, tnnt_replica_router):
+        if router is not None:
+            await router.engine.dispose()
@@ -0,0 +1,118 @@
+"""
+DB 커넥션 풀 설정 및 계측
+
+mgmt/tnnt 엔진의 풀 크기, overflow, recycle, timeout, pre-ping 여부를
+Settings에서 읽어 엔진 생성 인자로 제공하고, 풀 상태를 Prometheus
+지표로 노출합니다.
+
+게이지는 커넥션 대여/반납 시점에 값을 기록합니다. 수집 시점에 값을 읽는
+Gauge.set_function은 멀티 워커 모드(PROMETHEUS_MULTIPROC_DIR)의
+MultiProcessCollector가 무시하므로 사용하지 않으며, 워커별 값은
+livesum으로 합산됩니다.
+
+- db_pool_checked_out: 현재 대여 중인 커넥션 수
+- db_pool_overflow: pool_size를 초과하여 생성된 커넥션 수
+- db_pool_size: 유휴 커넥션을 포함한 풀 크기
+- db_pool_checkout_wait_seconds: 커넥션 대여 대기 시간
+- db_pool_checkout_timeouts_total: pool_timeout 초과로 실패한 대여 횟수
+"""
+
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.core.config import settings
+
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "현재 대여 중인 DB 커넥션 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "pool_size를 초과하여 생성된 DB 커넥션 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "DB 커넥션 풀 크기 (유휴 커넥션 포함)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "DB 커넥션 풀에서 커넥션을 대여하기까지의 대기 시간",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 초과로 실패한 DB 커넥션 대여 횟수",
+    ["pool"],
+)
+
+
+def _record_pool_state(name: str, pool: QueuePool) -> None:
+    """풀 상태 게이지 갱신"""
+    POOL_CHECKED_OUT.labels(pool=name).set(pool.checkedout())
+    POOL_OVERFLOW.labels(pool=name).set(max(pool.overflow(), 0))
+    POOL_SIZE.labels(pool=name).set(pool.size())
+
+
+def _timed_pool_class(name: str, base: type[QueuePool]) -> type[QueuePool]:
+    """커넥션 대여 대기 시간과 대여/반납 후 풀 상태를 기록하는 풀 클래스 생성
+
+    engine.dispose() 시 풀은 같은 클래스로 재생성되므로 풀 이름은
+    인스턴스가 아닌 클래스 속성으로 둡니다.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return base._do_get(self)
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(pool=name).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.labels(pool=name).observe(
+                time.perf_counter() - started
+            )
+            _record_pool_state(name, self)
+
+    def _do_return_conn(self, record):
+        try:
+            base._do_return_conn(self, record)
+        finally:
+            _record_pool_state(name, self)
+
+    return type(
+        f"Timed{base.__name__}",
+        (base,),
+        {"_do_get": _do_get, "_do_return_conn": _do_return_conn},
+    )
+
+
+def pool_options(name: str, is_async: bool = False) -> dict:
+    """Settings 기반 엔진 풀 옵션 (create_engine/create_async_engine 인자)"""
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return {
+        "poolclass": _timed_pool_class(name, base),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def instrument_pool(name: str, engine) -> None:
+    """첫 대여 전에도 풀 크기가 보이도록 게이지 초기값 기록"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    _record_pool_state(name, sync_engine.pool)
+
+
+__all__ = ["instrument_pool", "pool_options"]
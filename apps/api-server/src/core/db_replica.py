@@ -0,0 +1,110 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+목록/통계 조회처럼 무거운 읽기 요청을 복제본으로 보내 로그인 등 쓰기
+경로와 primary 자원을 나눠 쓰도록 합니다.
+
+- 복제 지연(lag)을 DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS 주기로 측정하여
+  DB_REPLICA_MAX_LAG_SECONDS를 넘으면 primary로 우회
+- 복제본 접속 실패 시 다음 측정 주기까지 primary로 우회
+- PostgreSQL이 아닌 복제본(로컬 테스트용 SQLite 파일 등)은 지연 0으로 간주
+"""
+
+import asyncio
+import logging
+import time
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# primary(복구 모드 아님)이거나 WAL을 모두 재생한 경우 지연 0
+_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(
+        EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+    )
+END
+"""
+
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "마지막으로 측정한 복제본 지연 시간 (측정 실패 시 -1)",
+    ["pool"],
+)
+REPLICA_FALLBACKS = Counter(
+    "db_replica_fallbacks_total",
+    "복제본 대신 primary로 우회한 읽기 요청 수",
+    ["pool", "reason"],
+)
+
+
+class ReplicaRouter:
+    """복제본 사용 가능 여부를 주기적으로 판단하는 라우터"""
+
+    def __init__(
+        self,
+        name: str,
+        engine: AsyncEngine,
+        max_lag: float,
+        check_interval: float,
+    ):
+        self.name = name
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+
+        self._usable = False
+        self._reason = "unchecked"
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+
+    async def is_usable(self) -> bool:
+        """복제본으로 읽기 요청을 보내도 되는지 여부"""
+        if time.monotonic() >= self._next_check and not self._lock.locked():
+            async with self._lock:
+                if time.monotonic() >= self._next_check:
+                    await self._check()
+
+        if not self._usable:
+            REPLICA_FALLBACKS.labels(pool=self.name, reason=self._reason).inc()
+        return self._usable
+
+    async def _check(self) -> None:
+        try:
+            lag = await asyncio.wait_for(
+                self._measure_lag(), timeout=self.check_interval
+            )
+        except (SQLAlchemyError, OSError, TimeoutError) as e:
+            if self._usable or self._reason != "unavailable":
+                logger.warning(f"복제본({self.name}) 접속 실패, primary 사용: {e}")
+            REPLICA_LAG.labels(pool=self.name).set(-1)
+            self._usable, self._reason = False, "unavailable"
+        else:
+            REPLICA_LAG.labels(pool=self.name).set(lag)
+            if lag > self.max_lag:
+                if self._usable:
+                    logger.warning(
+                        f"복제본({self.name}) 지연 {lag:.1f}초가 허용치"
+                        f" {self.max_lag}초를 초과하여 primary 사용"
+                    )
+                self._usable, self._reason = False, "lag"
+            else:
+                self._usable, self._reason = True, ""
+        finally:
+            self._next_check = time.monotonic() + self.check_interval
+
+    async def _measure_lag(self) -> float:
+        if self.engine.dialect.name != "postgresql":
+            return 0.0
+        async with self.engine.connect() as conn:
+            lag = await conn.scalar(text(_LAG_SQL))
+        return float(lag or 0)
+
+
+__all__ = ["ReplicaRouter"]
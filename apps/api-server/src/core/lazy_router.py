@@ -0,0 +1,162 @@
+"""
+라우터 지연 등록
+
+애플리케이션 import 시 모든 모듈 라우터(와 라우터가 끌어오는 서비스,
+스키마, 모델)를 읽지 않고 RouterSpec 목록(src/api/*/v1.py의 ROUTERS)만
+등록해 두어 워커 시작과 --reload 재시작 시간을 줄입니다.
+
+- 요청 경로가 아직 읽지 않은 라우터의 경로 접두사와 일치하면 그 자리에서
+  import하여 app에 추가한 뒤 요청을 처리
+- 시작 직후(ROUTER_WARMUP) 남은 라우터를 백그라운드에서 차례로 import
+- 문서(/docs, /redoc, /openapi.json) 요청 전에는 모든 라우터를 읽음
+
+import는 스레드 풀에서, include_router는 이벤트 루프에서 수행하므로 요청
+처리 중인 라우트 목록을 다른 스레드가 바꾸지 않습니다.
+LAZY_ROUTERS=false이면 create_app에서 load_all()로 모든 라우터를 즉시
+등록합니다.
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RouterSpec:
+    """지연 등록할 라우터 (요청 경로 접두사와 라우터 위치)"""
+
+    __slots__ = ("path", "module", "attribute", "prefix")
+
+    def __init__(
+        self,
+        path: str,
+        module: str,
+        attribute: str = "router",
+        prefix: str = "",
+    ):
+        self.path = path.rstrip("/")  # 이 접두사의 요청이 오면 import
+        self.module = module
+        self.attribute = attribute
+        self.prefix = prefix  # include_router에 넘길 접두사
+
+    def matches(self, path: str) -> bool:
+        return path == self.path or path.startswith(self.path + "/")
+
+    def import_router(self):
+        """라우터 모듈 import (스레드 풀에서 호출)"""
+        return getattr(importlib.import_module(self.module), self.attribute)
+
+    def __repr__(self):
+        return f"RouterSpec({self.path!r}, {self.module!r})"
+
+
+class LazyRouterRegistry:
+    """아직 등록하지 않은 라우터 목록과 등록 절차"""
+
+    def __init__(self, app: FastAPI, specs=()):
+        self.app = app
+        self._pending: list[RouterSpec] = list(specs)
+        self._lock = asyncio.Lock()
+        self._warmup_task: asyncio.Task | None = None
+        self.docs_paths = frozenset(
+            path
+            for path in (
+                app.openapi_url,
+                app.docs_url,
+                app.redoc_url,
+                app.swagger_ui_oauth2_redirect_url,
+            )
+            if path
+        )
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, spec: RouterSpec) -> None:
+        self._pending.append(spec)
+
+    def _include(self, spec: RouterSpec, router, started: float) -> None:
+        self.app.include_router(router, prefix=spec.prefix)
+        # 이미 생성된 OpenAPI 스키마에는 새 라우트가 없으므로 다시 생성
+        self.app.openapi_schema = None
+        self._pending.remove(spec)
+        logger.info(
+            f"라우터 등록: {spec.module} "
+            f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+
+    def load_all(self) -> None:
+        """모든 라우터를 즉시 등록 (이벤트 루프 시작 전, 동기)"""
+        for spec in list(self._pending):
+            started = time.perf_counter()
+            self._include(spec, spec.import_router(), started)
+
+    async def ensure_loaded(self, path: str | None = None) -> None:
+        """path와 일치하는 라우터(None이면 전부)를 import하여 등록"""
+        specs = [
+            spec
+            for spec in self._pending
+            if path is None or spec.matches(path)
+        ]
+        if not specs:
+            return
+        async with self._lock:
+            for spec in specs:
+                # 대기하는 동안 다른 요청이나 예열이 이미 등록했을 수 있음
+                if spec not in self._pending:
+                    continue
+                started = time.perf_counter()
+                router = await run_in_threadpool(spec.import_router)
+                self._include(spec, router, started)
+
+    def start_warmup(self) -> None:
+        """남은 라우터를 백그라운드에서 import (애플리케이션 시작 후)"""
+        if self._pending and self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warmup())
+
+    def stop_warmup(self) -> None:
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+
+    async def _warmup(self) -> None:
+        started = time.perf_counter()
+        for spec in list(self._pending):
+            try:
+                await self.ensure_loaded(spec.path)
+            except Exception:
+                # 실패한 라우터는 첫 요청에서 다시 시도 (오류는 그 요청에 전달)
+                logger.exception(f"라우터 예열 실패: {spec.module}")
+        logger.info(
+            f"라우터 예열 완료 ({time.perf_counter() - started:.2f}s)"
+        )
+
+
+class LazyRouterMiddleware:
+    """요청 경로의 라우터가 아직 등록되지 않았으면 먼저 등록"""
+
+    def __init__(self, app: ASGIApp, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            path = scope["path"]
+            await self.registry.ensure_loaded(
+                None if path in self.registry.docs_paths else path
+            )
+        await self.app(scope, receive, send)
+
+
+__all__ = [
+    "LazyRouterMiddleware",
+    "LazyRouterRegistry",
+    "RouterSpec",
+]
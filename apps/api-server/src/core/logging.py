@@ -0,0 +1,173 @@
+"""
+구조화 로깅 (structlog + 비동기 큐 핸들러)
+
+- 구조화 이벤트: get_logger(__name__).info("event", key=value) 형태로 기록하며,
+  메시지 조립과 JSON 직렬화는 로그 스레드에서 수행 (요청 스레드는 레코드를
+  큐에 넣기만 함)
+- 기존 logging.getLogger 로그도 같은 큐와 출력 형식(LOG_FORMAT)을 사용
+- 요청 ID: RequestIdMiddleware가 bind_contextvars로 묶은 값을 모든 로그에 포함
+- 샘플링: LOG_SAMPLING의 모듈(로거 이름 접두사)별 비율로 DEBUG/INFO 로그만
+  일부 기록 (WARNING 이상은 항상 기록)
+- 큐가 가득 차면 요청을 막지 않고 레코드를 버리며 log_records_dropped_total 증가
+
+%-스타일 인자와 이벤트 값은 로그 스레드에서 직렬화되므로, 로그를 남긴 뒤
+수정될 수 있는 가변 객체 대신 값(문자열, 숫자, 복사본)을 넘기세요.
+"""
+
+import logging
+import queue
+import random
+import sys
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+import structlog
+from prometheus_client import Counter
+
+from src.core.config import settings
+
+RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "로그 큐가 가득 차서 버린 로그 레코드 수",
+)
+
+_listener: QueueListener | None = None
+
+
+@lru_cache(maxsize=1024)
+def _sample_rate(logger_name: str) -> float:
+    """로거 이름에 가장 길게 일치하는 LOG_SAMPLING 접두사의 비율"""
+    rate = 1.0
+    matched = -1
+    for prefix, prefix_rate in settings.LOG_SAMPLING.items():
+        if (
+            logger_name == prefix or logger_name.startswith(prefix + ".")
+        ) and len(prefix) > matched:
+            rate = prefix_rate
+            matched = len(prefix)
+    return rate
+
+
+class _SamplingFilter(logging.Filter):
+    """모듈별 DEBUG/INFO 샘플링 + 호출 스레드의 컨텍스트 변수 보존"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno <= logging.INFO:
+            rate = _sample_rate(record.name)
+            if rate < 1.0 and random.random() >= rate:
+                return False
+        # 로그 스레드에서는 요청의 contextvars를 읽을 수 없으므로 미리 복사
+        record.context_vars = structlog.contextvars.get_contextvars()
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """레코드를 큐에 넣기만 하는 핸들러 (포매팅은 로그 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 호출 스레드에서 메시지를 포매팅하므로 그대로 전달
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            RECORDS_DROPPED.inc()
+
+
+def _add_record_context(logger, method_name, event_dict):
+    """표준 logging 레코드에 보존한 요청 컨텍스트(request_id 등) 추가"""
+    record = event_dict.get("_record")
+    context_vars = getattr(record, "context_vars", None)
+    if context_vars:
+        for key, value in context_vars.items():
+            event_dict.setdefault(key, value)
+    return event_dict
+
+
+def _add_record_timestamp(logger, method_name, event_dict):
+    """로그를 남긴 시각 (로그 스레드에서 포매팅하므로 레코드 생성 시각 사용)"""
+    record = event_dict.get("_record")
+    if record is not None:
+        event_dict["timestamp"] = (
+            datetime.fromtimestamp(record.created).astimezone().isoformat()
+        )
+    return event_dict
+
+
+def _capture_exc_info(logger, method_name, event_dict):
+    """exc_info=True를 호출 스레드에서 예외 정보로 치환"""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def configure_logging() -> None:
+    """structlog와 루트 로거를 큐 핸들러 + 로그 스레드 구성으로 설정"""
+    global _listener
+    if _listener is not None:
+        return
+
+    renderer = (
+        structlog.processors.JSONRenderer(ensure_ascii=False)
+        if settings.LOG_FORMAT == "json"
+        else structlog.dev.ConsoleRenderer(colors=False)
+    )
+
+    # 호출 스레드: 레벨 확인, 컨텍스트/스택/예외 정보 수집만 수행
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.StackInfoRenderer(),
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    # 로그 스레드: structlog 이벤트와 표준 logging 레코드를 같은 형식으로 출력
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            _add_record_context,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            _add_record_timestamp,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            renderer,
+        ],
+    )
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    handler = _NonBlockingQueueHandler(log_queue)
+    handler.addFilter(_SamplingFilter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 로그 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+    """구조화 로거 (키워드 인자는 JSON 필드로 기록)"""
+    return structlog.get_logger(name)
+
+
+__all__ = ["configure_logging", "get_logger", "stop_logging"]
@@ -0,0 +1,66 @@
+"""
+프로세스 내 LRU 캐시
+
+항목별 만료 시각(monotonic)과 최대 항목 수를 갖는 OrderedDict 기반 LRU로,
+Redis 앞단의 L1 캐시와 최근 무효화 기록에 사용합니다.
+
+스레드 안전하지 않으므로 호출 측이 자신의 잠금 안에서 사용합니다.
+(무효화 세대 확인 등과 함께 원자적으로 갱신해야 하기 때문)
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """만료 시각과 최대 항목 수가 있는 LRU"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # 키 -> (만료 시각(monotonic), 값)
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """유효한 값 반환 (없거나 만료되었으면 제거하고 default)"""
+        entry = self._items.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._items[key]
+            return default
+        self._items.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """ttl(초) 동안 유효한 값 저장 (최대 항목 수를 넘으면 오래된 것부터 제거)"""
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        entry = self._items.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """(키, 값) 목록 (만료 여부와 무관, 순회 중 변경 가능하도록 복사)"""
+        return iter([(key, entry[1]) for key, entry in self._items.items()])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+_MISSING = object()
+
+__all__ = ["LRUCache"]
@@ -0,0 +1,80 @@
+"""
+HTTP 요청 지표 및 Prometheus 노출
+
+- http_requests_total: 요청 수 (method, route, status)
+- http_requests_in_progress: 처리 중인 요청 수 (method)
+- http_request_duration_seconds: 응답 시간 (method, route, status,
+  tenant_tier)
+
+route는 원시 경로가 아닌 라우트 템플릿(/users/{user_id})을, status는 상태
+코드 계열(2xx, 4xx 등)을 사용하여 레이블 조합 수를 제한합니다.
+
+여러 uvicorn 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수를
+워커가 공유하는 빈 디렉터리로 지정하세요. 이 경우 /metrics는 모든 워커의
+지표를 합산하여 반환합니다.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from src.core.config import settings
+
+UNMATCHED_ROUTE = "<unmatched>"
+NO_TENANT = "none"
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route", "status", "tenant_tier"],
+    buckets=settings.METRICS_LATENCY_BUCKETS,
+)
+
+
+def _multiprocess_dir() -> str | None:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식 지표와 Content-Type 반환"""
+    if _multiprocess_dir():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """종료하는 워커의 livesum 게이지 파일 정리 (멀티프로세스 모드)"""
+    if _multiprocess_dir():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+__all__ = [
+    "NO_TENANT",
+    "REQUESTS",
+    "REQUESTS_IN_PROGRESS",
+    "REQUEST_DURATION",
+    "UNMATCHED_ROUTE",
+    "mark_worker_dead",
+    "render_metrics",
+]
@@ -0,0 +1,307 @@
+"""
+공통 ASGI 미들웨어
+"""
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+
+import structlog
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.client_ip import resolve_client_ip
+from src.core.config import settings
+from src.core.database import mgmt_async_session_local
+from src.core.metrics import (
+    NO_TENANT,
+    REQUEST_DURATION,
+    REQUESTS,
+    REQUESTS_IN_PROGRESS,
+    UNMATCHED_ROUTE,
+)
+from src.core.query_stats import (
+    BUDGET_EXCEEDED,
+    DB_TIME_PER_REQUEST,
+    STATEMENTS_PER_REQUEST,
+    track_queries,
+)
+from src.core.security import verify_access_token_cached
+from src.core.tenant_resolver import tenant_resolver
+from src.services.mgmt.api_key_auth import api_key_authenticator
+from src.services.mgmt.rate_limiter import RateLimiter, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def _client_ip(scope: Scope, headers: Headers) -> str | None:
+    """요청 IP 주소 (신뢰하는 프록시 뒤에서는 X-Forwarded-For 사용)"""
+    client = scope.get("client")
+    return resolve_client_ip(
+        client[0] if client else None, headers.get("x-forwarded-for")
+    )
+
+
+async def _api_key_subject(
+    raw_key: str, ip_address: str | None, subject: dict[str, str]
+) -> None:
+    """API 키 헤더로 api_key_id/user_id/tenant_id 설정
+
+    api_key_authenticator 캐시를 사용하므로 같은 키의 반복 요청은 DB를
+    조회하지 않습니다. (세션은 캐시 미스로 조회할 때만 연결을 사용)
+    """
+    async with mgmt_async_session_local() as db:
+        key = await api_key_authenticator.authenticate(db, raw_key, ip_address)
+    if key is None:
+        return
+    subject["api_key_id"] = str(key.id)
+    subject.setdefault("user_id", str(key.user_id))
+    if key.tenant_context:
+        subject.setdefault("tenant_id", str(key.tenant_context))
+
+
+async def _tenant_id(value: str) -> str | None:
+    """테넌트 헤더(ID 또는 코드)를 테넌트 ID로 변환 (조회 색인만 사용)"""
+    try:
+        info = await tenant_resolver.get_by_id(None, uuid.UUID(value))
+    except ValueError:
+        info = await tenant_resolver.get_by_code(None, value)
+    return str(info.id) if info is not None else None
+
+
+async def rate_limit_subject(scope: Scope) -> dict[str, str]:
+    """호출 제한 대상 식별 값 (tenant_id/user_id/api_key_id/client_ip)
+
+    라우팅 전에 실행되므로 인증 의존성이 request.state에 값을 설정하기
+    전입니다. API 키 헤더는 api_key_authenticator로, Bearer 액세스
+    토큰(JWT)은 security의 토큰 캐시로 검증하여 식별 값을 구하고,
+    테넌트는 API 키/토큰의 테넌트 컨텍스트, 없으면 TENANT_HEADER를
+    tenant_resolver 색인으로 확인합니다.
+    """
+    headers = Headers(scope=scope)
+    subject = {}
+
+    ip_address = _client_ip(scope, headers)
+    if ip_address:
+        subject["client_ip"] = ip_address
+
+    state = scope.get("state") or {}
+    for field in ("tenant_id", "api_key_id", "user_id"):
+        if state.get(field):
+            subject[field] = str(state[field])
+
+    raw_key = headers.get(settings.API_KEY_HEADER)
+    if raw_key and "api_key_id" not in subject:
+        await _api_key_subject(raw_key, ip_address, subject)
+
+    scheme, _, credentials = headers.get("authorization", "").partition(" ")
+    if (
+        "user_id" not in subject
+        and scheme.lower() == "bearer"
+        and credentials.count(".") == 2
+    ):
+        # 캐시 미스이면 서명 검증(CPU)이므로 이벤트 루프 밖에서 실행
+        claims = await run_in_threadpool(
+            verify_access_token_cached, credentials
+        )
+        if claims and claims.get("user_id"):
+            subject["user_id"] = str(claims["user_id"])
+            tenant_context = (claims.get("sess") or {}).get("tenant_context")
+            if tenant_context:
+                subject.setdefault("tenant_id", str(tenant_context))
+
+    tenant_value = headers.get(settings.TENANT_HEADER)
+    if tenant_value and "tenant_id" not in subject:
+        tenant_id = await _tenant_id(tenant_value)
+        if tenant_id:
+            subject["tenant_id"] = tenant_id
+    return subject
+
+
+class RateLimitMiddleware:
+    """intg.rate_limits 규칙에 따른 API 호출 제한 미들웨어
+
+    - BLOCK: 429 + Retry-After
+    - THROTTLE: 대기 시간이 RATE_LIMIT_THROTTLE_MAX_DELAY_SECONDS 이내면
+      기다린 뒤 한 번 더 판정, 그래도 초과면 429
+    - LOG_ONLY: 통과 (차단 수만 집계)
+
+    판정(Redis 스크립트 호출)은 동기 I/O이므로 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter = rate_limiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        subject = await rate_limit_subject(scope)
+        decision = await run_in_threadpool(self.limiter.check, subject)
+        if (
+            not decision.allowed
+            and decision.throttle
+            and decision.retry_after
+            <= settings.RATE_LIMIT_THROTTLE_MAX_DELAY_SECONDS
+        ):
+            await asyncio.sleep(decision.retry_after)
+            decision = await run_in_threadpool(self.limiter.check, subject)
+
+        if decision.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {"Retry-After": str(max(1, math.ceil(decision.retry_after)))}
+        if decision.rule is not None:
+            headers["X-RateLimit-Limit"] = str(decision.rule.limit)
+        response = JSONResponse(
+            status_code=429,
+            content={
+                "success": False,
+                "data": None,
+                "error": {
+                    "message": "요청 한도를 초과했습니다. "
+                    "잠시 후 다시 시도해주세요."
+                },
+            },
+            headers=headers,
+        )
+        await response(scope, receive, send)
+
+
+class MetricsMiddleware:
+    """HTTP 요청 수, 처리 중 요청 수, 응답 시간 지표 기록 미들웨어
+
+    route 레이블은 라우터가 scope에 설정한 라우트의 경로 템플릿을,
+    tenant_tier는 get_tenant_context가 request.state에 설정한 테넌트 유형을
+    사용합니다. 라우트가 결정되기 전에 응답한 요청(404, 호출 제한 등)은
+    UNMATCHED_ROUTE로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path_format", None)
+            route = route or UNMATCHED_ROUTE
+            status_class = f"{status_code // 100}xx"
+            state = scope.get("state") or {}
+            tenant_tier = state.get("tenant_tier") or NO_TENANT
+            REQUESTS.labels(method, route, status_class).inc()
+            REQUEST_DURATION.labels(
+                method, route, status_class, tenant_tier
+            ).observe(time.perf_counter() - started)
+
+
+class RequestIdMiddleware:
+    """요청 ID를 로그 컨텍스트에 묶고 응답 헤더로 반환
+
+    클라이언트가 REQUEST_ID_HEADER를 보내면 그 값을(128자 이내), 아니면 새
+    ID를 사용합니다. 요청 처리 중 남긴 모든 로그에 request_id가 포함됩니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(settings.REQUEST_ID_HEADER)
+        if not request_id or len(request_id) > 128:
+            request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[
+                    settings.REQUEST_ID_HEADER
+                ] = request_id
+            await send(message)
+
+        with structlog.contextvars.bound_contextvars(request_id=request_id):
+            await self.app(scope, receive, send_wrapper)
+
+
+class QueryBudgetMiddleware:
+    """요청별 SQL 문장 수/실행 시간 집계 및 쿼리 예산 초과 경고
+
+    DB_SERVER_TIMING이면 응답 시작 시점까지의 집계를 Server-Timing 헤더로
+    반환합니다. (스트리밍 응답 본문 중 실행한 문장은 헤더에 포함되지 않음)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.DB_QUERY_BUDGET_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message):
+                if (
+                    message["type"] == "http.response.start"
+                    and settings.DB_SERVER_TIMING
+                ):
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"db;dur={stats.duration * 1000:.1f};"
+                        f'desc="{stats.statements} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                STATEMENTS_PER_REQUEST.observe(stats.statements)
+                DB_TIME_PER_REQUEST.observe(stats.duration)
+                reasons = stats.over_budget()
+                for reason in reasons:
+                    BUDGET_EXCEEDED.labels(reason=reason).inc()
+                if reasons:
+                    route = getattr(scope.get("route"), "path_format", None)
+                    logger.warning(
+                        f"쿼리 예산 초과 {scope['method']} "
+                        f"{route or scope['path']}: "
+                        f"{stats.statements}개 문장, "
+                        f"{stats.duration * 1000:.1f}ms"
+                    )
+
+
+__all__ = [
+    "MetricsMiddleware",
+    "QueryBudgetMiddleware",
+    "RateLimitMiddleware",
+    "RequestIdMiddleware",
+    "rate_limit_subject",
+]
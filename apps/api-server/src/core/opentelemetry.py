@@ -0,0 +1,278 @@
+"""
+OpenTelemetry 분산 추적
+
+TRACING_ENABLED이고 opentelemetry-sdk가 설치된 경우에만 동작하며, 그 외에는
+모든 함수가 아무 일도 하지 않습니다. (pip install ".[tracing]")
+
+- 요청: TracingMiddleware가 요청마다 SERVER 스팬 생성 (traceparent 전파)
+- SQL: instrument_engine으로 등록한 엔진의 문장마다 CLIENT 스팬
+  (문장 지문, 행 수, 실행 시간)
+- bcrypt/Redis: start_span으로 감싼 호출마다 하위 스팬
+
+샘플링은 요청 단위(head-based)로 TRACING_SAMPLE_RATIO 비율만 기록하며,
+샘플링되지 않은 요청과 요청 밖(백그라운드 스레드)의 SQL/Redis 호출은
+스팬을 만들지 않으므로 추가 비용이 거의 없습니다.
+
+내보내기(TRACING_EXPORTER):
+- otlp: TRACING_OTLP_ENDPOINT의 OTLP(gRPC) 수집기
+- file: TRACING_FILE_PATH에 스팬을 한 줄에 하나씩 JSON으로 기록
+"""
+
+import hashlib
+import logging
+import os
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - 선택 의존성
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+_TRACER_NAME = "cxg.api-server"
+_MAX_STATEMENT_LENGTH = 2000
+
+# 문장 지문 계산용: 리터럴/바인드 자리표시자를 ?로, IN 목록을 (?)로 치환
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_provider = None
+
+
+def tracing_enabled() -> bool:
+    """추적 사용 여부 (설정과 opentelemetry 설치 여부)"""
+    return settings.TRACING_ENABLED and trace is not None
+
+
+def _tracer():
+    return trace.get_tracer(_TRACER_NAME)
+
+
+@contextmanager
+def start_span(name: str, attributes: dict | None = None):
+    """현재 요청 스팬의 하위 스팬 (추적 중이 아니면 아무 일도 하지 않음)"""
+    if not tracing_enabled() or not trace.get_current_span().is_recording():
+        yield None
+        return
+    with _tracer().start_as_current_span(
+        name, kind=SpanKind.CLIENT, attributes=attributes
+    ) as span:
+        yield span
+
+
+# ----------------------------------------------------------------------
+# 설정
+# ----------------------------------------------------------------------
+def _create_exporter():
+    if settings.TRACING_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    if settings.TRACING_EXPORTER == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE_PATH, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    raise ValueError(
+        f"지원하지 않는 추적 내보내기 방식: {settings.TRACING_EXPORTER}"
+    )
+
+
+def setup_tracing(app) -> None:
+    """TracerProvider 설정 및 요청 추적 미들웨어 등록"""
+    global _provider
+    if not settings.TRACING_ENABLED:
+        return
+    if trace is None:
+        logger.warning(
+            "opentelemetry가 설치되지 않아 TRACING_ENABLED를 무시합니다"
+        )
+        return
+
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import (
+        ParentBased,
+        TraceIdRatioBased,
+    )
+
+    _provider = TracerProvider(
+        resource=Resource.create(
+            {SERVICE_NAME: settings.TRACING_SERVICE_NAME}
+        ),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    trace.set_tracer_provider(_provider)
+    app.add_middleware(TracingMiddleware)
+
+
+def shutdown_tracing() -> None:
+    """남은 스팬을 내보내고 종료 (애플리케이션 종료 시)"""
+    global _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+
+
+# ----------------------------------------------------------------------
+# 요청 스팬
+# ----------------------------------------------------------------------
+class TracingMiddleware:
+    """요청마다 SERVER 스팬을 만들고 라우트 템플릿/상태 코드를 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with _tracer().start_as_current_span(
+            f"{method} {scope['path']}",
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.method": method, "http.target": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if span.is_recording():
+                    route = getattr(scope.get("route"), "path_format", None)
+                    if route:
+                        span.update_name(f"{method} {route}")
+                        span.set_attribute("http.route", route)
+                    span.set_attribute("http.status_code", status_code)
+                    if status_code >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+
+
+# ----------------------------------------------------------------------
+# SQLAlchemy 스팬
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=2048)
+def statement_fingerprint(statement: str) -> tuple[str, str]:
+    """(정규화한 문장, 지문) - 값이 달라도 같은 형태의 문장은 같은 지문"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("(?)", normalized)
+    digest = hashlib.sha1(normalized.encode()).hexdigest()[:16]
+    return normalized[:_MAX_STATEMENT_LENGTH], digest
+
+
+def instrument_engine(name: str, engine) -> None:
+    """엔진의 SQL 문장마다 현재 요청 스팬의 하위 스팬 생성"""
+    if not tracing_enabled():
+        return
+
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is None or not trace.get_current_span().is_recording():
+            return
+        normalized, fingerprint = statement_fingerprint(statement)
+        operation = normalized.split(" ", 1)[0].upper()
+        context._otel_span = _tracer().start_span(
+            f"{operation} {name}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": system,
+                "db.name": name,
+                "db.operation": operation,
+                "db.statement": normalized,
+                "db.statement.fingerprint": fingerprint,
+                "db.executemany": executemany,
+            },
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_otel_span", None)
+        if span is None:
+            return
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount is not None and rowcount >= 0:
+            span.set_attribute("db.rows", rowcount)
+        span.end()
+        context._otel_span = None
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, "_otel_span", None)
+        if span is None:
+            return
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        context._otel_span = None
+
+
+# ----------------------------------------------------------------------
+# Redis 스팬
+# ----------------------------------------------------------------------
+def instrument_redis(client):
+    """Redis 클라이언트의 명령마다 하위 스팬 생성 (파이프라인 제외)"""
+    if not tracing_enabled():
+        return client
+
+    execute_command = client.execute_command
+
+    def traced_execute_command(*args, **options):
+        command = str(args[0]) if args else "?"
+        with start_span(
+            f"redis {command}",
+            {"db.system": "redis", "db.operation": command},
+        ):
+            return execute_command(*args, **options)
+
+    client.execute_command = traced_execute_command
+    return client
+
+
+__all__ = [
+    "TracingMiddleware",
+    "instrument_engine",
+    "instrument_redis",
+    "setup_tracing",
+    "shutdown_tracing",
+    "start_span",
+    "statement_fingerprint",
+    "tracing_enabled",
+]
@@ -0,0 +1,102 @@
+"""
+키셋(커서) 페이지네이션 헬퍼
+
+OFFSET은 건너뛴 행을 모두 읽어야 하므로 깊은 페이지일수록 느려집니다.
+(정렬 시각, id) 쌍을 불투명한 커서로 전달하고 다음 페이지를
+`WHERE (sorted_at, id) < (:ts, :id) ORDER BY sorted_at DESC, id DESC`로
+조회하면 페이지 깊이와 관계없이 인덱스 범위 스캔으로 처리됩니다.
+
+사용 예:
+    query = keyset_paginate(
+        select(LoginLog), LoginLog.created_at, LoginLog.id, cursor, size
+    )
+    rows = (await db.scalars(query)).all()
+    page = build_cursor_page(
+        rows, size, lambda r: (r.created_at, r.id), transform
+    )
+"""
+
+import base64
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+
+from src.schemas.common.pagination import CursorPage
+
+
+class InvalidCursorError(ValueError):
+    """잘못되었거나 변조된 커서"""
+
+
+def encode_cursor(sorted_at: datetime, row_id: uuid.UUID) -> str:
+    """(정렬 시각, id)를 URL에 안전한 불투명 커서로 인코딩"""
+    raw = f"{sorted_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """커서를 (정렬 시각, id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        sorted_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sorted_at), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def keyset_paginate(
+    query: Select,
+    sort_column,
+    id_column,
+    cursor: str | None,
+    size: int,
+) -> Select:
+    """쿼리에 키셋 조건, 내림차순 정렬, LIMIT(size + 1)을 적용
+
+    cursor가 비어 있으면 첫 페이지를 조회합니다. 다음 페이지 존재 여부를
+    판단하기 위해 size보다 한 건 더 조회합니다.
+    """
+    if cursor:
+        sorted_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(sort_column, id_column) < tuple_(sorted_at, row_id)
+        )
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(
+        size + 1
+    )
+
+
+def build_cursor_page(
+    rows: Sequence[Any],
+    size: int,
+    key: Callable[[Any], tuple[datetime, uuid.UUID]],
+    transform: Callable[[Any], Any] | None = None,
+) -> CursorPage:
+    """keyset_paginate 결과로 CursorPage 생성
+
+    Args:
+        rows: keyset_paginate 쿼리 결과 (최대 size + 1건)
+        size: 페이지 크기
+        key: 행에서 (정렬 시각, id)를 추출하는 함수
+        transform: 행을 응답 항목으로 변환하는 함수 (선택)
+    """
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = encode_cursor(*key(rows[-1])) if has_more else None
+    items = [transform(row) for row in rows] if transform else list(rows)
+    return CursorPage(
+        items=items, next_cursor=next_cursor, has_more=has_more, size=size
+    )
+
+
+__all__ = [
+    "InvalidCursorError",
+    "build_cursor_page",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_paginate",
+]
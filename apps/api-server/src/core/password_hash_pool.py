@@ -0,0 +1,170 @@
+"""
+비밀번호 해시 작업 풀
+
+bcrypt 해시/검증은 건당 수백 ms의 CPU를 사용하므로 이벤트 루프에서 직접
+호출하면 그동안 다른 요청이 모두 멈춥니다. 크기가 제한된 전용 스레드 풀
+(bcrypt는 연산 중 GIL을 해제)에서 실행하고 비동기 API로 제공합니다.
+동기 라우트 핸들러에서는 같은 풀을 run_sync로 사용합니다.
+
+- 대기 중 + 실행 중 작업이 PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE를
+  넘으면 즉시 PasswordHashPoolBusyError (라우터에서 503 + Retry-After)
+- 대기 시간과 해시 시간을 분리하여 Prometheus 지표로 기록
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.core.config import settings
+from src.core.opentelemetry import start_span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "비밀번호 해시 풀의 대기 중 + 실행 중 작업 수",
+)
+HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "비밀번호 해시 작업이 작업 스레드에 배정되기까지 대기한 시간",
+    ["operation"],
+    buckets=_BUCKETS,
+)
+HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "비밀번호 해시/검증 연산 시간",
+    ["operation"],
+    buckets=_BUCKETS,
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "대기열 한도 초과로 거절된 비밀번호 해시 작업 수",
+    ["operation"],
+)
+
+
+class PasswordHashPoolBusyError(RuntimeError):
+    """비밀번호 해시 풀의 대기열이 가득 참"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+        )
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    """크기와 대기열이 제한된 비밀번호 해시 전용 스레드 풀"""
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    async def run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 풀에서 실행하고 결과 반환
+
+        Raises:
+            PasswordHashPoolBusyError: 대기열 한도 초과
+        """
+        future = self._submit(operation, fn, *args)
+        with start_span(
+            f"password_hash {operation}",
+            {"password_hash.operation": operation},
+        ):
+            return await asyncio.wrap_future(future)
+
+    def run_sync(self, operation: str, fn: Callable[..., T], *args) -> T:
+        """run의 동기 버전 (동기 라우트 핸들러의 작업 스레드에서 호출)
+
+        Raises:
+            PasswordHashPoolBusyError: 대기열 한도 초과
+        """
+        future = self._submit(operation, fn, *args)
+        with start_span(
+            f"password_hash {operation}",
+            {"password_hash.operation": operation},
+        ):
+            return future.result()
+
+    def shutdown(self) -> None:
+        """대기 중인 작업을 취소하고 풀 종료 (애플리케이션 종료 시)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(
+        self, operation: str, fn: Callable[..., T], *args
+    ) -> Future:
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                HASH_REJECTED.labels(operation=operation).inc()
+                raise PasswordHashPoolBusyError(self.retry_after)
+            self._pending += 1
+            HASH_PENDING.set(self._pending)
+
+        submitted = time.perf_counter()
+
+        def task() -> T:
+            started = time.perf_counter()
+            HASH_QUEUE_WAIT.labels(operation=operation).observe(
+                started - submitted
+            )
+            try:
+                return fn(*args)
+            finally:
+                HASH_DURATION.labels(operation=operation).observe(
+                    time.perf_counter() - started
+                )
+
+        try:
+            future = self._get_executor().submit(task)
+        except RuntimeError:
+            self._release(None)
+            raise
+        # 요청 취소로 시작 전에 취소된 작업도 완료 콜백에서 슬롯을 반환
+        future.add_done_callback(self._release)
+        return future
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="password-hash",
+                    )
+        return self._executor
+
+    def _release(self, _future: Future | None) -> None:
+        with self._lock:
+            self._pending -= 1
+            HASH_PENDING.set(self._pending)
+
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+__all__ = [
+    "PasswordHashPool",
+    "PasswordHashPoolBusyError",
+    "password_hash_pool",
+]
@@ -0,0 +1,146 @@
+"""
+요청 단위 SQL 실행 통계 (쿼리 예산 + 느린 쿼리 감지)
+
+instrument_query_stats로 등록한 엔진의 SQL 문장마다 실행 시간을 재어
+현재 요청의 QueryStats에 누적합니다. 항목마다 쿼리를 하나씩 실행하는
+N+1 패턴을 찾기 위한 용도입니다.
+
+- 느린 쿼리: DB_SLOW_QUERY_SECONDS를 넘는 문장은 요청 여부와 관계없이
+  정규화한 문장과 함께 경고 로그
+- 쿼리 예산: QueryBudgetMiddleware가 요청의 문장 수/DB 시간이
+  DB_QUERY_BUDGET_STATEMENTS/DB_QUERY_BUDGET_SECONDS를 넘으면 경고 로그와
+  지표를 남기고, DB_SERVER_TIMING이면 Server-Timing 헤더를 추가
+
+테스트에서는 track_queries()로 엔드포인트의 쿼리 수를 검증할 수 있습니다.
+(앱이 같은 태스크에서 실행되도록 TestClient 대신 ASGITransport 사용)
+
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    async with client:
+        with track_queries() as stats:
+            await client.get("/api/v1/mgmt/idam/sessions")
+    assert stats.statements <= 3
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
+
+from src.core.config import settings
+from src.core.opentelemetry import statement_fingerprint
+
+logger = logging.getLogger(__name__)
+
+STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "요청 하나에서 실행한 SQL 문장 수",
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "요청 하나에서 SQL 실행에 사용한 시간 합계",
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "DB_SLOW_QUERY_SECONDS를 넘은 SQL 문장 수",
+    ["pool"],
+)
+BUDGET_EXCEEDED = Counter(
+    "db_query_budget_exceeded_total",
+    "쿼리 예산을 넘은 요청 수",
+    ["reason"],
+)
+
+
+class QueryStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    __slots__ = ("statements", "duration", "slow")
+
+    def __init__(self):
+        self.statements = 0
+        self.duration = 0.0
+        # (풀 이름, 실행 시간, 정규화한 문장)
+        self.slow: list[tuple[str, float, str]] = []
+
+    def over_budget(self) -> list[str]:
+        """초과한 예산 항목 (statements/duration)"""
+        reasons = []
+        if self.statements > settings.DB_QUERY_BUDGET_STATEMENTS:
+            reasons.append("statements")
+        if self.duration > settings.DB_QUERY_BUDGET_SECONDS:
+            reasons.append("duration")
+        return reasons
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def current_query_stats() -> QueryStats | None:
+    """현재 요청(또는 track_queries 블록)의 통계"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries():
+    """블록 안에서 실행한 SQL 문장을 새 QueryStats에 집계
+
+    중첩된 경우 블록이 끝날 때 바깥 통계에도 합산합니다.
+    """
+    parent = _current_stats.get()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if parent is not None:
+            parent.statements += stats.statements
+            parent.duration += stats.duration
+            parent.slow.extend(stats.slow)
+
+
+def instrument_query_stats(name: str, engine) -> None:
+    """엔진의 SQL 문장 실행 시간을 현재 요청 통계에 누적"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.duration += elapsed
+
+        if elapsed >= settings.DB_SLOW_QUERY_SECONDS:
+            normalized, fingerprint = statement_fingerprint(statement)
+            SLOW_QUERIES.labels(pool=name).inc()
+            logger.warning(
+                f"느린 쿼리 ({name}, {elapsed * 1000:.1f}ms, "
+                f"{fingerprint}): {normalized}"
+            )
+            if stats is not None:
+                stats.slow.append((name, elapsed, normalized))
+
+
+__all__ = [
+    "QueryStats",
+    "current_query_stats",
+    "instrument_query_stats",
+    "track_queries",
+]
@@ -0,0 +1,200 @@
+"""
+Redis 클라이언트 모듈
+
+애플리케이션 전역에서 공유하는 Redis 연결을 제공합니다.
+Redis는 캐시/브로드캐스트 용도로만 사용되므로, 연결 실패 시 호출 측은
+예외를 삼키고 데이터베이스 경로로 대체해야 합니다.
+
+- RedisGuard: 호출 실패 시 REDIS_RETRY_SECONDS 동안 호출을 건너뛰는 래퍼
+- InvalidationListener: pub/sub 무효화 채널을 구독하는 백그라운드 스레드
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import redis
+
+from src.core.config import settings
+from src.core.opentelemetry import instrument_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis 호출/구독 실패 후 다시 시도하기까지 대기할 시간
+REDIS_RETRY_SECONDS = 5.0
+
+_client: redis.Redis | None = None
+_binary_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    """공유 Redis 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    if _client is None:
+        _client = instrument_redis(
+            redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                decode_responses=True,
+            )
+        )
+    return _client
+
+
+def get_binary_redis() -> redis.Redis:
+    """응답을 bytes로 반환하는 Redis 클라이언트 (직렬화된 캐시 값 용)"""
+    global _binary_client
+    if _binary_client is None:
+        _binary_client = instrument_redis(
+            redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            )
+        )
+    return _binary_client
+
+
+def close_redis() -> None:
+    """Redis 연결 풀 정리 (애플리케이션 종료 시)"""
+    global _client, _binary_client
+    for client in (_client, _binary_client):
+        if client is None:
+            continue
+        try:
+            client.close()
+        except redis.RedisError as e:
+            logger.warning(f"Redis 연결 종료 중 오류: {e}")
+    _client = None
+    _binary_client = None
+
+
+class RedisGuard:
+    """Redis 호출 래퍼 (장애 시 일정 시간 동안 호출을 건너뛰고 None 반환)
+
+    label은 실패 로그에 쓰는 호출 측 이름입니다.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        client: Callable[[], redis.Redis] = get_redis,
+    ):
+        self.label = label
+        self.client = client
+        self._down_until = 0.0
+
+    def call(
+        self,
+        fn: Callable[[redis.Redis], Any],
+        client: Callable[[], redis.Redis] | None = None,
+    ) -> Any:
+        """fn(클라이언트) 결과 반환 (장애 중이거나 실패하면 None)"""
+        if time.monotonic() < self._down_until:
+            return None
+        try:
+            return fn((client or self.client)())
+        except redis.RedisError as e:
+            logger.warning(f"{self.label} Redis 호출 실패: {e}")
+            self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+
+
+class InvalidationListener:
+    """pub/sub 채널 구독 스레드 (첫 start() 호출 시 시작)
+
+    - on_subscribe(client): 구독(재연결) 직후. 재연결 사이에 놓친 메시지가
+      있을 수 있으므로 보통 프로세스 내 캐시를 비움
+    - on_tick(client): 메시지 대기(최대 1초) 전마다
+    - on_message(payload): JSON으로 디코딩한 메시지마다
+    - on_error(): 연결/처리 오류 후 재연결을 기다리기 전
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        name: str,
+        label: str,
+        on_message: Callable[[Any], None],
+        on_subscribe: Callable[[redis.Redis], None] | None = None,
+        on_tick: Callable[[redis.Redis], None] | None = None,
+        on_error: Callable[[], None] | None = None,
+    ):
+        self.channel = channel
+        self.name = name
+        self.label = label
+        self.on_message = on_message
+        self.on_subscribe = on_subscribe
+        self.on_tick = on_tick
+        self.on_error = on_error
+
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """구독 스레드 시작 (이미 실행 중이거나 종료했으면 무시)"""
+        if self._thread is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """구독 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            pubsub = None
+            try:
+                client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    health_check_interval=30,
+                )
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                if self.on_subscribe is not None:
+                    self.on_subscribe(client)
+                self._consume(client, pubsub)
+            except (redis.RedisError, ValueError, KeyError) as e:
+                logger.warning(f"{self.label} 오류: {e}")
+                if self.on_error is not None:
+                    self.on_error()
+                self._stop_event.wait(REDIS_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except redis.RedisError:
+                        pass
+
+    def _consume(self, client: redis.Redis, pubsub) -> None:
+        while not self._stop_event.is_set():
+            if self.on_tick is not None:
+                self.on_tick(client)
+            message = pubsub.get_message(timeout=1.0)
+            if message and message["type"] == "message":
+                self.on_message(json.loads(message["data"]))
+
+
+__all__ = [
+    "REDIS_RETRY_SECONDS",
+    "InvalidationListener",
+    "RedisGuard",
+    "close_redis",
+    "get_binary_redis",
+    "get_redis",
+]
@@ -1,11 +1,75 @@
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 
 from src.core.config import settings
+from src.core.password_hash_pool import password_hash_pool
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+
+def build_password_context(
+    scheme: str | None = None,
+    bcrypt_rounds: int | None = None,
+    argon2_time_cost: int | None = None,
+    argon2_memory_cost: int | None = None,
+    argon2_parallelism: int | None = None,
+) -> CryptContext:
+    """비밀번호 해시 정책(CryptContext) 생성
+
+    인자를 생략하면 PASSWORD_HASH_* 설정을 사용합니다. 기본 스킴이 아니거나
+    비용 파라미터가 현재 정책과 다른 해시는 needs_update가 참이 되어
+    로그인 시 새 정책으로 다시 해시됩니다. argon2id는 argon2-cffi가 설치된
+    경우에만 사용할 수 있으며, 없으면 bcrypt로 대체합니다.
+    """
+    scheme = scheme or settings.PASSWORD_HASH_SCHEME
+    bcrypt_rounds = bcrypt_rounds or settings.PASSWORD_BCRYPT_ROUNDS
+    time_cost = argon2_time_cost or settings.PASSWORD_ARGON2_TIME_COST
+    memory_cost = argon2_memory_cost or settings.PASSWORD_ARGON2_MEMORY_COST
+    parallelism = argon2_parallelism or settings.PASSWORD_ARGON2_PARALLELISM
+
+    if scheme not in ("bcrypt", "argon2"):
+        raise ValueError(f"지원하지 않는 비밀번호 해시 스킴: {scheme}")
+
+    options = {
+        # 정확히 설정한 비용의 해시만 최신으로 간주 (상향/하향 모두 재해시)
+        "bcrypt__rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "bcrypt__max_rounds": bcrypt_rounds,
+    }
+    schemes = ["bcrypt"]
+    if argon2.has_backend():
+        schemes.insert(0, "argon2")
+        options.update(
+            {
+                "argon2__type": "ID",
+                "argon2__rounds": time_cost,
+                "argon2__min_rounds": time_cost,
+                "argon2__max_rounds": time_cost,
+                "argon2__memory_cost": memory_cost,
+                "argon2__parallelism": parallelism,
+            }
+        )
+    elif scheme == "argon2":
+        logger.error(
+            "argon2-cffi가 설치되지 않아 비밀번호 해시에 bcrypt를 사용합니다."
+        )
+        scheme = "bcrypt"
+
+    return CryptContext(
+        schemes=schemes, default=scheme, deprecated="auto", **options
+    )
+
+
+pwd_context = build_password_context()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -31,6 +95,54 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """verify_password를 비밀번호 해시 풀에서 실행 (이벤트 루프 차단 방지)"""
+    return await password_hash_pool.run(
+        "verify", pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """비밀번호 검증 및 정책 변경 시 재해시 (비밀번호 해시 풀에서 실행)
+
+    Returns:
+        tuple[bool, str | None]: (검증 결과, 현재 정책으로 다시 만든 해시).
+            해시가 이미 현재 정책을 따르거나 검증에 실패하면 두 번째 값은 None
+    """
+    return await password_hash_pool.run(
+        "verify",
+        pwd_context.verify_and_update,
+        plain_password,
+        hashed_password,
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash를 비밀번호 해시 풀에서 실행 (이벤트 루프 차단 방지)"""
+    return await password_hash_pool.run("hash", pwd_context.hash, password)
+
+
+def verify_and_update_password_pooled(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """verify_and_update_password_async의 동기 버전 (동기 핸들러용)"""
+    return password_hash_pool.run_sync(
+        "verify",
+        pwd_context.verify_and_update,
+        plain_password,
+        hashed_password,
+    )
+
+
+def get_password_hash_pooled(password: str) -> str:
+    """get_password_hash_async의 동기 버전 (동기 핸들러용)"""
+    return password_hash_pool.run_sync("hash", pwd_context.hash, password)
+
+
 def verify_token(token: str) -> dict | None:
     try:
         payload = jwt.decode(
@@ -39,3 +151,62 @@ def verify_token(token: str) -> dict | None:
         return payload
     except JWTError:
         return None
+
+
+# 검증된 액세스 토큰 → (만료 시각(epoch), 클레임)
+_verified_tokens: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def verify_access_token_cached(token: str) -> dict | None:
+    """액세스 토큰 검증 (검증 결과를 만료 시각까지 프로세스 내 캐시)
+
+    같은 토큰이 만료 전까지 반복해서 제출되므로 서명 검증과 클레임 파싱은
+    토큰당 한 번만 수행합니다. 캐시 적중 시에도 만료 시각은 매번 확인합니다.
+    """
+    now = time.time()
+    with _verified_tokens_lock:
+        entry = _verified_tokens.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                _verified_tokens.move_to_end(token)
+                return entry[1]
+            del _verified_tokens[token]
+
+    payload = verify_token(token)
+    if payload is None or "exp" not in payload:
+        return None
+
+    with _verified_tokens_lock:
+        _verified_tokens[token] = (float(payload["exp"]), payload)
+        while len(_verified_tokens) > settings.JWT_VERIFY_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+    return payload
+
+
+_API_KEY_HASH_SCHEME = "hmac-sha256"
+
+
+def _api_key_hmac(secret: str) -> str:
+    key = settings.API_KEY_HMAC_SECRET or settings.SECRET_KEY
+    return hmac.new(
+        key.encode(), secret.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def hash_api_key_secret(secret: str) -> str:
+    """API 키 비밀 부분의 저장용 해시 (HMAC-SHA256)
+
+    API 키는 충분히 긴 무작위 값이므로 bcrypt 같은 느린 해시 대신 서버
+    비밀 키로 만든 HMAC을 저장합니다. (DB가 유출되어도 서버 비밀 키 없이는
+    검증 불가)
+    """
+    return f"{_API_KEY_HASH_SCHEME}${_api_key_hmac(secret)}"
+
+
+def verify_api_key_secret(secret: str, key_hash: str) -> bool:
+    """API 키 비밀 부분 검증 (상수 시간 비교)"""
+    scheme, _, digest = key_hash.partition("$")
+    if scheme != _API_KEY_HASH_SCHEME:
+        return False
+    return hmac.compare_digest(_api_key_hmac(secret), digest)
@@ -0,0 +1,347 @@
+"""
+테넌트 조회기 및 요청 범위 테넌트 컨텍스트
+
+요청마다 tnnt.tenants를 조회하지 않도록 삭제되지 않은 테넌트를
+id/tenant_code/business_no 기준 메모리 색인으로 보관합니다.
+
+- 시작 시 전체 적재(warm)하고 TENANT_RESOLVER_REFRESH_SECONDS마다 다시 적재
+- 색인에 없는 값은 DB에서 조회하여 색인에 추가 (없으면 짧은 음성 캐시)
+- 테넌트 생성/수정/정지/활성화/삭제 시 invalidate()로 해당 항목을 제거하고
+  pub/sub 채널로 다른 워커에도 전파
+
+반환하는 TenantInfo는 읽기 전용 스냅샷입니다. 수정이 필요한 경우에는
+TenantService로 세션에 연결된 모델을 조회하세요.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import get_mgmt_db_async, mgmt_engine
+from src.core.redis_client import (
+    REDIS_RETRY_SECONDS,
+    InvalidationListener,
+    RedisGuard,
+)
+
+logger = logging.getLogger(__name__)
+
+_INDEXED_COLUMNS = (
+    "id",
+    "tenant_code",
+    "tenant_name",
+    "tenant_type",
+    "business_no",
+    "status",
+    "timezone",
+    "locale",
+    "currency",
+)
+
+
+def _select_tenants(*criteria):
+    """색인 컬럼 조회문 (삭제된 테넌트 제외)"""
+    # 테넌트 서비스가 이 모듈을 사용하므로 순환 import를 피해 지연 import
+    from src.modules.mgmt.tnnt.tenant.model import Tenant
+
+    return select(
+        *(getattr(Tenant, column) for column in _INDEXED_COLUMNS)
+    ).filter(~Tenant.deleted, *criteria)
+
+
+class TenantInfo:
+    """메모리에 적재한 테넌트 스냅샷"""
+
+    __slots__ = _INDEXED_COLUMNS
+
+    def __init__(self, **values):
+        for column in _INDEXED_COLUMNS:
+            setattr(self, column, values.get(column))
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == "ACTIVE"
+
+    def __repr__(self):
+        return f"<TenantInfo {self.tenant_code} status={self.status}>"
+
+
+class TenantResolver:
+    """id/tenant_code/business_no → TenantInfo 메모리 색인"""
+
+    def __init__(
+        self,
+        refresh_seconds: int,
+        negative_ttl: int,
+        channel: str,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.negative_ttl = negative_ttl
+        self.channel = channel
+
+        self._by_id: dict[uuid.UUID, TenantInfo] = {}
+        self._by_code: dict[str, TenantInfo] = {}
+        self._by_business_no: dict[str, TenantInfo] = {}
+        # (필드, 값) -> 음성 캐시 만료 시각(monotonic)
+        self._missing: dict[tuple[str, str], float] = {}
+        # 무효화/재적재마다 증가 (진행 중이던 DB 조회 결과 저장 방지)
+        self._generation = 0
+        # 다음 재적재 시각(monotonic, 0이면 즉시)
+        self._refresh_at = 0.0
+        self._reconnecting = False
+        self._lock = threading.Lock()
+        self._redis = RedisGuard("테넌트 색인")
+        # 주기적 재적재도 같은 스레드에서 수행
+        self._worker = InvalidationListener(
+            channel,
+            name="tenant-resolver",
+            label="테넌트 색인 무효화 구독",
+            on_message=self._drop,
+            on_subscribe=self._on_subscribe,
+            on_tick=self._on_tick,
+            on_error=self._on_error,
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def get_by_id(
+        self, db: AsyncSession | None, tenant_id: uuid.UUID | str
+    ) -> TenantInfo | None:
+        """ID로 테넌트 조회 (db가 없으면 색인만 확인)"""
+        if not isinstance(tenant_id, uuid.UUID):
+            try:
+                tenant_id = uuid.UUID(str(tenant_id))
+            except ValueError:
+                return None
+        return await self._resolve(db, "id", tenant_id, "_by_id")
+
+    async def get_by_code(
+        self, db: AsyncSession | None, tenant_code: str
+    ) -> TenantInfo | None:
+        """테넌트 코드로 테넌트 조회 (db가 없으면 색인만 확인)"""
+        return await self._resolve(
+            db, "tenant_code", tenant_code, "_by_code"
+        )
+
+    async def get_by_business_no(
+        self, db: AsyncSession | None, business_no: str
+    ) -> TenantInfo | None:
+        """사업자등록번호로 테넌트 조회 (db가 없으면 색인만 확인)"""
+        return await self._resolve(
+            db, "business_no", business_no, "_by_business_no"
+        )
+
+    async def _resolve(self, db, field: str, value, index: str):
+        self._worker.start()
+        with self._lock:
+            info = getattr(self, index).get(value)
+            if info is not None:
+                return info
+            missing_key = (field, str(value))
+            missing_until = self._missing.get(missing_key)
+            if missing_until is not None:
+                if missing_until > time.monotonic():
+                    return None
+                del self._missing[missing_key]
+            generation = self._generation
+
+        if db is None:
+            return None
+
+        from src.modules.mgmt.tnnt.tenant.model import Tenant
+
+        row = (
+            await db.execute(_select_tenants(getattr(Tenant, field) == value))
+        ).first()
+
+        info = TenantInfo(**row._mapping) if row is not None else None
+        with self._lock:
+            if generation != self._generation:
+                # 조회 중 무효화/재적재가 있었으면 색인에 반영하지 않음
+                return info
+            if info is None:
+                self._missing[missing_key] = (
+                    time.monotonic() + self.negative_ttl
+                )
+            else:
+                self._add(info)
+        return info
+
+    # ------------------------------------------------------------------
+    # 적재/무효화
+    # ------------------------------------------------------------------
+    def load(self) -> int:
+        """삭제되지 않은 테넌트 전체를 다시 적재하고 테넌트 수 반환"""
+        with mgmt_engine.connect() as conn:
+            rows = conn.execute(_select_tenants()).all()
+
+        by_id, by_code, by_business_no = {}, {}, {}
+        for row in rows:
+            info = TenantInfo(**row._mapping)
+            by_id[info.id] = info
+            by_code[info.tenant_code] = info
+            if info.business_no:
+                by_business_no[info.business_no] = info
+
+        with self._lock:
+            self._by_id = by_id
+            self._by_code = by_code
+            self._by_business_no = by_business_no
+            self._missing.clear()
+            self._generation += 1
+            self._refresh_at = time.monotonic() + self.refresh_seconds
+        return len(by_id)
+
+    def warm(self) -> None:
+        """시작 시 색인 적재 (실패하면 조회 시 DB로 대체)"""
+        try:
+            count = self.load()
+            logger.info(f"테넌트 색인 적재: {count}개")
+        except SQLAlchemyError as e:
+            logger.warning(f"테넌트 색인 적재 실패: {e}")
+        self._worker.start()
+
+    def invalidate(self, *tenant_ids: uuid.UUID | str) -> None:
+        """테넌트 색인 항목 제거 및 다른 워커로 전파 (테넌트 변경 시)"""
+        tenant_ids = tuple(
+            str(tenant_id) for tenant_id in tenant_ids if tenant_id
+        )
+        if not tenant_ids:
+            return
+
+        self._drop(tenant_ids)
+        self._redis.call(
+            lambda r: r.publish(self.channel, json.dumps(tenant_ids))
+        )
+
+    def stop(self) -> None:
+        """갱신/무효화 구독 스레드 종료"""
+        self._worker.stop()
+
+    def _add(self, info: TenantInfo) -> None:
+        self._by_id[info.id] = info
+        self._by_code[info.tenant_code] = info
+        if info.business_no:
+            self._by_business_no[info.business_no] = info
+
+    def _drop(self, tenant_ids) -> None:
+        with self._lock:
+            for tenant_id in tenant_ids:
+                try:
+                    info = self._by_id.pop(uuid.UUID(str(tenant_id)), None)
+                except ValueError:
+                    continue
+                if info is None:
+                    continue
+                if self._by_code.get(info.tenant_code) is info:
+                    del self._by_code[info.tenant_code]
+                if (
+                    info.business_no
+                    and self._by_business_no.get(info.business_no) is info
+                ):
+                    del self._by_business_no[info.business_no]
+            # 변경된 코드/사업자등록번호가 음성 캐시에 남지 않도록 비움
+            self._missing.clear()
+            self._generation += 1
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드 (주기적 재적재 + 무효화 구독)
+    # ------------------------------------------------------------------
+    def _on_subscribe(self, _client) -> None:
+        if self._reconnecting:
+            # 재연결 사이에 놓친 무효화가 있을 수 있으므로 다시 적재
+            self._refresh_at = 0.0
+            self._reconnecting = False
+
+    def _on_tick(self, _client=None) -> None:
+        if time.monotonic() >= self._refresh_at:
+            self._refresh()
+
+    def _on_error(self) -> None:
+        self._reconnecting = True
+        # Redis 장애 중에도 주기적 재적재는 계속
+        self._on_tick()
+
+    def _refresh(self) -> None:
+        """색인 재적재 (실패하면 기존 색인을 유지하고 잠시 후 재시도)"""
+        try:
+            count = self.load()
+            logger.debug(f"테넌트 색인 재적재: {count}개")
+        except SQLAlchemyError as e:
+            logger.warning(f"테넌트 색인 재적재 실패: {e}")
+            self._refresh_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+
+tenant_resolver = TenantResolver(
+    refresh_seconds=settings.TENANT_RESOLVER_REFRESH_SECONDS,
+    negative_ttl=settings.TENANT_RESOLVER_NEGATIVE_TTL_SECONDS,
+    channel=settings.TENANT_RESOLVER_CHANNEL,
+)
+
+
+# ----------------------------------------------------------------------
+# 요청 범위 테넌트 컨텍스트
+# ----------------------------------------------------------------------
+_current_tenant: ContextVar[TenantInfo | None] = ContextVar(
+    "current_tenant", default=None
+)
+
+
+def get_current_tenant() -> TenantInfo | None:
+    """현재 요청의 테넌트 (get_tenant_context 의존성으로 설정)"""
+    return _current_tenant.get()
+
+
+async def get_tenant_context(
+    request: Request,
+    db: AsyncSession = Depends(get_mgmt_db_async),
+):
+    """TENANT_HEADER(테넌트 ID 또는 코드)로 테넌트를 확인하고 컨텍스트에 설정
+
+    request.state에 tenant_id와 tenant_tier(테넌트 유형)도 설정합니다.
+
+    헤더가 없으면 컨텍스트를 비워 두고, 알 수 없거나 활성 상태가 아닌
+    테넌트면 거절합니다.
+    """
+    value = request.headers.get(settings.TENANT_HEADER)
+    info = None
+    if value:
+        try:
+            info = await tenant_resolver.get_by_id(db, uuid.UUID(value))
+        except ValueError:
+            info = await tenant_resolver.get_by_code(db, value)
+        if info is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="존재하지 않는 테넌트입니다",
+            )
+        if not info.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="비활성화된 테넌트입니다",
+            )
+        request.state.tenant_id = info.id
+        request.state.tenant_tier = info.tenant_type
+
+    # 요청마다 별도 태스크 컨텍스트에서 실행되므로 되돌릴 필요 없음
+    _current_tenant.set(info)
+    return info
+
+
+__all__ = [
+    "TenantInfo",
+    "TenantResolver",
+    "get_current_tenant",
+    "get_tenant_context",
+    "tenant_resolver",
+]
@@ -0,0 +1,9 @@
+"""
+GraphQL 엔드포인트 (GRAPHQL_ENABLED인 경우에만 지연 등록)
+"""
+
+from strawberry.fastapi import GraphQLRouter
+
+from src.graphql.schema import schema
+
+router = GraphQLRouter(schema)
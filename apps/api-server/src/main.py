@@ -1,73 +1,36 @@
-import logging
+import sys
 
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 
-from src.models.mgmt.tnnt import (  # noqa: F401
-    Onboarding,
-    Subscription,
-    TenantRole,
-    TenantUser,
+from src.core.config import settings
+from src.core.database import dispose_async_engines
+from src.core.lazy_router import (
+    LazyRouterMiddleware,
+    LazyRouterRegistry,
+    RouterSpec,
 )
-from src.modules.mgmt.idam.api_key.model import ApiKey  # noqa: F401
-from src.modules.mgmt.idam.login_log.model import LoginLog  # noqa: F401
-from src.modules.mgmt.idam.permission.model import Permission  # noqa: F401
-from src.modules.mgmt.idam.role.model import Role  # noqa: F401
-from src.modules.mgmt.idam.session.model import Session  # noqa: F401
-
-# Import other related models referenced in Tenant relationships
-# Temporarily commented out to resolve relationship issues
-# from src.models.mgmt.supt.ticket import Ticket  # noqa: F401
-# from src.models.mgmt.supt.ticket_comment import TicketComment  # noqa: F401
-# from src.models.mgmt.supt.feedback import Feedback  # noqa: F401
-# from src.models.mgmt.stat.tenant_stat import TenantStat  # noqa: F401
-# from src.models.mgmt.stat.usage_stat import UsageStat  # noqa: F401
-# from src.models.mgmt.mntr.system_metric import SystemMetric  # noqa: F401
-# from src.models.mgmt.noti.notification import Notification  # noqa: F401
-# from src.models.mgmt.intg.rate_limit import RateLimit  # noqa: F401
-# from src.models.mgmt.intg.api import Api  # noqa: F401
-# from src.models.mgmt.intg.webhook import Webhook  # noqa: F401
-# from src.models.mgmt.cnfg.tenant_feature import TenantFeature  # noqa: F401
-# from src.models.mgmt.cnfg.feature_flag import FeatureFlag  # noqa: F401
-# from src.models.mgmt.cnfg.service_quota import ServiceQuota  # noqa: F401
-# from src.models.mgmt.audt.audit_log import AuditLog  # noqa: F401
-# from src.models.mgmt.audt.compliance import Compliance  # noqa: F401
-# from src.models.mgmt.bkup.execution import Execution  # noqa: F401
-# from src.models.mgmt.bkup.schedule import Schedule  # noqa: F401
-# from src.models.mgmt.ifra.resource import Resource  # noqa: F401
-# from src.models.mgmt.ifra.resource_usage import ResourceUsage  # noqa: F401
-# from src.models.mgmt.bill.invoice import Invoice  # noqa: F401
-# from src.models.mgmt.bill.transaction import Transaction  # noqa: F401
-# from src.models.mgmt.bill.plan import Plan  # noqa: F401
-# Import IDAM models - already imported above
-# from src.models.mgmt.idam.user import User  # noqa: F401
-# from src.models.mgmt.idam.login_log import LoginLog  # noqa: F401
-from src.modules.mgmt.idam.user.model import User  # noqa: F401
-from src.modules.mgmt.idam.user_role.model import UserRole  # noqa: F401
-
-# 모든 SQLAlchemy 모델을 import하여 관계가 제대로 인식되도록 함
-from src.modules.mgmt.tnnt.tenant.model import Tenant  # noqa: F401
-
-from .api.mgmt.v1 import router as mgmt_v1_router
-from .api.tnnt.v1 import router as tnnt_v1_router
-
-# from src.api.v1.mgmt.idam.router import router as mgmt_idam_router
-
-
-# from src.api.v1.tnnt.auth.router import router as tnnt_auth_router
-
-# 필요시 다른 관리자/사용자 모듈 라우터도 import
-# from src.api.v1.mgmt.org.router import router as mgmt_org_router
-# from src.api.v1.mgmt.tnnt.router import router as mgmt_tnnt_router
-
-logging.basicConfig(level=logging.INFO)
-app = FastAPI(
-    redirect_slashes=False,  # trailing slash 리다이렉션 비활성화
-    title="CXG 플랫폼 API",
-    description=(
-        """
+from src.core.logging import configure_logging, stop_logging
+from src.core.metrics import mark_worker_dead, render_metrics
+from src.core.middleware import (
+    MetricsMiddleware,
+    QueryBudgetMiddleware,
+    RateLimitMiddleware,
+    RequestIdMiddleware,
+)
+from src.core.opentelemetry import setup_tracing, shutdown_tracing
+from src.core.password_hash_pool import password_hash_pool
+from src.core.redis_client import close_redis
+from src.core.tenant_resolver import tenant_resolver
+from src.models.registry import register_models
+
+from .api.mgmt.v1 import ROUTERS as MGMT_V1_ROUTERS
+from .api.tnnt.v1 import ROUTERS as TNNT_V1_ROUTERS
+
+DESCRIPTION = """
         ## 50인 미만 소기업을 위한 AI 기반 업무지원 플랫폼
 
         ### 주요 기능
@@ -83,93 +46,202 @@ app = FastAPI(
         1. `/api/v1/auth/login` 또는 `/api/v1/auth/register`로 인증
         2. 반환된 `access_token`을 `Authorization: Bearer <token>` 헤더에 포함
         """
+
+# 종료 시 정리할 백그라운드 작업 (모듈, 객체, 메서드)
+# 라우터를 지연 등록하므로 실제로 import된 서비스만 정리
+BACKGROUND_SERVICES = (
+    ("src.services.mgmt.session_activity", "session_activity", "stop"),
+    ("src.services.mgmt.login_audit", "login_audit", "stop"),
+    ("src.services.mgmt.rate_limiter", "rate_limiter", "stop"),
+    ("src.services.mgmt.session_cache", "session_cache", "stop_listener"),
+    (
+        "src.services.mgmt.session_revocation",
+        "session_revocation",
+        "stop_listener",
     ),
-    version="0.1.0",
-    contact={
-        "name": "CXG (Connect & Grow)",
-        "email": "admin@cxg.co.kr",
-    },
-    license_info={
-        "name": "MIT License",
-        "url": "https://opensource.org/licenses/MIT",
-    },
-    servers=[
-        {
-            "url": "http://localhost:8100",
-            "description": "개발 서버",
-        },
-        {
-            "url": "https://api.cxg.co.kr",
-            "description": "운영 서버",
-        },
-    ],
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    (
+        "src.services.mgmt.permission_resolver",
+        "permission_resolver",
+        "stop_listener",
+    ),
+    (
+        "src.services.mgmt.api_key_auth",
+        "api_key_authenticator",
+        "stop_listener",
+    ),
+    ("src.services.shared.cache_service", "cache_service", "stop_listener"),
 )
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3100",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3100",
-        "*",  # 개발 환경에서 모든 origin 허용
-    ],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=[
-        "Accept",
-        "Accept-Language",
-        "Content-Language",
-        "Content-Type",
-        "Authorization",
-        "X-Requested-With",
-        "Origin",
-        "Access-Control-Request-Method",
-        "Access-Control-Request-Headers",
-    ],
-    expose_headers=["*"],
-)
 
+def _stop_background_services() -> None:
+    for module_name, attribute, method in BACKGROUND_SERVICES:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(getattr(module, attribute), method)()
+
+
+def _add_middlewares(app: FastAPI, routers: LazyRouterRegistry) -> None:
+    """미들웨어 등록 (나중에 등록한 미들웨어가 바깥에서 실행)"""
+    if settings.LAZY_ROUTERS:
+        # 아직 등록하지 않은 라우터의 요청이면 먼저 등록 (가장 안쪽)
+        app.add_middleware(LazyRouterMiddleware, registry=routers)
+
+    # 요청 단위 SQL 문장 수/DB 시간 집계 및 쿼리 예산 경고
+    app.add_middleware(QueryBudgetMiddleware)
+
+    # API 호출 제한 (CORS 미들웨어 안쪽에서 실행되어 429 응답에도 CORS 헤더 포함)
+    app.add_middleware(RateLimitMiddleware)
+
+    # CORS 설정
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "http://localhost:3000",
+            "http://localhost:3100",
+            "http://127.0.0.1:3000",
+            "http://127.0.0.1:3100",
+            "*",  # 개발 환경에서 모든 origin 허용
+        ],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+        allow_headers=[
+            "Accept",
+            "Accept-Language",
+            "Content-Language",
+            "Content-Type",
+            "Authorization",
+            "X-Requested-With",
+            "Origin",
+            "Access-Control-Request-Method",
+            "Access-Control-Request-Headers",
+        ],
+        expose_headers=["*"],
+    )
 
-# OPTIONS 요청 처리 미들웨어
-@app.middleware("http")
-async def cors_handler(request: Request, call_next):
-    if request.method == "OPTIONS":
-        response = Response()
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = (
-            "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-        )
-        response.headers["Access-Control-Allow-Headers"] = (
-            "Accept, Accept-Language, Content-Language, Content-Type, Authorization, X-Requested-With, Origin, Access-Control-Request-Method, Access-Control-Request-Headers"
-        )
-        response.headers["Access-Control-Allow-Credentials"] = "true"
+    # OPTIONS 요청 처리 미들웨어
+    @app.middleware("http")
+    async def cors_handler(request: Request, call_next):
+        if request.method == "OPTIONS":
+            response = Response()
+            response.headers["Access-Control-Allow-Origin"] = "*"
+            response.headers["Access-Control-Allow-Methods"] = (
+                "GET, POST, PUT, DELETE, OPTIONS, PATCH"
+            )
+            response.headers["Access-Control-Allow-Headers"] = (
+                "Accept, Accept-Language, Content-Language, Content-Type, Authorization, X-Requested-With, Origin, Access-Control-Request-Method, Access-Control-Request-Headers"
+            )
+            response.headers["Access-Control-Allow-Credentials"] = "true"
+            return response
+
+        response = await call_next(request)
         return response
 
-    response = await call_next(request)
-    return response
+    # 요청 지표 (가장 바깥에서 실행되어 호출 제한 응답과 미들웨어 시간 포함)
+    app.add_middleware(MetricsMiddleware)
+
+    # 요청 ID (모든 로그와 X-Request-ID 응답 헤더에 포함)
+    app.add_middleware(RequestIdMiddleware)
+
+    # 분산 추적 (TRACING_ENABLED인 경우에만 미들웨어 등록)
+    setup_tracing(app)
+
+
+def _register_events(app: FastAPI, routers: LazyRouterRegistry) -> None:
+    """시작/종료 이벤트 등록"""
+
+    @app.on_event("startup")
+    async def startup_event():
+        """모델 등록, 테넌트 조회 색인 적재, 라우터 예열 시작"""
+        await run_in_threadpool(register_models)
+        await run_in_threadpool(tenant_resolver.warm)
+        if settings.ROUTER_WARMUP:
+            routers.start_warmup()
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """지연 기록 플러시, 캐시 무효화 구독, Redis/DB 연결 및 로그 큐 정리"""
+        routers.stop_warmup()
+        _stop_background_services()
+        tenant_resolver.stop()
+        password_hash_pool.shutdown()
+        close_redis()
+        await dispose_async_engines()
+        mark_worker_dead()
+        shutdown_tracing()
+        stop_logging()
+
+
+def create_app() -> FastAPI:
+    """애플리케이션 생성
+
+    라우터는 LAZY_ROUTERS이면 첫 요청 또는 시작 후 예열 시, 아니면 여기서
+    모두 등록합니다. (uvicorn src.main:create_app --factory로도 실행 가능)
+    """
+    configure_logging()
+    app = FastAPI(
+        redirect_slashes=False,  # trailing slash 리다이렉션 비활성화
+        title="CXG 플랫폼 API",
+        description=DESCRIPTION,
+        version="0.1.0",
+        contact={
+            "name": "CXG (Connect & Grow)",
+            "email": "admin@cxg.co.kr",
+        },
+        license_info={
+            "name": "MIT License",
+            "url": "https://opensource.org/licenses/MIT",
+        },
+        servers=[
+            {
+                "url": "http://localhost:8100",
+                "description": "개발 서버",
+            },
+            {
+                "url": "https://api.cxg.co.kr",
+                "description": "운영 서버",
+            },
+        ],
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+    )
+
+    # 관리자/사용자 시스템 라우터 (GraphQL은 설정한 경우에만)
+    routers = LazyRouterRegistry(app, MGMT_V1_ROUTERS + TNNT_V1_ROUTERS)
+    if settings.GRAPHQL_ENABLED:
+        routers.add(
+            RouterSpec(
+                settings.GRAPHQL_PATH,
+                "src.graphql.router",
+                prefix=settings.GRAPHQL_PATH,
+            )
+        )
+    app.state.routers = routers
+    if not settings.LAZY_ROUTERS:
+        register_models()
+        routers.load_all()
 
+    _add_middlewares(app, routers)
+    _register_events(app, routers)
 
-# 관리자 시스템 라우터 등록
-app.include_router(mgmt_v1_router)
-app.include_router(tnnt_v1_router)
+    @app.get("/")
+    async def root():
+        return {"message": "AI 기반 업무지원 플랫폼 API 서버"}
 
-# 사용자 시스템 라우터 등록
-# app.include_router(tnnt_auth_router)
+    @app.get(settings.METRICS_PATH, include_in_schema=False)
+    async def metrics():
+        """Prometheus 지표"""
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
 
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
 
-@app.get("/")
-async def root():
-    return {"message": "AI 기반 업무지원 플랫폼 API 서버"}
+    return app
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -2,14 +2,17 @@
 idam: Identity & Access Management 관련 모델 패키지
 """
 
-from .api_key import ApiKey
-from .login_log import LoginLog
-from .permission import Permission
-from .role import Role
-from .role_permission import RolePermission
-from .session import Session
-from .user import User
-from .user_role import UserRole
+# 모델은 src/modules/mgmt/idam/<도메인>/model.py에 정의
+from src.modules.mgmt.idam.model import (
+    ApiKey,
+    LoginLog,
+    Permission,
+    Role,
+    RolePermission,
+    Session,
+    User,
+    UserRole,
+)
 
 __all__ = [
     "User",
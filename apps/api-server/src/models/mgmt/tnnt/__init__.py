@@ -2,9 +2,11 @@
 tnnt: 테넌트 관리 관련 모델 패키지
 """
 
+# Tenant는 src/modules/mgmt/tnnt/tenant/model.py에 정의
+from src.modules.mgmt.tnnt.tenant.model import Tenant
+
 from .onboarding import Onboarding
 from .subscription import Subscription
-from .tenant import Tenant
 from .tenant_role import TenantRole
 from .tenant_user import TenantUser
 
@@ -0,0 +1,32 @@
+"""
+SQLAlchemy 모델 등록
+
+관계(relationship)에서 문자열로 참조하는 모델이 모두 매퍼 레지스트리에
+있어야 첫 쿼리의 매퍼 구성이 성공합니다. 라우터를 지연 등록하므로 모델은
+애플리케이션 시작 시(첫 요청 전) register_models()로 한 번에 import합니다.
+"""
+
+import importlib
+
+MODEL_MODULES = (
+    "src.models.mgmt.tnnt",
+    "src.modules.mgmt.idam.api_key.model",
+    "src.modules.mgmt.idam.login_log.model",
+    "src.modules.mgmt.idam.permission.model",
+    "src.modules.mgmt.idam.role.model",
+    "src.modules.mgmt.idam.session.model",
+    "src.modules.mgmt.idam.user.model",
+    "src.modules.mgmt.idam.user_role.model",
+    "src.modules.mgmt.tnnt.tenant.model",
+    # Tenant 관계에서 참조하는 나머지 모델(supt, stat, mntr, noti, intg,
+    # cnfg, audt, bkup, ifra, bill)은 관계 문제 해결 전까지 제외
+)
+
+
+def register_models() -> None:
+    """모든 모델 모듈 import (여러 번 호출해도 한 번만 적재)"""
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+
+__all__ = ["MODEL_MODULES", "register_models"]
@@ -4,7 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from src.core.database import get_db
+from src.core.password_hash_pool import PasswordHashPoolBusyError
 from src.schemas.common.response import EnvelopeResponse
+from src.services.mgmt.login_throttle import LoginThrottledError
 
 from .schemas import (
     AuthResponse,
@@ -28,7 +30,7 @@ router = APIRouter(tags=["관리자 - 인증"])
     status_code=status.HTTP_201_CREATED,
     summary="통합 회원가입 (관리자/테넌트)",
 )
-async def signup(
+def signup(
     user_data: SignupRequest,
     db: Session = Depends(get_db),
 ):
@@ -48,6 +50,13 @@ async def signup(
         user = AuthenticationService.signup(db, user_data)
         logger.info(f"회원가입 성공: {user.username} (ID: {user.id})")
         return EnvelopeResponse(success=True, data=user)
+    except PasswordHashPoolBusyError as e:
+        logger.warning(f"회원가입 거절: 비밀번호 해시 풀 포화 - {user_data.email}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         logger.warning(f"회원가입 실패 (잘못된 값): {user_data.email} - {e}")
         raise HTTPException(
@@ -68,7 +77,7 @@ async def signup(
     response_model=EnvelopeResponse[AuthResponse],
     summary="사용자 로그인",
 )
-async def login(
+def login(
     login_data: LoginRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -82,12 +91,31 @@ async def login(
     - **로그인 실패**:
         - 잘못된 자격 증명: `401 UNAUTHORIZED`
         - 계정 잠금: `423 LOCKED`
+        - 로그인 실패 한도 초과: `429 TOO MANY REQUESTS` (`Retry-After` 헤더 참고)
+        - 로그인 요청 폭주로 비밀번호 검증 대기열 초과: `503 SERVICE UNAVAILABLE`
+          (`Retry-After` 헤더 참고)
     """
     logger.info(f"로그인 요청 수신: {login_data.username}")
     try:
-        auth_response = AuthenticationService.login(db, login_data, request)
+        auth_response = AuthenticationService.login(
+            db, login_data, request
+        )
         logger.info(f"로그인 성공: {login_data.username}")
         return EnvelopeResponse(success=True, data=auth_response)
+    except LoginThrottledError as e:
+        logger.warning(f"로그인 거절: 실패 한도 초과 - {login_data.username}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except PasswordHashPoolBusyError as e:
+        logger.warning(f"로그인 거절: 비밀번호 해시 풀 포화 - {login_data.username}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         logger.warning(f"로그인 실패: {login_data.username} - {e}")
         # 실패 유형에 따라 다른 상태 코드 반환
@@ -113,7 +141,7 @@ async def login(
 @router.post(
     "/logout", response_model=EnvelopeResponse[dict], summary="사용자 로그아웃"
 )
-async def logout(
+def logout(
     logout_data: LogoutRequest,
     request: Request,
     db: Session = Depends(get_db),
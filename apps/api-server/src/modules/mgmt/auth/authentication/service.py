@@ -1,21 +1,28 @@
-import logging
 import uuid
-from datetime import date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
 from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.core.client_ip import resolve_client_ip
 from src.core.config import settings
+from src.core.logging import get_logger
 from src.core.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_pooled,
+    verify_access_token_cached,
+    verify_and_update_password_pooled,
 )
 from src.models.mgmt.tnnt.tenant_user import TenantUser
+from src.modules.mgmt.idam.session.model import Session as SessionModel
 from src.modules.mgmt.idam.user.model import User
 from src.modules.mgmt.tnnt.tenant.model import Tenant
 from src.services.mgmt.login_log_service import LoginLogService
+from src.services.mgmt.login_throttle import login_throttle
+from src.services.mgmt.session_revocation import session_revocation
 from src.services.mgmt.session_service import SessionService
+from src.services.mgmt.session_stats import session_stats, snapshot
 
 from .schemas import (
     AuthResponse,
@@ -26,7 +33,14 @@ from .schemas import (
     UserResponse,
 )
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# 액세스 토큰(sess 클레임)에 담는 세션 속성 (AUTH_STATELESS_JWT)
+_SESSION_CLAIM_FIELDS = (
+    "tenant_context",
+    "session_type",
+    "mfa_verified",
+)
 
 
 class AuthenticationService:
@@ -36,16 +50,22 @@ class AuthenticationService:
     def signup(db: Session, user_data: SignupRequest) -> UserResponse:
         """사용자 유형에 따라 관리자 또는 테넌트 사용자를 생성합니다."""
         logger.info(
-            f"회원가입 요청 시작: {user_data.email} (유형: {user_data.user_type})"
+            "회원가입 요청 시작",
+            email=str(user_data.email),
+            user_type=user_data.user_type,
         )
 
         AuthenticationService._validate_user_data(db, user_data)
 
         try:
             if user_data.user_type == "MASTER":
-                user = AuthenticationService._create_master_user(db, user_data)
+                user = AuthenticationService._create_master_user(
+                    db, user_data
+                )
             elif user_data.user_type == "TENANT":
-                user = AuthenticationService._create_tenant_user(db, user_data)
+                user = AuthenticationService._create_tenant_user(
+                    db, user_data
+                )
             else:
                 raise ValueError(
                     f"유효하지 않은 user_type: {user_data.user_type}"
@@ -54,7 +74,7 @@ class AuthenticationService:
             return AuthenticationService._create_user_response(user)
 
         except Exception as e:
-            logger.error(f"회원가입 처리 중 예외 발생: {e}", exc_info=True)
+            logger.error("회원가입 처리 중 예외 발생", error=str(e), exc_info=True)
             db.rollback()
             raise e
 
@@ -63,35 +83,44 @@ class AuthenticationService:
         """사용자 데이터 검증"""
         if db.query(User).filter(User.email == user_data.email).first():
             logger.warning(
-                f"회원가입 실패: 이미 등록된 이메일 - {user_data.email}"
+                "회원가입 실패: 이미 등록된 이메일", email=str(user_data.email)
             )
             raise ValueError("이미 등록된 이메일입니다.")
         if db.query(User).filter(User.username == user_data.username).first():
             logger.warning(
-                f"회원가입 실패: 이미 사용 중인 사용자명 - {user_data.username}"
+                "회원가입 실패: 이미 사용 중인 사용자명",
+                username=user_data.username,
             )
             raise ValueError("이미 사용 중인 사용자명입니다.")
 
     @staticmethod
-    def _create_master_user(db: Session, user_data: SignupRequest) -> User:
+    def _create_master_user(
+        db: Session, user_data: SignupRequest
+    ) -> User:
         """관리자 사용자 생성"""
-        logger.info(f"관리자(MASTER) 사용자 생성: {user_data.email}")
-        user = AuthenticationService._create_user_object(user_data, "MASTER")
+        logger.info("관리자(MASTER) 사용자 생성", email=str(user_data.email))
+        user = AuthenticationService._create_user_object(
+            user_data, "MASTER"
+        )
         db.add(user)
         db.commit()
         db.refresh(user)
-        logger.info(f"관리자(MASTER) 사용자 생성 성공: {user.id}")
+        logger.info("관리자(MASTER) 사용자 생성 성공", user_id=str(user.id))
         return user
 
     @staticmethod
-    def _create_tenant_user(db: Session, user_data: SignupRequest) -> User:
+    def _create_tenant_user(
+        db: Session, user_data: SignupRequest
+    ) -> User:
         """테넌트 사용자 생성"""
-        logger.info(f"테넌트(TENANT) 사용자 생성: {user_data.email}")
+        logger.info("테넌트(TENANT) 사용자 생성", email=str(user_data.email))
         tenant = AuthenticationService._handle_tenant(db, user_data)
-        user = AuthenticationService._create_user_object(user_data, "TENANT")
+        user = AuthenticationService._create_user_object(
+            user_data, "TENANT"
+        )
         db.add(user)
         db.flush()
-        logger.info(f"사용자 객체 생성 성공: {user.id}")
+        logger.info("사용자 객체 생성 성공", user_id=str(user.id))
 
         AuthenticationService._link_tenant_user(
             db, tenant, user, user_data.create_new_tenant
@@ -131,7 +160,7 @@ class AuthenticationService:
         )
         db.add(tenant)
         db.flush()
-        logger.info(f"새로운 테넌트 생성 성공: {tenant.id}")
+        logger.info("새로운 테넌트 생성 성공", tenant_id=str(tenant.id))
         return tenant
 
     @staticmethod
@@ -152,10 +181,14 @@ class AuthenticationService:
         return tenant
 
     @staticmethod
-    def _create_user_object(user_data: SignupRequest, user_type: str) -> User:
+    def _create_user_object(
+        user_data: SignupRequest, user_type: str
+    ) -> User:
         """사용자 객체 생성"""
         salt = uuid.uuid4().hex
-        hashed_password = get_password_hash(user_data.password + salt)
+        hashed_password = get_password_hash_pooled(
+            user_data.password + salt
+        )
         return User(
             email=str(user_data.email),
             username=user_data.username,
@@ -187,7 +220,9 @@ class AuthenticationService:
         db.commit()
         db.refresh(user)
         logger.info(
-            f"테넌트-사용자 연결 성공: tenant_id={tenant.id}, user_id={user.id}"
+            "테넌트-사용자 연결 성공",
+            tenant_id=str(tenant.id),
+            user_id=str(user.id),
         )
 
     @staticmethod
@@ -202,16 +237,20 @@ class AuthenticationService:
         )
 
     @staticmethod
-    def create_user(db: Session, user_data: UserCreateRequest) -> UserResponse:
+    def create_user(
+        db: Session, user_data: UserCreateRequest
+    ) -> UserResponse:
         """(내부용) 신규 사용자를 생성합니다."""
-        logger.info(f"내부 사용자 생성 요청: {user_data.email}")
+        logger.info("내부 사용자 생성 요청", email=str(user_data.email))
         if db.query(User).filter(User.email == user_data.email).first():
             raise ValueError("이미 등록된 이메일입니다.")
         if db.query(User).filter(User.username == user_data.username).first():
             raise ValueError("이미 사용 중인 사용자명입니다.")
 
         salt = uuid.uuid4().hex
-        hashed_password = get_password_hash(user_data.password + salt)
+        hashed_password = get_password_hash_pooled(
+            user_data.password + salt
+        )
         user = User(
             email=str(user_data.email),
             username=user_data.username,
@@ -230,7 +269,7 @@ class AuthenticationService:
         db.add(user)
         db.commit()
         db.refresh(user)
-        logger.info(f"내부 사용자 생성 성공: {user.id}")
+        logger.info("내부 사용자 생성 성공", user_id=str(user.id))
         return UserResponse(
             id=str(user.id),
             email=str(user.email),
@@ -246,7 +285,11 @@ class AuthenticationService:
         request: Request | None = None,
     ) -> AuthResponse:
         """사용자 로그인 처리 및 인증 토큰 발급"""
-        logger.info(f"로그인 요청: {login_data.username}")
+        logger.debug("로그인 요청", username=login_data.username)
+        # 실패 한도를 넘은 요청은 DB를 조회하기 전에 거절
+        ip_address = AuthenticationService._client_ip(request)
+        login_throttle.check(login_data.username, ip_address)
+
         user = (
             db.query(User)
             .filter(
@@ -258,8 +301,10 @@ class AuthenticationService:
 
         if not user:
             logger.warning(
-                f"로그인 실패: 존재하지 않는 사용자 - {login_data.username}"
+                "로그인 실패: 존재하지 않는 사용자",
+                username=login_data.username,
             )
+            login_throttle.record_failure(login_data.username, ip_address)
             LoginLogService.log_failed_login(
                 db=db,
                 user_id=None,
@@ -269,38 +314,24 @@ class AuthenticationService:
             )
             raise ValueError("아이디 또는 비밀번호가 올바르지 않습니다.")
 
+        unit_of_work = settings.AUTH_LOGIN_UNIT_OF_WORK
         salt = str(user.salt_key)
         hashed_pw = str(user.password)
 
-        if not verify_password(login_data.password + salt, hashed_pw):
-            logger.warning(f"로그인 실패: 비밀번호 불일치 - {user.username}")
-            LoginLogService.log_failed_login(
-                db=db,
-                user_id=user.id,  # type: ignore
-                username=user.username,  # type: ignore
-                failure_reason="INVALID_PASSWORD",
-                request=request,
+        verified, upgraded_hash = verify_and_update_password_pooled(
+            login_data.password + salt, hashed_pw
+        )
+        if not verified:
+            AuthenticationService._record_password_failure(
+                db, user, login_data.username, ip_address, request
             )
-
-            user.failed_login_attempts += 1  # type: ignore
-
-            if user.failed_login_attempts >= 5:  # type: ignore
-                user.locked_until = datetime.now() + timedelta(minutes=30)  # type: ignore
-                user.status = "LOCKED"  # type: ignore
-                logger.warning(f"계정 잠금: {user.username}")
-                LoginLogService.log_account_locked(
-                    db=db,
-                    user_id=user.id,  # type: ignore
-                    username=user.username,  # type: ignore
-                    request=request,
-                )
-
-            db.commit()
             raise ValueError("아이디 또는 비밀번호가 올바르지 않습니다.")
 
         if user.status == "LOCKED":  # type: ignore
             if user.locked_until and user.locked_until > datetime.now():  # type: ignore
-                logger.warning(f"로그인 실패: 잠긴 계정 - {user.username}")
+                logger.warning(
+                    "로그인 실패: 잠긴 계정", username=str(user.username)
+                )
                 LoginLogService.log_failed_login(
                     db=db,
                     user_id=user.id,  # type: ignore
@@ -312,17 +343,30 @@ class AuthenticationService:
                     "계정이 잠겨있습니다. 잠시 후 다시 시도해주세요."
                 )
             else:
-                logger.info(f"계정 잠금 해제: {user.username}")
+                logger.info("계정 잠금 해제", user_id=str(user.id))
                 user.status = "ACTIVE"  # type: ignore
                 user.locked_until = None  # type: ignore
                 user.failed_login_attempts = 0  # type: ignore
 
+        if login_throttle.enabled:
+            login_throttle.reset(
+                login_data.username, str(user.username), str(user.email)
+            )
+        else:
+            user.failed_login_attempts = 0  # type: ignore
         user.last_login_at = datetime.now()  # type: ignore
-        user.failed_login_attempts = 0  # type: ignore
+
+        # 해시 정책(스킴/비용)이 바뀐 경우 평문을 알고 있는 지금 재해시
+        if upgraded_hash:
+            logger.info("비밀번호 해시 갱신", user_id=str(user.id))
+            user.password = upgraded_hash  # type: ignore
 
         if request and request.client:
             user.last_login_ip = request.client.host  # type: ignore
 
+        if unit_of_work:
+            return AuthenticationService._complete_login(db, user, request)
+
         db.commit()
 
         session_token, session = SessionService.create_session(
@@ -331,16 +375,17 @@ class AuthenticationService:
             request=request,
             expires_in_hours=settings.ACCESS_TOKEN_EXPIRE_MINUTES // 60 or 24,
         )
-        logger.info(f"세션 생성 성공: user_id={user.id}")
+        logger.debug("세션 생성 성공", user_id=str(user.id))
 
         access_token = create_access_token(
             data={
                 "sub": str(user.username),
                 "user_id": str(user.id),
                 "session_token": session_token,
+                "sess": AuthenticationService._session_claims(session),
             },
-            expires_delta=timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+            expires_delta=AuthenticationService._token_lifetime(
+                session.expires_at  # type: ignore
             ),
         )
 
@@ -351,7 +396,7 @@ class AuthenticationService:
             request=request,
             session_id=session_token,
         )
-        logger.info(f"로그인 성공: {user.username}")
+        logger.info("로그인 성공", user_id=str(user.id))
 
         return AuthResponse(
             access_token=access_token,
@@ -362,6 +407,166 @@ class AuthenticationService:
             expires_at=session.expires_at.isoformat(),  # type: ignore
         )
 
+    @staticmethod
+    def _record_password_failure(
+        db: Session,
+        user: User,
+        username: str,
+        ip_address: str | None,
+        request: Request | None = None,
+    ) -> None:
+        """비밀번호 불일치 기록 (실패 로그, 실패 횟수, 계정 잠금)
+
+        로그인 실패 제한(LOGIN_THROTTLE_ENABLED)을 사용하면 실패 횟수를
+        users 행 대신 실패 제한 윈도우로 집계하므로 users 행을 갱신하지
+        않습니다.
+        """
+        # 실패 로그와 실패 횟수/잠금 갱신도 한 번의 커밋으로 반영
+        unit_of_work = settings.AUTH_LOGIN_UNIT_OF_WORK
+        logger.warning(
+            "로그인 실패: 비밀번호 불일치", username=str(user.username)
+        )
+        LoginLogService.log_failed_login(
+            db=db,
+            user_id=user.id,  # type: ignore
+            username=user.username,  # type: ignore
+            failure_reason="INVALID_PASSWORD",
+            request=request,
+            commit=not unit_of_work,
+        )
+
+        if login_throttle.enabled:
+            locked = login_throttle.record_failure(
+                username,
+                ip_address,
+                aliases=(str(user.username), str(user.email)),
+            )
+        else:
+            user.failed_login_attempts += 1  # type: ignore
+            locked = user.failed_login_attempts >= 5  # type: ignore
+            if locked:
+                user.locked_until = datetime.now() + timedelta(minutes=30)  # type: ignore
+                user.status = "LOCKED"  # type: ignore
+
+        if locked:
+            logger.warning("계정 잠금", username=str(user.username))
+            LoginLogService.log_account_locked(
+                db=db,
+                user_id=user.id,  # type: ignore
+                username=user.username,  # type: ignore
+                request=request,
+                commit=not unit_of_work,
+            )
+
+        db.commit()
+
+    @staticmethod
+    def _client_ip(request: Request | None) -> str | None:
+        """요청 IP 주소 (신뢰하는 프록시 뒤에서는 X-Forwarded-For 사용)"""
+        if not request:
+            return None
+        return resolve_client_ip(
+            request.client.host if request.client else None,
+            request.headers.get("X-Forwarded-For"),
+        )
+
+    @staticmethod
+    def _session_claims(session: SessionModel) -> dict:
+        """액세스 토큰에 담을 세션 속성 (무상태 검증 시 세션 구성에 사용)"""
+        claims = {}
+        for field in _SESSION_CLAIM_FIELDS:
+            value = getattr(session, field)
+            if value is not None and not isinstance(value, bool | str):
+                value = str(value)  # UUID
+            claims[field] = value
+        return claims
+
+    @staticmethod
+    def _token_lifetime(session_expires_at: datetime) -> timedelta:
+        """액세스 토큰 유효 기간 (세션 만료 시각을 넘지 않도록 제한)
+
+        무상태 검증은 토큰의 exp를 세션 만료 시각으로 사용하므로, 세션보다
+        오래 유효한 토큰이 발급되지 않게 합니다.
+        """
+        return min(
+            timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            session_expires_at - datetime.now(),
+        )
+
+    @staticmethod
+    def _complete_login(
+        db: Session,
+        user: User,
+        request: Request | None = None,
+    ) -> AuthResponse:
+        """사용자 갱신, 세션 생성, 로그인 로그를 한 트랜잭션으로 반영
+
+        세션 행은 INSERT ... RETURNING으로 받아 refresh SELECT를 생략하고,
+        커밋 후 만료되는 ORM 속성을 다시 조회하지 않도록 응답에 필요한 값은
+        커밋 전에 확보합니다. 감사 로그가 write-behind이면 커밋이 성공한
+        뒤에만 기록합니다.
+        """
+        user_id = user.id
+        username = str(user.username)
+        email = str(user.email)
+        write_behind = settings.LOGIN_AUDIT_WRITE_BEHIND
+        expires_in_hours = settings.ACCESS_TOKEN_EXPIRE_MINUTES // 60 or 24
+
+        try:
+            session_token, session = SessionService.create_session(
+                db=db,
+                user_id=user_id,  # type: ignore
+                request=request,
+                expires_in_hours=expires_in_hours,
+                commit=False,
+            )
+            session_state = snapshot(session)
+            session_claims = AuthenticationService._session_claims(session)
+            expires_at = session.expires_at
+            if not write_behind:
+                LoginLogService.log_successful_login(
+                    db=db,
+                    user_id=user_id,  # type: ignore
+                    username=username,
+                    request=request,
+                    session_id=session_token,
+                    commit=False,
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        session_stats.record((None, session_state))
+        logger.debug("세션 생성 성공", user_id=str(user_id))
+        if write_behind:
+            LoginLogService.log_successful_login(
+                db=db,
+                user_id=user_id,  # type: ignore
+                username=username,
+                request=request,
+                session_id=session_token,
+            )
+        logger.info("로그인 성공", user_id=str(user_id))
+
+        access_token = create_access_token(
+            data={
+                "sub": username,
+                "user_id": str(user_id),
+                "session_token": session_token,
+                "sess": session_claims,
+            },
+            expires_delta=AuthenticationService._token_lifetime(expires_at),
+        )
+        return AuthResponse(
+            access_token=access_token,
+            user_id=str(user_id),
+            email=email,
+            username=username,
+            session_token=session_token,
+            expires_at=expires_at.isoformat(),  # type: ignore
+        )
+
     @staticmethod
     def logout_user(
         db: Session,
@@ -370,7 +575,8 @@ class AuthenticationService:
     ) -> bool:
         """사용자 로그아웃 처리"""
         logger.info(
-            f"로그아웃 요청: session_token={logout_data.session_token[:10]}..."
+            "로그아웃 요청",
+            session_token_prefix=logout_data.session_token[:10],
         )
         session = SessionService.validate_session(
             db=db,
@@ -388,7 +594,7 @@ class AuthenticationService:
         )
 
         if success:
-            logger.info(f"세션 무효화 성공: user_id={session.user_id}")
+            logger.info("세션 무효화 성공", user_id=str(session.user_id))
             LoginLogService.log_logout(
                 db=db,
                 user_id=session.user_id,  # type: ignore
@@ -404,10 +610,67 @@ class AuthenticationService:
         db: Session,
         session_token: str,
     ) -> Session | None:
-        """세션 토큰의 유효성을 검증합니다."""
-        logger.debug(f"세션 토큰 검증 요청: {session_token[:10]}...")
+        """세션 토큰의 유효성을 검증합니다. (세션 검증 캐시 사용)"""
         return SessionService.validate_session(
             db=db,
             session_token=session_token,
             update_activity=True,
+            use_cache=True,
+        )
+
+    @staticmethod
+    async def validate_session_token_async(
+        db: AsyncSession,
+        session_token: str,
+    ) -> Session | None:
+        """세션 토큰의 유효성을 비동기로 검증합니다. (세션 검증 캐시 사용)"""
+        return await SessionService.validate_session_async(
+            db=db,
+            session_token=session_token,
+            update_activity=True,
+            use_cache=True,
+        )
+
+    @staticmethod
+    async def validate_access_token_async(
+        db: AsyncSession,
+        access_token: str,
+    ) -> SessionModel | None:
+        """액세스 토큰(JWT)으로 세션을 검증합니다. (AUTH_STATELESS_JWT)
+
+        서명/만료를 로컬에서 검증하고, 세션이 무효화 필터에 걸리지 않으면
+        DB를 조회하지 않고 클레임으로 구성한 (DB에 연결되지 않은) 세션을
+        반환합니다. 필터에 걸리면 토큰에 담긴 세션 토큰으로 기존 검증을
+        수행합니다.
+        """
+        claims = verify_access_token_cached(access_token)
+        if (
+            claims is None
+            or not claims.get("session_token")
+            or not claims.get("user_id")
+        ):
+            return None
+
+        session_token = claims["session_token"]
+        session_hash = SessionService.hash_session_token(session_token)
+        session_claims = claims.get("sess")
+        # 세션 속성이 없는 토큰(이전 버전 발급)은 DB로 검증
+        if not isinstance(session_claims, dict) or (
+            session_revocation.might_be_revoked(session_hash)
+        ):
+            return await AuthenticationService.validate_session_token_async(
+                db, session_token
+            )
+
+        tenant_context = session_claims.get("tenant_context")
+        if tenant_context:
+            tenant_context = uuid.UUID(tenant_context)
+        return SessionModel(
+            session_id=session_hash,
+            user_id=uuid.UUID(claims["user_id"]),
+            tenant_context=tenant_context or None,
+            session_type=session_claims.get("session_type") or "WEB",
+            status="ACTIVE",
+            expires_at=datetime.fromtimestamp(claims["exp"], UTC),
+            mfa_verified=bool(session_claims.get("mfa_verified")),
         )
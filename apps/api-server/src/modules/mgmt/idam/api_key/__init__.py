@@ -3,6 +3,7 @@ from .router import router
 from .schemas import (
     ApiKeyCreate,
     ApiKeyCreateRequest,
+    ApiKeyCreateResponse,
     ApiKeyRead,
     ApiKeyResponse,
     ApiKeyUpdate,
@@ -15,6 +16,7 @@ __all__ = [
     "router",
     "ApiKeyCreate",
     "ApiKeyCreateRequest",
+    "ApiKeyCreateResponse",
     "ApiKeyRead",
     "ApiKeyResponse",
     "ApiKeyUpdate",
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import (
     ApiKeyCreateRequest,
+    ApiKeyCreateResponse,
     ApiKeyResponse,
     ApiKeyUpdateRequest,
 )
@@ -21,13 +22,13 @@ async def get_api_keys_for_user(
     user_id: str,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 사용자의 API 키 목록 조회
     """
     try:
-        api_keys = ApiKeyService.get_api_keys_for_user(
+        api_keys = await ApiKeyService.get_api_keys_for_user(
             db, user_id, skip, limit
         )
         return EnvelopeResponse(success=True, data=api_keys, error=None)
@@ -39,20 +40,31 @@ async def get_api_keys_for_user(
 
 @router.post(
     "/users/{user_id}",
-    response_model=EnvelopeResponse[ApiKeyResponse],
+    response_model=EnvelopeResponse[ApiKeyCreateResponse],
     status_code=status.HTTP_201_CREATED,
 )
 async def create_api_key(
     user_id: str,
     api_key_data: ApiKeyCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
-    새로운 API 키 생성
+    새로운 API 키 생성 (원본 키는 이 응답에서 한 번만 반환)
     """
     try:
-        api_key = ApiKeyService.create_api_key(db, user_id, api_key_data)
-        return EnvelopeResponse(success=True, data=api_key, error=None)
+        api_key, raw_api_key = await ApiKeyService.create_api_key(
+            db, user_id, api_key_data
+        )
+        data = ApiKeyCreateResponse(
+            id=str(api_key.id),
+            key_id=api_key.key_id,
+            name=api_key.key_name,
+            user_id=str(api_key.user_id),
+            created_at=api_key.created_at,
+            expires_at=api_key.expires_at,
+            api_key=raw_api_key,
+        )
+        return EnvelopeResponse(success=True, data=data, error=None)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -63,13 +75,15 @@ async def create_api_key(
 async def update_api_key(
     api_key_id: str,
     api_key_data: ApiKeyUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     API 키 정보 수정
     """
     try:
-        api_key = ApiKeyService.update_api_key(db, api_key_id, api_key_data)
+        api_key = await ApiKeyService.update_api_key(
+            db, api_key_id, api_key_data
+        )
         if not api_key:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -87,13 +101,13 @@ async def update_api_key(
 @router.delete("/{api_key_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_api_key(
     api_key_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     API 키 삭제
     """
     try:
-        success = ApiKeyService.delete_api_key(db, api_key_id)
+        success = await ApiKeyService.delete_api_key(db, api_key_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
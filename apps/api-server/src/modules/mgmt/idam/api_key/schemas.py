@@ -37,6 +37,18 @@ class ApiKeyResponse(BaseModel):
         from_attributes = True
 
 
+class ApiKeyCreateResponse(BaseModel):
+    """생성 응답 (api_key는 이 응답에서만 제공됨)"""
+
+    id: str
+    key_id: str
+    name: str
+    user_id: str
+    created_at: datetime
+    expires_at: datetime | None = None
+    api_key: str
+
+
 class ApiKeyUpdate(BaseModel):
     name: str | None = None
     expires_at: datetime | None = None
@@ -1,8 +1,13 @@
 import logging
-import secrets
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.mgmt.api_key_auth import (
+    api_key_authenticator,
+    generate_api_key,
+)
 
 from .model import ApiKey as ApiKeyModel
 from .schemas import (
@@ -20,82 +25,93 @@ class ApiKeyService:
     """API 키 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def generate_api_key() -> str:
-        """안전한 API 키를 생성합니다."""
-        return secrets.token_urlsafe(32)
+    def generate_api_key() -> tuple[str, str, str]:
+        """안전한 API 키를 생성합니다. (key_id, 원본 키, 저장용 해시)"""
+        return generate_api_key()
 
     @staticmethod
-    def get_api_keys_for_user(
-        db: Session, user_id: str, skip: int = 0, limit: int = 100
+    async def authenticate_api_key(
+        db: AsyncSession, raw_key: str, ip_address: str | None = None
+    ) -> ApiKeyModel | None:
+        """
+        API 키를 검증합니다. (유효하지 않으면 None)
+        """
+        try:
+            return await api_key_authenticator.authenticate(
+                db, raw_key, ip_address
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"API 키 인증 중 데이터베이스 에러: {e}")
+            raise
+
+    @staticmethod
+    async def get_api_keys_for_user(
+        db: AsyncSession, user_id: str, skip: int = 0, limit: int = 100
     ) -> list[ApiKeyModel]:
         """
         특정 사용자의 API 키 목록을 조회합니다.
         """
         try:
-            api_keys = (
-                db.query(ApiKeyModel)
+            result = await db.scalars(
+                select(ApiKeyModel)
                 .filter(ApiKeyModel.user_id == user_id)
                 .offset(skip)
                 .limit(limit)
-                .all()
             )
-            return api_keys
+            return list(result.all())
         except SQLAlchemyError as e:
             logger.error(f"API 키 목록 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def get_api_key_by_id(db: Session, api_key_id: str) -> ApiKeyModel | None:
+    async def get_api_key_by_id(
+        db: AsyncSession, api_key_id: str
+    ) -> ApiKeyModel | None:
         """
         ID로 특정 API 키를 조회합니다.
         """
         try:
-            api_key = (
-                db.query(ApiKeyModel)
-                .filter(ApiKeyModel.id == api_key_id)
-                .first()
+            return await db.scalar(
+                select(ApiKeyModel).filter(ApiKeyModel.id == api_key_id)
             )
-            return api_key
         except SQLAlchemyError as e:
             logger.error(f"API 키 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def create_api_key(
-        db: Session,
+    async def create_api_key(
+        db: AsyncSession,
         user_id: str,
         api_key_data: ApiKeyCreate | ApiKeyCreateRequest,
-    ) -> ApiKeyModel:
+    ) -> tuple[ApiKeyModel, str]:
         """
         새로운 API 키를 생성합니다.
+
+        원본 키는 저장하지 않으므로 반환값의 원본 키를 사용자에게 한 번만
+        보여줘야 합니다.
         """
         try:
-            # 실제 API 키 생성 (저장되지 않음, 사용자에게 한 번만 보여줌)
-            raw_api_key = ApiKeyService.generate_api_key()
-            # TODO: raw_api_key를 해싱하여 key_hash에 저장해야 합니다.
-            # 현재는 임시로 raw_api_key를 그대로 저장합니다. 실제 서비스에서는 보안 강화 필요.
-            key_hash = (
-                raw_api_key  # For now, store raw key. Implement hashing later.
-            )
+            key_id, raw_api_key, key_hash = ApiKeyService.generate_api_key()
 
             db_api_key = ApiKeyModel(
-                name=api_key_data.name,
+                key_id=key_id,
+                key_name=api_key_data.name,
                 user_id=user_id,
                 key_hash=key_hash,
                 expires_at=api_key_data.expires_at,
             )
             db.add(db_api_key)
-            db.commit()
-            db.refresh(db_api_key)
-            return db_api_key
+            await db.commit()
+            await db.refresh(db_api_key)
+            return db_api_key, raw_api_key
         except SQLAlchemyError as e:
             logger.error(f"API 키 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_api_key(
-        db: Session,
+    async def update_api_key(
+        db: AsyncSession,
         api_key_id: str,
         api_key_data: ApiKeyUpdate | ApiKeyUpdateRequest,
     ) -> ApiKeyModel | None:
@@ -103,44 +119,44 @@ class ApiKeyService:
         API 키 정보를 수정합니다.
         """
         try:
-            db_api_key = (
-                db.query(ApiKeyModel)
-                .filter(ApiKeyModel.id == api_key_id)
-                .first()
-            )
+            db_api_key = await ApiKeyService.get_api_key_by_id(db, api_key_id)
             if not db_api_key:
                 return None
 
             update_data = api_key_data.model_dump(exclude_unset=True)
+            if "name" in update_data:
+                update_data["key_name"] = update_data.pop("name")
+            if "is_active" in update_data:
+                is_active = update_data.pop("is_active")
+                update_data["status"] = "ACTIVE" if is_active else "INACTIVE"
             for field, value in update_data.items():
                 setattr(db_api_key, field, value)
 
-            db.commit()
-            db.refresh(db_api_key)
+            await db.commit()
+            await db.refresh(db_api_key)
+            api_key_authenticator.invalidate(db_api_key.key_id)
             return db_api_key
         except SQLAlchemyError as e:
             logger.error(f"API 키 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_api_key(db: Session, api_key_id: str) -> bool:
+    async def delete_api_key(db: AsyncSession, api_key_id: str) -> bool:
         """
         API 키를 삭제합니다.
         """
         try:
-            db_api_key = (
-                db.query(ApiKeyModel)
-                .filter(ApiKeyModel.id == api_key_id)
-                .first()
-            )
+            db_api_key = await ApiKeyService.get_api_key_by_id(db, api_key_id)
             if not db_api_key:
                 return False
 
-            db.delete(db_api_key)
-            db.commit()
+            key_id = db_api_key.key_id
+            await db.delete(db_api_key)
+            await db.commit()
+            api_key_authenticator.invalidate(key_id)
             return True
         except SQLAlchemyError as e:
             logger.error(f"API 키 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
@@ -0,0 +1,262 @@
+"""
+로그인 통계 일 단위 집계(rollup)
+
+하루 이상의 기간에 대한 로그인 통계를 idam.login_logs 전체 스캔 대신
+일 단위 집계 테이블에서 계산합니다.
+
+- idam.login_log_daily_stats: 일자별 시도/성공/실패 수와 실패 사유별 건수
+- idam.login_log_daily_actors: 일자별 고유 사용자/IP 목록
+  (고유 수는 일자 간 합산이 불가능하므로 목록을 두고 기간 내 DISTINCT 계산)
+
+완료된 과거 일자만 집계하며, 집계 행이 없는 일자는 조회 시 primary에서
+즉시 집계합니다. 일자 종료 후 LOGIN_STATS_ROLLUP_LATE_HOURS가 지나기 전에
+집계한 행은 늦게 기록된 로그가 있을 수 있으므로 조회 시 다시 집계합니다.
+같은 일자를 동시에 집계하는 요청은 일자별 advisory lock으로 직렬화합니다.
+기간 양 끝의 부분 일자(시작 일자 나머지, 오늘)는 원본 로그에서 계산합니다.
+일자 경계는 Asia/Seoul 기준입니다.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import mgmt_async_session_local
+
+logger = logging.getLogger(__name__)
+
+_TZ = ZoneInfo("Asia/Seoul")
+
+_SUCCESS_LOGIN = "success AND attempt_type = 'LOGIN'"
+_FAILED_LOGIN = "NOT success AND attempt_type = 'LOGIN'"
+
+_REFRESH_STATS_SQL = f"""
+INSERT INTO idam.login_log_daily_stats (
+    stat_date, total_attempts, successful_logins, failed_logins,
+    failure_reasons, refreshed_at
+)
+SELECT
+    CAST(:stat_date AS date),
+    count(*),
+    count(*) FILTER (WHERE {_SUCCESS_LOGIN}),
+    count(*) FILTER (WHERE {_FAILED_LOGIN}),
+    COALESCE((
+        SELECT jsonb_object_agg(r.failure_reason, r.cnt)
+        FROM (
+            SELECT failure_reason, count(*) AS cnt
+            FROM idam.login_logs
+            WHERE created_at >= :start AND created_at < :end
+              AND NOT success
+              AND failure_reason IS NOT NULL
+            GROUP BY failure_reason
+        ) r
+    ), '{{}}'::jsonb),
+    now()
+FROM idam.login_logs
+WHERE created_at >= :start AND created_at < :end
+ON CONFLICT (stat_date) DO UPDATE SET
+    total_attempts = EXCLUDED.total_attempts,
+    successful_logins = EXCLUDED.successful_logins,
+    failed_logins = EXCLUDED.failed_logins,
+    failure_reasons = EXCLUDED.failure_reasons,
+    refreshed_at = EXCLUDED.refreshed_at
+"""
+
+_DELETE_ACTORS_SQL = """
+DELETE FROM idam.login_log_daily_actors
+WHERE stat_date = CAST(:stat_date AS date)
+"""
+
+_REFRESH_ACTORS_SQL = f"""
+INSERT INTO idam.login_log_daily_actors (stat_date, actor_type, actor)
+SELECT DISTINCT CAST(:stat_date AS date), 'USER', user_id::text
+FROM idam.login_logs
+WHERE created_at >= :start AND created_at < :end
+  AND {_SUCCESS_LOGIN}
+  AND user_id IS NOT NULL
+UNION
+SELECT DISTINCT CAST(:stat_date AS date), 'IP', host(ip_address)
+FROM idam.login_logs
+WHERE created_at >= :start AND created_at < :end
+ON CONFLICT DO NOTHING
+"""
+
+# 같은 일자를 집계하는 트랜잭션 직렬화 (트랜잭션 종료 시 해제)
+_LOCK_DAY_SQL = """
+SELECT pg_advisory_xact_lock(hashtext('idam.login_log_daily'), :day_key)
+"""
+
+# 기간 양 끝의 부분 일자: [start, head_end) 및 [tail_start, now)
+_EDGE_WINDOW = """
+    ((created_at >= :start AND created_at < :head_end)
+     OR created_at >= :tail_start)
+"""
+
+_EDGE_COUNTS_SQL = f"""
+SELECT
+    count(*) AS total_attempts,
+    count(*) FILTER (WHERE {_SUCCESS_LOGIN}) AS successful_logins,
+    count(*) FILTER (WHERE {_FAILED_LOGIN}) AS failed_logins
+FROM idam.login_logs
+WHERE {_EDGE_WINDOW}
+"""
+
+_EDGE_REASONS_SQL = f"""
+SELECT failure_reason, count(*) AS cnt
+FROM idam.login_logs
+WHERE {_EDGE_WINDOW}
+  AND NOT success
+  AND failure_reason IS NOT NULL
+GROUP BY failure_reason
+"""
+
+_ROLLUP_ROWS_SQL = """
+SELECT total_attempts, successful_logins, failed_logins, failure_reasons
+FROM idam.login_log_daily_stats
+WHERE stat_date >= :first_day AND stat_date < :last_day
+"""
+
+_ROLLUP_DAYS_SQL = """
+SELECT stat_date, refreshed_at
+FROM idam.login_log_daily_stats
+WHERE stat_date >= :first_day AND stat_date < :last_day
+"""
+
+_UNIQUE_ACTORS_SQL = f"""
+SELECT
+    count(DISTINCT actor) FILTER (WHERE actor_type = 'USER') AS unique_users,
+    count(DISTINCT actor) FILTER (WHERE actor_type = 'IP') AS unique_ips
+FROM (
+    SELECT actor_type, actor
+    FROM idam.login_log_daily_actors
+    WHERE stat_date >= :first_day AND stat_date < :last_day
+    UNION ALL
+    SELECT 'USER', user_id::text
+    FROM idam.login_logs
+    WHERE {_EDGE_WINDOW}
+      AND {_SUCCESS_LOGIN}
+      AND user_id IS NOT NULL
+    UNION ALL
+    SELECT 'IP', host(ip_address)
+    FROM idam.login_logs
+    WHERE {_EDGE_WINDOW}
+) actors
+"""
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=_TZ)
+
+
+async def refresh_daily_rollup(db: AsyncSession, day: date) -> None:
+    """지정 일자의 집계 행을 원본 로그로부터 다시 계산 (멱등)"""
+    params = {
+        "stat_date": day,
+        "start": _day_start(day),
+        "end": _day_start(day + timedelta(days=1)),
+    }
+    await db.execute(text(_LOCK_DAY_SQL), {"day_key": day.toordinal()})
+    await db.execute(text(_REFRESH_STATS_SQL), params)
+    await db.execute(text(_DELETE_ACTORS_SQL), {"stat_date": day})
+    await db.execute(text(_REFRESH_ACTORS_SQL), params)
+    logger.info(f"로그인 통계 일 단위 집계 갱신: {day}")
+
+
+async def _ensure_rollup(
+    db: AsyncSession, first_day: date, last_day: date
+) -> bool:
+    """기간 내 집계 누락/미확정 일자를 primary에서 집계하고 갱신 여부 반환
+
+    일자 종료 후 LOGIN_STATS_ROLLUP_LATE_HOURS 이전에 집계한 행은 늦게
+    기록된 로그가 빠졌을 수 있으므로 확정되지 않은 것으로 보고 다시
+    집계합니다.
+    """
+    result = await db.execute(
+        text(_ROLLUP_DAYS_SQL),
+        {"first_day": first_day, "last_day": last_day},
+    )
+    late = timedelta(hours=settings.LOGIN_STATS_ROLLUP_LATE_HOURS)
+    settled = {
+        row.stat_date
+        for row in result
+        if row.refreshed_at
+        >= _day_start(row.stat_date + timedelta(days=1)) + late
+    }
+    pending = [
+        first_day + timedelta(days=i)
+        for i in range((last_day - first_day).days)
+        if first_day + timedelta(days=i) not in settled
+    ]
+    if not pending:
+        return False
+
+    async with mgmt_async_session_local() as primary:
+        for day in pending:
+            await refresh_daily_rollup(primary, day)
+        await primary.commit()
+    return True
+
+
+async def get_login_stats_from_rollup(
+    db: AsyncSession, start: datetime, now: datetime
+) -> dict:
+    """일 단위 집계와 양 끝 부분 일자의 원본 로그를 합산한 통계
+
+    Args:
+        db (AsyncSession): 조회용 세션 (복제본일 수 있음)
+        start (datetime): 기간 시작 시각 (timezone-aware)
+        now (datetime): 기간 종료 시각 (timezone-aware)
+
+    Returns:
+        dict: total_attempts, successful_logins, failed_logins,
+            unique_users, unique_ips, failure_reasons
+    """
+    first_day = start.astimezone(_TZ).date() + timedelta(days=1)
+    last_day = now.astimezone(_TZ).date()
+    params = {
+        "first_day": first_day,
+        "last_day": last_day,
+        "start": start,
+        "head_end": _day_start(first_day),
+        "tail_start": _day_start(last_day),
+    }
+
+    if await _ensure_rollup(db, first_day, last_day):
+        # 방금 집계한 행이 복제본에 아직 반영되지 않았을 수 있으므로 primary 사용
+        async with mgmt_async_session_local() as primary:
+            return await _read_stats(primary, params)
+    return await _read_stats(db, params)
+
+
+async def _read_stats(db: AsyncSession, params: dict) -> dict:
+    edge = (await db.execute(text(_EDGE_COUNTS_SQL), params)).one()
+    stats = {
+        "total_attempts": edge.total_attempts,
+        "successful_logins": edge.successful_logins,
+        "failed_logins": edge.failed_logins,
+    }
+    failure_reasons: dict[str, int] = {}
+
+    for row in await db.execute(text(_ROLLUP_ROWS_SQL), params):
+        stats["total_attempts"] += row.total_attempts
+        stats["successful_logins"] += row.successful_logins
+        stats["failed_logins"] += row.failed_logins
+        for reason, count in (row.failure_reasons or {}).items():
+            failure_reasons[reason] = failure_reasons.get(reason, 0) + count
+
+    for row in await db.execute(text(_EDGE_REASONS_SQL), params):
+        failure_reasons[row.failure_reason] = (
+            failure_reasons.get(row.failure_reason, 0) + row.cnt
+        )
+
+    actors = (await db.execute(text(_UNIQUE_ACTORS_SQL), params)).one()
+    stats["unique_users"] = actors.unique_users
+    stats["unique_ips"] = actors.unique_ips
+    stats["failure_reasons"] = failure_reasons
+    return stats
+
+
+__all__ = ["get_login_stats_from_rollup", "refresh_daily_rollup"]
@@ -1,19 +1,29 @@
 import logging
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_readonly
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
-from .schemas import LoginLogFilterRequest, LoginLogListResponse
+from .schemas import (
+    LoginLogFilterRequest,
+    LoginLogListResponse,
+    LoginLogResponse,
+)
 from .service import LoginLogService
 
 router = APIRouter(prefix="/login-logs", tags=["IDAM - 로그인 로그 관리"])
 logger = logging.getLogger("login-logs-router")
 
 
-@router.get("/", response_model=EnvelopeResponse[LoginLogListResponse])
+@router.get(
+    "/",
+    response_model=EnvelopeResponse[
+        LoginLogListResponse | CursorPage[LoginLogResponse]
+    ],
+)
 async def get_login_logs(
     user_id: str | None = Query(None),
     username: str | None = Query(None),
@@ -24,7 +34,8 @@ async def get_login_logs(
     end_date: str | None = Query(None),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_mgmt_db_readonly),
 ):
     """
     로그인 로그 목록 조회
@@ -46,6 +57,8 @@ async def get_login_logs(
     - **end_date**: 종료 날짜 (ISO 8601 형식, 선택)
     - **page**: 페이지 번호 (기본값: 1, 최소: 1)
     - **size**: 페이지당 항목 수 (기본값: 20, 범위: 1-100)
+    - **cursor**: 커서 페이지네이션 커서 (선택)
+      - 빈 값이면 첫 페이지, 지정 시 page 대신 사용하며 total은 계산하지 않음
 
     **반환값:**
     - **success**: 요청 성공 여부
@@ -55,6 +68,7 @@ async def get_login_logs(
       - page: 현재 페이지
       - size: 페이지 크기
       - pages: 총 페이지 수
+      - cursor 지정 시 items, next_cursor, has_more, size
     - **error**: 오류 정보 (실패 시)
 
     **예외:**
@@ -88,10 +102,11 @@ async def get_login_logs(
             end_date=parsed_end_date,
             page=page,
             size=size,
+            cursor=cursor,
         )
 
-        result = LoginLogService.get_login_logs(db, filters)
-        logger.info(f"[GET_LOGIN_LOGS] 성공: {result.total}개 조회")
+        result = await LoginLogService.get_login_logs(db, filters)
+        logger.info(f"[GET_LOGIN_LOGS] 성공: {len(result.items)}개 반환")
         return EnvelopeResponse(success=True, data=result, error=None)
 
     except Exception as e:
@@ -104,12 +119,14 @@ async def get_login_logs(
 @router.get("/stats", response_model=EnvelopeResponse[dict])
 async def get_login_stats(
     days: int = Query(7, ge=1, le=90),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_readonly),
 ):
     """
     로그인 통계 조회
 
     지정된 기간 동안의 로그인 시도에 대한 통계 정보를 제공합니다.
+    결과는 기간별로 짧게 캐시되므로(LOGIN_STATS_CACHE_TTL_SECONDS) 최근
+    시도가 즉시 반영되지 않을 수 있습니다.
 
     **매개변수:**
     - **days**: 통계 조회 기간 (일 단위, 기본값: 7, 범위: 1-90)
@@ -138,7 +155,7 @@ async def get_login_stats(
     """
     logger.info(f"[GET_LOGIN_STATS] 요청: days={days}")
     try:
-        stats = LoginLogService.get_login_stats(db, days)
+        stats = await LoginLogService.get_login_stats(db, days)
         logger.info("[GET_LOGIN_STATS] 성공")
         return EnvelopeResponse(success=True, data=stats, error=None)
 
@@ -1,11 +1,17 @@
-import logging
-from datetime import datetime
+import time
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import JSON, and_, desc, func, literal_column, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.schemas.common.pagination import CursorPage
 
 from .model import LoginLog as LoginLogModel
+from .rollup import get_login_stats_from_rollup
 from .schemas import (
     LoginLogCreate,
     LoginLogFilterRequest,
@@ -14,30 +20,92 @@ from .schemas import (
     LoginLogUpdate,
 )
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# 기간(days)별 통계 캐시: days -> (만료 시각(monotonic), 통계)
+_stats_cache: dict[int, tuple[float, dict]] = {}
+
+
+def _login_stats_query(start_date: datetime):
+    """기간 내 로그인 통계를 한 번에 계산하는 집계 쿼리
+
+    건수/고유 수는 FILTER 절로 한 번의 스캔에서 계산하고, 실패 사유별
+    건수는 그룹 집계 결과를 JSON 객체로 묶은 스칼라 서브쿼리로 가져옵니다.
+    """
+    in_window = LoginLogModel.created_at >= start_date
+    success_login = and_(
+        LoginLogModel.success == True,  # noqa: E712
+        LoginLogModel.attempt_type == "LOGIN",
+    )
+    failed_login = and_(
+        LoginLogModel.success == False,  # noqa: E712
+        LoginLogModel.attempt_type == "LOGIN",
+    )
+
+    reasons = (
+        select(
+            LoginLogModel.failure_reason.label("reason"),
+            func.count().label("cnt"),
+        )
+        .filter(
+            in_window,
+            LoginLogModel.success == False,  # noqa: E712
+            LoginLogModel.failure_reason.isnot(None),
+        )
+        .group_by(LoginLogModel.failure_reason)
+        .subquery()
+    )
+    failure_reasons = select(
+        func.coalesce(
+            func.json_object_agg(reasons.c.reason, reasons.c.cnt),
+            literal_column("'{}'::json"),
+            type_=JSON,
+        )
+    ).scalar_subquery()
+
+    return select(
+        func.count().label("total_attempts"),
+        func.count().filter(success_login).label("successful_logins"),
+        func.count().filter(failed_login).label("failed_logins"),
+        func.count(func.distinct(LoginLogModel.user_id))
+        .filter(success_login)
+        .label("unique_users"),
+        func.count(func.distinct(LoginLogModel.ip_address)).label(
+            "unique_ips"
+        ),
+        failure_reasons.label("failure_reasons"),
+    ).filter(in_window)
 
 
 class LoginLogService:
     """로그인 로그 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_login_logs(  # noqa: C901
-        db: Session,
+    async def get_login_logs(  # noqa: C901
+        db: AsyncSession,
         filters: LoginLogFilterRequest,
-    ) -> LoginLogListResponse:
+    ) -> LoginLogListResponse | CursorPage[LoginLogResponse]:
         """로그인 로그 목록을 조회합니다.
 
+        filters.cursor가 지정되면(빈 문자열은 첫 페이지) (created_at, id)
+        기준 커서 페이지네이션으로 조회하며 전체 개수는 계산하지 않습니다.
+
         Args:
-            db (Session): 데이터베이스 세션.
+            db (AsyncSession): 데이터베이스 세션.
             filters (LoginLogFilterRequest): 로그인 로그 필터링을 위한 요청 객체.
 
         Returns:
             LoginLogListResponse: 필터링된 로그인 로그 목록과 페이징 정보를 포함하는 응답 객체.
+            CursorPage[LoginLogResponse]: 커서 페이지네이션 사용 시 응답 객체.
         """
-        logger.info(f"[get_login_logs] 로그인 로그 조회 시작. 필터: {filters}")
+        logger.debug(
+            "[get_login_logs] 로그인 로그 조회 시작",
+            page=filters.page,
+            size=filters.size,
+        )
         try:
             # Construct the base query with all columns from LoginLog
-            query = db.query(
+            query = select(
                 LoginLogModel.id,
                 func.timezone(
                     "Asia/Seoul",
@@ -100,14 +168,33 @@ class LoginLogService:
             if conditions:
                 query = query.filter(and_(*conditions))
 
+            if filters.cursor is not None:
+                # 변환 전 created_at을 커서 키로 사용
+                cursor_query = keyset_paginate(
+                    query.add_columns(
+                        LoginLogModel.created_at.label("cursor_created_at")
+                    ),
+                    LoginLogModel.created_at,
+                    LoginLogModel.id,
+                    filters.cursor,
+                    filters.size,
+                )
+                rows = (await db.execute(cursor_query)).all()
+                return build_cursor_page(
+                    rows,
+                    filters.size,
+                    key=lambda row: (row.cursor_created_at, row.id),
+                    transform=LoginLogService._to_response,
+                )
+
             # 전체 개수 조회
             # When using labels, query.count() does not work as expected.
             # We need a separate query for counting.
-            count_query = db.query(func.count(LoginLogModel.id))
+            count_query = select(func.count(LoginLogModel.id))
             if conditions:
                 count_query = count_query.filter(and_(*conditions))
-            total = count_query.scalar()
-            logger.info(f"[get_login_logs] 총 {total}개의 로그인 로그 발견.")
+            total = await db.scalar(count_query)
+            logger.debug("[get_login_logs] 로그인 로그 개수", total=total)
 
             # 페이징 적용
             offset = (filters.page - 1) * filters.size
@@ -117,38 +204,15 @@ class LoginLogService:
                 .limit(filters.size)
             )
 
-            items = items_query.all()
+            items = (await db.execute(items_query)).all()
 
             # 응답 데이터 생성
-            login_logs = []
-            for item in items:
-                login_logs.append(
-                    LoginLogResponse(
-                        id=item.id,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at,
-                        created_by=item.created_by,
-                        updated_by=item.updated_by,
-                        user_id=item.user_id,
-                        user_type=item.user_type,
-                        tenant_context=item.tenant_context,
-                        username=item.username,
-                        attempt_type=item.attempt_type,
-                        success=item.success,
-                        failure_reason=item.failure_reason,
-                        session_id=item.session_id,
-                        ip_address=str(item.ip_address),
-                        user_agent=item.user_agent,
-                        country_code=item.country_code,
-                        city=item.city,
-                        mfa_used=item.mfa_used,
-                        mfa_method=item.mfa_method,
-                    )
-                )
+            login_logs = [LoginLogService._to_response(item) for item in items]
 
             pages = (total + filters.size - 1) // filters.size
-            logger.info(
-                f"[get_login_logs] 로그인 로그 조회 성공. {len(login_logs)}개 반환."
+            logger.debug(
+                "[get_login_logs] 로그인 로그 조회 성공",
+                count=len(login_logs),
             )
             return LoginLogListResponse(
                 items=login_logs,
@@ -165,101 +229,91 @@ class LoginLogService:
             raise
 
     @staticmethod
-    def get_login_stats(db: Session, days: int = 7) -> dict:
+    def _to_response(item) -> LoginLogResponse:
+        """조회 행을 로그인 로그 응답으로 변환"""
+        return LoginLogResponse(
+            id=item.id,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            created_by=item.created_by,
+            updated_by=item.updated_by,
+            user_id=item.user_id,
+            user_type=item.user_type,
+            tenant_context=item.tenant_context,
+            username=item.username,
+            attempt_type=item.attempt_type,
+            success=item.success,
+            failure_reason=item.failure_reason,
+            session_id=item.session_id,
+            ip_address=str(item.ip_address),
+            user_agent=item.user_agent,
+            country_code=item.country_code,
+            city=item.city,
+            mfa_used=item.mfa_used,
+            mfa_method=item.mfa_method,
+        )
+
+    @staticmethod
+    async def get_login_stats(db: AsyncSession, days: int = 7) -> dict:
         """지정된 기간 동안의 로그인 통계를 조회합니다.
 
+        집계는 FILTER 절을 사용한 단일 쿼리로 처리하며, 결과는 기간(days)별로
+        LOGIN_STATS_CACHE_TTL_SECONDS 동안 캐시됩니다.
+        LOGIN_STATS_ROLLUP_ENABLED이고 기간이 하루를 넘으면 일 단위 집계
+        테이블을 사용합니다.
+
         Args:
-            db (Session): 데이터베이스 세션.
+            db (AsyncSession): 데이터베이스 세션.
             days (int, optional): 통계를 조회할 기간 (일 단위). 기본값은 7일.
 
         Returns:
             dict: 로그인 통계 데이터.
         """
-        logger.info(f"[get_login_stats] 로그인 통계 조회 시작. 기간: {days}일")
-        try:
-            from datetime import timedelta
+        logger.debug("[get_login_stats] 로그인 통계 조회 시작", days=days)
+        cached = _stats_cache.get(days)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
 
-            start_date = datetime.now() - timedelta(days=days)
-
-            # 총 로그인 시도 수
-            total_attempts = (
-                db.query(func.count(LoginLogModel.id))
-                .filter(LoginLogModel.created_at >= start_date)
-                .scalar()
-            )
-
-            # 성공한 로그인 수
-            successful_logins = (
-                db.query(func.count(LoginLogModel.id))
-                .filter(
-                    LoginLogModel.created_at >= start_date,
-                    LoginLogModel.success == True,  # noqa: E712
-                    LoginLogModel.attempt_type == "LOGIN",
-                )
-                .scalar()
-            )
-
-            # 실패한 로그인 수
-            failed_logins = (
-                db.query(func.count(LoginLogModel.id))
-                .filter(
-                    LoginLogModel.created_at >= start_date,
-                    LoginLogModel.success == False,  # noqa: E712
-                    LoginLogModel.attempt_type == "LOGIN",
-                )
-                .scalar()
-            )
-
-            # 고유 사용자 수
-            unique_users = (
-                db.query(func.count(func.distinct(LoginLogModel.user_id)))
-                .filter(
-                    LoginLogModel.created_at >= start_date,
-                    LoginLogModel.success == True,  # noqa: E712
-                    LoginLogModel.attempt_type == "LOGIN",
-                )
-                .scalar()
-            )
-
-            # 고유 IP 수
-            unique_ips = (
-                db.query(func.count(func.distinct(LoginLogModel.ip_address)))
-                .filter(LoginLogModel.created_at >= start_date)
-                .scalar()
-            )
+        try:
+            now = datetime.now(UTC)
+            start_date = now - timedelta(days=days)
 
-            # 실패 사유별 통계
-            failure_reasons = (
-                db.query(
-                    LoginLogModel.failure_reason, func.count(LoginLogModel.id)
+            if settings.LOGIN_STATS_ROLLUP_ENABLED and days > 1:
+                counts = await get_login_stats_from_rollup(
+                    db, start_date, now
                 )
-                .filter(
-                    LoginLogModel.created_at >= start_date,
-                    LoginLogModel.success == False,  # noqa: E712
-                    LoginLogModel.failure_reason.isnot(None),
-                )
-                .group_by(LoginLogModel.failure_reason)
-                .all()
-            )
-
+            else:
+                row = (
+                    await db.execute(_login_stats_query(start_date))
+                ).one()
+                counts = row._asdict()
+
+            total_attempts = counts["total_attempts"] or 0
+            successful_logins = counts["successful_logins"] or 0
             stats = {
                 "period_days": days,
-                "total_attempts": total_attempts or 0,
-                "successful_logins": successful_logins or 0,
-                "failed_logins": failed_logins or 0,
-                "unique_users": unique_users or 0,
-                "unique_ips": unique_ips or 0,
+                "total_attempts": total_attempts,
+                "successful_logins": successful_logins,
+                "failed_logins": counts["failed_logins"] or 0,
+                "unique_users": counts["unique_users"] or 0,
+                "unique_ips": counts["unique_ips"] or 0,
                 "success_rate": (
                     (successful_logins / total_attempts * 100)
                     if total_attempts > 0
                     else 0
                 ),
-                "failure_reasons": {
-                    reason: count for reason, count in failure_reasons
-                },
+                "failure_reasons": dict(counts["failure_reasons"] or {}),
             }
-            logger.info(
-                f"[get_login_stats] 로그인 통계 조회 성공. 통계: {stats}"
+
+            if settings.LOGIN_STATS_CACHE_TTL_SECONDS > 0:
+                _stats_cache[days] = (
+                    time.monotonic() + settings.LOGIN_STATS_CACHE_TTL_SECONDS,
+                    stats,
+                )
+            logger.debug(
+                "[get_login_stats] 로그인 통계 조회 성공",
+                days=days,
+                total_attempts=total_attempts,
             )
             return stats
         except Exception as e:
@@ -270,42 +324,39 @@ class LoginLogService:
             raise
 
     @staticmethod
-    def get_login_logs_list(
-        db: Session, skip: int = 0, limit: int = 100
+    async def get_login_logs_list(
+        db: AsyncSession, skip: int = 0, limit: int = 100
     ) -> list[LoginLogModel]:
         """
         로그인 로그 목록을 조회합니다.
         """
         try:
-            login_logs = (
-                db.query(LoginLogModel).offset(skip).limit(limit).all()
+            result = await db.scalars(
+                select(LoginLogModel).offset(skip).limit(limit)
             )
-            return login_logs
+            return list(result.all())
         except SQLAlchemyError as e:
             logger.error(f"로그인 로그 목록 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def get_login_log_by_id(
-        db: Session, login_log_id: str
+    async def get_login_log_by_id(
+        db: AsyncSession, login_log_id: str
     ) -> LoginLogModel | None:
         """
         ID로 특정 로그인 로그를 조회합니다.
         """
         try:
-            login_log = (
-                db.query(LoginLogModel)
-                .filter(LoginLogModel.id == login_log_id)
-                .first()
+            return await db.scalar(
+                select(LoginLogModel).filter(LoginLogModel.id == login_log_id)
             )
-            return login_log
         except SQLAlchemyError as e:
             logger.error(f"로그인 로그 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def create_login_log(
-        db: Session, login_log_data: LoginLogCreate
+    async def create_login_log(
+        db: AsyncSession, login_log_data: LoginLogCreate
     ) -> LoginLogModel:
         """
         새로운 로그인 로그를 생성합니다.
@@ -328,17 +379,17 @@ class LoginLogService:
                 mfa_method=login_log_data.mfa_method,
             )
             db.add(db_login_log)
-            db.commit()
-            db.refresh(db_login_log)
+            await db.commit()
+            await db.refresh(db_login_log)
             return db_login_log
         except SQLAlchemyError as e:
             logger.error(f"로그인 로그 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_login_log(
-        db: Session,
+    async def update_login_log(
+        db: AsyncSession,
         login_log_id: str,
         login_log_data: LoginLogUpdate,
     ) -> LoginLogModel | None:
@@ -346,10 +397,8 @@ class LoginLogService:
         로그인 로그 정보를 수정합니다.
         """
         try:
-            db_login_log = (
-                db.query(LoginLogModel)
-                .filter(LoginLogModel.id == login_log_id)
-                .first()
+            db_login_log = await LoginLogService.get_login_log_by_id(
+                db, login_log_id
             )
             if not db_login_log:
                 return None
@@ -358,32 +407,30 @@ class LoginLogService:
             for field, value in update_data.items():
                 setattr(db_login_log, field, value)
 
-            db.commit()
-            db.refresh(db_login_log)
+            await db.commit()
+            await db.refresh(db_login_log)
             return db_login_log
         except SQLAlchemyError as e:
             logger.error(f"로그인 로그 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_login_log(db: Session, login_log_id: str) -> bool:
+    async def delete_login_log(db: AsyncSession, login_log_id: str) -> bool:
         """
         로그인 로그를 삭제합니다.
         """
         try:
-            db_login_log = (
-                db.query(LoginLogModel)
-                .filter(LoginLogModel.id == login_log_id)
-                .first()
+            db_login_log = await LoginLogService.get_login_log_by_id(
+                db, login_log_id
             )
             if not db_login_log:
                 return False
 
-            db.delete(db_login_log)
-            db.commit()
+            await db.delete(db_login_log)
+            await db.commit()
             return True
         except SQLAlchemyError as e:
             logger.error(f"로그인 로그 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
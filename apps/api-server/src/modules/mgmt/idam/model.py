@@ -1,11 +1,11 @@
-from src.models.mgmt.idam.api_key import ApiKey
-from src.models.mgmt.idam.login_log import LoginLog
-from src.models.mgmt.idam.permission import Permission
-from src.models.mgmt.idam.role import Role
-from src.models.mgmt.idam.role_permission import RolePermission
-from src.models.mgmt.idam.session import Session
-from src.models.mgmt.idam.user import User
-from src.models.mgmt.idam.user_role import UserRole
+from src.modules.mgmt.idam.api_key.model import ApiKey
+from src.modules.mgmt.idam.login_log.model import LoginLog
+from src.modules.mgmt.idam.permission.model import Permission
+from src.modules.mgmt.idam.role.model import Role
+from src.modules.mgmt.idam.role_permission.model import RolePermission
+from src.modules.mgmt.idam.session.model import Session
+from src.modules.mgmt.idam.user.model import User
+from src.modules.mgmt.idam.user_role.model import UserRole
 
 __all__ = [
     "ApiKey",
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
+from src.core.pagination import InvalidCursorError
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import (
@@ -13,19 +15,35 @@ from .service import PermissionService
 
 router = APIRouter(prefix="/permissions", tags=["IDAM - 권한 관리"])
 
+_CURSOR_DESCRIPTION = "커서 페이지네이션 커서 (빈 값이면 첫 페이지, 미지정 시 skip/limit)"
 
-@router.get("/", response_model=EnvelopeResponse[list[PermissionResponse]])
+
+@router.get(
+    "/",
+    response_model=EnvelopeResponse[
+        list[PermissionResponse] | CursorPage[PermissionResponse]
+    ],
+)
 async def get_permissions(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     권한 목록 조회
+
+    cursor 지정 시 next_cursor를 포함한 커서 페이지를 반환합니다.
     """
     try:
-        permissions = PermissionService.get_permissions(db, skip, limit)
+        permissions = await PermissionService.get_permissions(
+            db, skip, limit, cursor=cursor
+        )
         return EnvelopeResponse(success=True, data=permissions, error=None)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -37,13 +55,15 @@ async def get_permissions(
 )
 async def get_permission(
     permission_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 권한 조회
     """
     try:
-        permission = PermissionService.get_permission_by_id(db, permission_id)
+        permission = await PermissionService.get_permission_by_id(
+            db, permission_id
+        )
         if not permission:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -65,13 +85,15 @@ async def get_permission(
 )
 async def create_permission(
     permission_data: PermissionCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     새로운 권한 생성
     """
     try:
-        permission = PermissionService.create_permission(db, permission_data)
+        permission = await PermissionService.create_permission(
+            db, permission_data
+        )
         return EnvelopeResponse(success=True, data=permission, error=None)
     except Exception as e:
         raise HTTPException(
@@ -85,13 +107,13 @@ async def create_permission(
 async def update_permission(
     permission_id: str,
     permission_data: PermissionUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     권한 정보 수정
     """
     try:
-        permission = PermissionService.update_permission(
+        permission = await PermissionService.update_permission(
             db, permission_id, permission_data
         )
         if not permission:
@@ -111,13 +133,13 @@ async def update_permission(
 @router.delete("/{permission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_permission(
     permission_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     권한 삭제
     """
     try:
-        success = PermissionService.delete_permission(db, permission_id)
+        success = await PermissionService.delete_permission(db, permission_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -25,22 +25,28 @@
 - 필요한 컬럼만 선택하는 프로젝션 쿼리
 """
 
-import logging
 import uuid
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.schemas.common.pagination import CursorPage
+from src.services.mgmt.permission_resolver import permission_resolver
 
 from .model import Permission as PermissionModel
 from .schemas import (
     PermissionCreate,
     PermissionCreateRequest,
+    PermissionResponse,
     PermissionUpdate,
     PermissionUpdateRequest,
 )
 
 # 로거 초기화
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class PermissionService:
@@ -52,19 +58,28 @@ class PermissionService:
 
     사용 예시:
         # 권한 목록 조회
-        permissions = PermissionService.get_permissions(db, skip=0, limit=10)
+        permissions = await PermissionService.get_permissions(
+            db, skip=0, limit=10
+        )
 
         # 권한 생성
-        new_permission = PermissionService.create_permission(db, permission_data)
+        new_permission = await PermissionService.create_permission(
+            db, permission_data
+        )
 
         # 권한 수정
-        updated = PermissionService.update_permission(db, perm_id, update_data)
+        updated = await PermissionService.update_permission(
+            db, perm_id, update_data
+        )
     """
 
     @staticmethod
-    def get_permissions(
-        db: Session, skip: int = 0, limit: int = 100
-    ) -> list[PermissionModel]:
+    async def get_permissions(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[PermissionModel] | CursorPage[PermissionResponse]:
         """
         전체 권한 목록을 조회합니다.
 
@@ -73,16 +88,20 @@ class PermissionService:
         적절한 limit 값을 사용하는 것을 권장합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             skip (int): 건너뛸 레코드 수 (기본값: 0)
                 - 페이지네이션의 오프셋 역할
             limit (int): 조회할 최대 레코드 수 (기본값: 100)
                 - 성능상 1000 이하 권장
+            cursor (str, optional): 커서 페이지네이션 커서
+                - 지정 시 skip 대신 (created_at, id) 키셋 조회
+                - 빈 문자열은 첫 페이지
 
         Returns:
             List[PermissionModel]: 권한 모델 리스트
                 - 각 권한은 id, permission_code, permission_name 등 포함
                 - 생성 시간 기준 내림차순 정렬
+            CursorPage[PermissionResponse]: cursor 지정 시 커서 페이지
 
         Raises:
             SQLAlchemyError: 데이터베이스 작업 중 에러 발생 시
@@ -93,7 +112,7 @@ class PermissionService:
             - LIMIT/OFFSET 사용으로 메모리 사용량 제한
         """
         try:
-            logger.info(f"권한 목록 조회 시작: skip={skip}, limit={limit}")
+            logger.debug("권한 목록 조회 시작", skip=skip, limit=limit)
 
             # 입력값 유효성 검증
             if skip < 0:
@@ -105,15 +124,34 @@ class PermissionService:
                     f"limit 값이 범위를 벗어났습니다. {limit}로 조정합니다."
                 )
 
-            permissions = (
-                db.query(PermissionModel)
+            if cursor is not None:
+                result = await db.scalars(
+                    keyset_paginate(
+                        select(PermissionModel),
+                        PermissionModel.created_at,
+                        PermissionModel.id,
+                        cursor,
+                        limit,
+                    )
+                )
+                page = build_cursor_page(
+                    result.all(),
+                    limit,
+                    key=lambda p: (p.created_at, p.id),
+                    transform=PermissionResponse.model_validate,
+                )
+                logger.debug("권한 목록 조회 완료", count=len(page.items))
+                return page
+
+            result = await db.scalars(
+                select(PermissionModel)
                 .order_by(PermissionModel.created_at.desc())
                 .offset(skip)
                 .limit(limit)
-                .all()
             )
+            permissions = list(result.all())
 
-            logger.info(f"권한 목록 조회 완료: {len(permissions)}개 조회됨")
+            logger.debug("권한 목록 조회 완료", count=len(permissions))
             return permissions
 
         except SQLAlchemyError as e:
@@ -121,8 +159,8 @@ class PermissionService:
             raise
 
     @staticmethod
-    def get_permission_by_id(
-        db: Session, permission_id: str
+    async def get_permission_by_id(
+        db: AsyncSession, permission_id: str
     ) -> PermissionModel | None:
         """
         ID로 특정 권한을 조회합니다.
@@ -131,7 +169,7 @@ class PermissionService:
         UUID 형식의 문자열을 입력받아 해당하는 권한을 반환합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             permission_id (str): 권한 ID (UUID 문자열)
                 - 36자리 UUID 형식이어야 함
                 - 예: "550e8400-e29b-41d4-a716-446655440000"
@@ -152,7 +190,7 @@ class PermissionService:
             - UUID 유효성 검증으로 잘못된 입력 차단
         """
         try:
-            logger.info(f"권한 조회 시작: permission_id={permission_id}")
+            logger.debug("권한 조회 시작", permission_id=permission_id)
 
             # UUID 형식 유효성 검증
             try:
@@ -163,15 +201,14 @@ class PermissionService:
                     f"올바르지 않은 권한 ID 형식입니다: {permission_id}"
                 )
 
-            permission = (
-                db.query(PermissionModel)
-                .filter(PermissionModel.id == uuid_obj)
-                .first()
+            permission = await db.scalar(
+                select(PermissionModel).filter(PermissionModel.id == uuid_obj)
             )
 
             if permission:
-                logger.info(
-                    f"권한 조회 완료: {permission.permission_code} ({permission.permission_name})"
+                logger.debug(
+                    "권한 조회 완료",
+                    permission_code=permission.permission_code,
                 )
             else:
                 logger.warning(
@@ -188,8 +225,8 @@ class PermissionService:
             raise
 
     @staticmethod
-    def create_permission(
-        db: Session,
+    async def create_permission(
+        db: AsyncSession,
         permission_data: PermissionCreate | PermissionCreateRequest,
     ) -> PermissionModel:
         """
@@ -199,7 +236,7 @@ class PermissionService:
         시스템 권한과 일반 권한을 구분하여 적절한 검증을 수행합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             permission_data (PermissionCreate | PermissionCreateRequest): 권한 생성 데이터
                 - permission_code: 권한 코드 (유니크, 필수)
                 - permission_name: 권한 이름 (필수)
@@ -237,7 +274,9 @@ class PermissionService:
                 resource_type="USER",
                 action="CREATE"
             )
-            new_permission = PermissionService.create_permission(db, permission_data)
+            new_permission = await PermissionService.create_permission(
+                db, permission_data
+            )
         """
         try:
             logger.info(
@@ -251,13 +290,11 @@ class PermissionService:
                 raise ValueError("권한 이름은 필수 입력사항입니다.")
 
             # 권한 코드 중복 검증
-            existing_permission = (
-                db.query(PermissionModel)
-                .filter(
+            existing_permission = await db.scalar(
+                select(PermissionModel).filter(
                     PermissionModel.permission_code
                     == permission_data.permission_code
                 )
-                .first()
             )
 
             if existing_permission:
@@ -287,8 +324,8 @@ class PermissionService:
             )
 
             db.add(db_permission)
-            db.commit()
-            db.refresh(db_permission)
+            await db.commit()
+            await db.refresh(db_permission)
 
             logger.info(
                 f"권한 생성 완료: {db_permission.permission_code} "
@@ -301,18 +338,18 @@ class PermissionService:
             raise
         except IntegrityError as e:
             logger.error(f"권한 생성 실패 (데이터 무결성): {e}")
-            db.rollback()
+            await db.rollback()
             raise ValueError(
                 "권한 코드가 이미 존재하거나 데이터 제약 조건을 위반했습니다."
             )
         except SQLAlchemyError as e:
             logger.error(f"권한 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_permission(
-        db: Session,
+    async def update_permission(
+        db: AsyncSession,
         permission_id: str,
         permission_data: PermissionUpdate | PermissionUpdateRequest,
     ) -> PermissionModel | None:
@@ -320,10 +357,10 @@ class PermissionService:
         권한 정보를 수정합니다.
         """
         try:
-            db_permission = (
-                db.query(PermissionModel)
-                .filter(PermissionModel.id == permission_id)
-                .first()
+            db_permission = await db.scalar(
+                select(PermissionModel).filter(
+                    PermissionModel.id == permission_id
+                )
             )
             if not db_permission:
                 return None
@@ -332,32 +369,34 @@ class PermissionService:
             for field, value in update_data.items():
                 setattr(db_permission, field, value)
 
-            db.commit()
-            db.refresh(db_permission)
+            await db.commit()
+            await db.refresh(db_permission)
+            permission_resolver.invalidate_all()
             return db_permission
         except SQLAlchemyError as e:
             logger.error(f"권한 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_permission(db: Session, permission_id: str) -> bool:
+    async def delete_permission(db: AsyncSession, permission_id: str) -> bool:
         """
         권한을 삭제합니다.
         """
         try:
-            db_permission = (
-                db.query(PermissionModel)
-                .filter(PermissionModel.id == permission_id)
-                .first()
+            db_permission = await db.scalar(
+                select(PermissionModel).filter(
+                    PermissionModel.id == permission_id
+                )
             )
             if not db_permission:
                 return False
 
-            db.delete(db_permission)
-            db.commit()
+            await db.delete(db_permission)
+            await db.commit()
+            permission_resolver.invalidate_all()
             return True
         except SQLAlchemyError as e:
             logger.error(f"권한 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import RoleCreateRequest, RoleResponse, RoleUpdateRequest
@@ -14,13 +14,13 @@ router = APIRouter(prefix="/roles", tags=["IDAM - 역할 관리"])
 async def get_roles(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     역할 목록 조회
     """
     try:
-        roles = RoleService.get_roles(db, skip, limit)
+        roles = await RoleService.get_roles(db, skip, limit)
         return EnvelopeResponse(success=True, data=roles, error=None)
     except Exception as e:
         raise HTTPException(
@@ -31,13 +31,13 @@ async def get_roles(
 @router.get("/{role_id}", response_model=EnvelopeResponse[RoleResponse])
 async def get_role(
     role_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 역할 조회
     """
     try:
-        role = RoleService.get_role_by_id(db, role_id)
+        role = await RoleService.get_role_by_id(db, role_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -58,13 +58,13 @@ async def get_role(
 )
 async def create_role(
     role_data: RoleCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     새로운 역할 생성
     """
     try:
-        role = RoleService.create_role(db, role_data)
+        role = await RoleService.create_role(db, role_data)
         return EnvelopeResponse(success=True, data=role, error=None)
     except Exception as e:
         raise HTTPException(
@@ -76,13 +76,13 @@ async def create_role(
 async def update_role(
     role_id: str,
     role_data: RoleUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     역할 정보 수정
     """
     try:
-        role = RoleService.update_role(db, role_id, role_data)
+        role = await RoleService.update_role(db, role_id, role_data)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -99,13 +99,13 @@ async def update_role(
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_role(
     role_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     역할 삭제
     """
     try:
-        success = RoleService.delete_role(db, role_id)
+        success = await RoleService.delete_role(db, role_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
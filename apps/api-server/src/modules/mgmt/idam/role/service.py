@@ -1,7 +1,10 @@
 import logging
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.mgmt.permission_resolver import permission_resolver
 
 from .model import Role as RoleModel
 from .schemas import RoleCreate, RoleUpdate
@@ -13,33 +16,40 @@ class RoleService:
     """역할 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_roles(
-        db: Session, skip: int = 0, limit: int = 100
+    async def get_roles(
+        db: AsyncSession, skip: int = 0, limit: int = 100
     ) -> list[RoleModel]:
         """
         역할 목록을 조회합니다.
         """
         try:
-            roles = db.query(RoleModel).offset(skip).limit(limit).all()
-            return roles
+            result = await db.scalars(
+                select(RoleModel).offset(skip).limit(limit)
+            )
+            return list(result.all())
         except SQLAlchemyError as e:
             logger.error(f"역할 목록 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def get_role_by_id(db: Session, role_id: str) -> RoleModel | None:
+    async def get_role_by_id(
+        db: AsyncSession, role_id: str
+    ) -> RoleModel | None:
         """
         ID로 특정 역할을 조회합니다.
         """
         try:
-            role = db.query(RoleModel).filter(RoleModel.id == role_id).first()
-            return role
+            return await db.scalar(
+                select(RoleModel).filter(RoleModel.id == role_id)
+            )
         except SQLAlchemyError as e:
             logger.error(f"역할 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def create_role(db: Session, role_data: RoleCreate) -> RoleModel:
+    async def create_role(
+        db: AsyncSession, role_data: RoleCreate
+    ) -> RoleModel:
         """
         새로운 역할을 생성합니다.
         """
@@ -55,25 +65,23 @@ class RoleService:
                 status=role_data.status,
             )
             db.add(db_role)
-            db.commit()
-            db.refresh(db_role)
+            await db.commit()
+            await db.refresh(db_role)
             return db_role
         except SQLAlchemyError as e:
             logger.error(f"역할 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_role(
-        db: Session, role_id: str, role_data: RoleUpdate
+    async def update_role(
+        db: AsyncSession, role_id: str, role_data: RoleUpdate
     ) -> RoleModel | None:
         """
         역할 정보를 수정합니다.
         """
         try:
-            db_role = (
-                db.query(RoleModel).filter(RoleModel.id == role_id).first()
-            )
+            db_role = await RoleService.get_role_by_id(db, role_id)
             if not db_role:
                 return None
 
@@ -81,30 +89,30 @@ class RoleService:
             for field, value in update_data.items():
                 setattr(db_role, field, value)
 
-            db.commit()
-            db.refresh(db_role)
+            await db.commit()
+            await db.refresh(db_role)
+            permission_resolver.invalidate_all()
             return db_role
         except SQLAlchemyError as e:
             logger.error(f"역할 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_role(db: Session, role_id: str) -> bool:
+    async def delete_role(db: AsyncSession, role_id: str) -> bool:
         """
         역할을 삭제합니다.
         """
         try:
-            db_role = (
-                db.query(RoleModel).filter(RoleModel.id == role_id).first()
-            )
+            db_role = await RoleService.get_role_by_id(db, role_id)
             if not db_role:
                 return False
 
-            db.delete(db_role)
-            db.commit()
+            await db.delete(db_role)
+            await db.commit()
+            permission_resolver.invalidate_all()
             return True
         except SQLAlchemyError as e:
             logger.error(f"역할 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import RolePermissionCreateRequest, RolePermissionResponse
@@ -18,13 +18,13 @@ async def get_role_permissions(
     role_id: str,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 역할의 권한 매핑 목록 조회
     """
     try:
-        role_permissions = RolePermissionService.get_role_permissions(
+        role_permissions = await RolePermissionService.get_role_permissions(
             db, role_id, skip, limit
         )
         return EnvelopeResponse(
@@ -43,7 +43,7 @@ async def get_role_permissions(
 )
 async def assign_permission_to_role(
     role_permission_data: RolePermissionCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     역할에 권한 할당
@@ -56,8 +56,10 @@ async def assign_permission_to_role(
             role_id=role_permission_data.role_id,
             permission_id=role_permission_data.permission_id,
         )
-        role_permission = RolePermissionService.assign_permission_to_role(
-            db, service_data
+        role_permission = (
+            await RolePermissionService.assign_permission_to_role(
+                db, service_data
+            )
         )
         return EnvelopeResponse(success=True, data=role_permission, error=None)
     except ValueError as e:
@@ -74,13 +76,13 @@ async def assign_permission_to_role(
 async def unassign_permission_from_role(
     role_id: str,
     permission_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     역할로부터 권한 해제
     """
     try:
-        success = RolePermissionService.unassign_permission_from_role(
+        success = await RolePermissionService.unassign_permission_from_role(
             db, role_id, permission_id
         )
         if not success:
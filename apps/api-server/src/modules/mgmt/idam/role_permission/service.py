@@ -1,7 +1,10 @@
 import logging
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.mgmt.permission_resolver import permission_resolver
 
 from ..permission.model import Permission as PermissionModel
 from ..role.model import Role as RoleModel
@@ -16,45 +19,43 @@ class RolePermissionService:
     """역할-권한 매핑 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_role_permissions(
-        db: Session, role_id: str, skip: int = 0, limit: int = 100
+    async def get_role_permissions(
+        db: AsyncSession, role_id: str, skip: int = 0, limit: int = 100
     ) -> list[RolePermissionModel]:
         """
         특정 역할의 권한 매핑 목록을 조회합니다.
         """
         try:
-            role_permissions = (
-                db.query(RolePermissionModel)
+            result = await db.scalars(
+                select(RolePermissionModel)
                 .filter(RolePermissionModel.role_id == role_id)
                 .offset(skip)
                 .limit(limit)
-                .all()
             )
-            return role_permissions
+            return list(result.all())
         except SQLAlchemyError as e:
             logger.error(f"역할 권한 매핑 목록 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def assign_permission_to_role(
-        db: Session, role_permission_data: RolePermissionCreate
+    async def assign_permission_to_role(
+        db: AsyncSession, role_permission_data: RolePermissionCreate
     ) -> RolePermissionModel:
         """
         역할에 권한을 할당합니다.
         """
         try:
             # 역할 및 권한 존재 여부 확인
-            role = (
-                db.query(RoleModel)
-                .filter(RoleModel.id == role_permission_data.role_id)
-                .first()
+            role = await db.scalar(
+                select(RoleModel).filter(
+                    RoleModel.id == role_permission_data.role_id
+                )
             )
-            permission = (
-                db.query(PermissionModel)
-                .filter(
-                    PermissionModel.id == role_permission_data.permission_id
+            permission = await db.scalar(
+                select(PermissionModel).filter(
+                    PermissionModel.id
+                    == role_permission_data.permission_id
                 )
-                .first()
             )
 
             if not role:
@@ -68,15 +69,13 @@ class RolePermissionService:
                 )
 
             # 이미 할당된 권한인지 확인
-            existing_role_permission = (
-                db.query(RolePermissionModel)
-                .filter(
+            existing_role_permission = await db.scalar(
+                select(RolePermissionModel).filter(
                     RolePermissionModel.role_id
                     == role_permission_data.role_id,
                     RolePermissionModel.permission_id
                     == role_permission_data.permission_id,
                 )
-                .first()
             )
             if existing_role_permission:
                 raise ValueError(
@@ -88,39 +87,39 @@ class RolePermissionService:
                 permission_id=role_permission_data.permission_id,
             )
             db.add(db_role_permission)
-            db.commit()
-            db.refresh(db_role_permission)
+            await db.commit()
+            await db.refresh(db_role_permission)
+            permission_resolver.invalidate_all()
             return db_role_permission
         except SQLAlchemyError as e:
             logger.error(f"역할 권한 할당 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def unassign_permission_from_role(
-        db: Session, role_id: str, permission_id: str
+    async def unassign_permission_from_role(
+        db: AsyncSession, role_id: str, permission_id: str
     ) -> bool:
         """
         역할로부터 권한을 해제합니다.
         """
         try:
-            db_role_permission = (
-                db.query(RolePermissionModel)
-                .filter(
+            db_role_permission = await db.scalar(
+                select(RolePermissionModel).filter(
                     RolePermissionModel.role_id == role_id,
                     RolePermissionModel.permission_id == permission_id,
                 )
-                .first()
             )
             if not db_role_permission:
                 return False
 
-            db.delete(db_role_permission)
-            db.commit()
+            await db.delete(db_role_permission)
+            await db.commit()
+            permission_resolver.invalidate_all()
             return True
         except SQLAlchemyError as e:
             logger.error(f"역할 권한 해제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
 
@@ -1,14 +1,16 @@
 import logging
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async, get_mgmt_db_readonly
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import (
     SessionFilterRequest,
     SessionListResponse,
+    SessionResponse,
     SessionRevokeRequest,
     SessionStatsResponse,
 )
@@ -18,7 +20,12 @@ router = APIRouter(prefix="/sessions", tags=["IDAM - 세션 관리"])
 logger = logging.getLogger("sessions-router")
 
 
-@router.get("/", response_model=EnvelopeResponse[SessionListResponse])
+@router.get(
+    "/",
+    response_model=EnvelopeResponse[
+        SessionListResponse | CursorPage[SessionResponse]
+    ],
+)
 async def get_sessions(
     user_id: str | None = Query(None),
     username: str | None = Query(None),
@@ -28,7 +35,8 @@ async def get_sessions(
     end_date: str | None = Query(None),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_mgmt_db_readonly),
 ):
     """
     세션 목록 조회
@@ -47,6 +55,8 @@ async def get_sessions(
     - **end_date**: 종료 날짜 (ISO 8601 형식, 선택)
     - **page**: 페이지 번호 (기본값: 1, 최소: 1)
     - **size**: 페이지당 항목 수 (기본값: 20, 범위: 1-100)
+    - **cursor**: 커서 페이지네이션 커서 (선택)
+      - 빈 값이면 첫 페이지, 지정 시 page 대신 사용하며 total은 계산하지 않음
 
     **반환값:**
     - **success**: 요청 성공 여부
@@ -56,6 +66,7 @@ async def get_sessions(
       - page: 현재 페이지
       - size: 페이지 크기
       - pages: 총 페이지 수
+      - cursor 지정 시 items, next_cursor, has_more, size
     - **error**: 오류 정보 (실패 시)
 
     **예외:**
@@ -88,10 +99,11 @@ async def get_sessions(
             end_date=parsed_end_date,
             page=page,
             size=size,
+            cursor=cursor,
         )
 
-        result = SessionService.get_sessions(db, filters)
-        logger.info(f"[GET_SESSIONS] 성공: {result.total}개 조회")
+        result = await SessionService.get_sessions(db, filters)
+        logger.info(f"[GET_SESSIONS] 성공: {len(result.items)}개 반환")
         return EnvelopeResponse(success=True, data=result, error=None)
 
     except Exception as e:
@@ -103,7 +115,7 @@ async def get_sessions(
 
 @router.get("/stats", response_model=EnvelopeResponse[SessionStatsResponse])
 async def get_session_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_readonly),
 ):
     """
     세션 통계 조회
@@ -126,7 +138,7 @@ async def get_session_stats(
     """
     logger.info("[GET_SESSION_STATS] 요청")
     try:
-        stats = SessionService.get_session_stats(db)
+        stats = await SessionService.get_session_stats(db)
         logger.info("[GET_SESSION_STATS] 성공")
         return EnvelopeResponse(success=True, data=stats, error=None)
 
@@ -140,7 +152,7 @@ async def get_session_stats(
 @router.post("/revoke", response_model=EnvelopeResponse[dict])
 async def revoke_sessions(
     request: SessionRevokeRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     세션 무효화
@@ -167,7 +179,9 @@ async def revoke_sessions(
     """
     logger.info(f"[REVOKE_SESSIONS] 요청: {len(request.session_ids)}개 세션")
     try:
-        revoked_count = SessionService.revoke_sessions(db, request.session_ids)
+        revoked_count = await SessionService.revoke_sessions(
+            db, request.session_ids
+        )
         logger.info(f"[REVOKE_SESSIONS] 성공: {revoked_count}개 무효화")
         return EnvelopeResponse(
             success=True,
@@ -184,7 +198,7 @@ async def revoke_sessions(
 
 @router.post("/cleanup", response_model=EnvelopeResponse[dict])
 async def cleanup_expired_sessions(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     만료된 세션 정리
@@ -207,7 +221,7 @@ async def cleanup_expired_sessions(
     """
     logger.info("[CLEANUP_SESSIONS] 요청")
     try:
-        cleaned_count = SessionService.cleanup_expired_sessions(db)
+        cleaned_count = await SessionService.cleanup_expired_sessions(db)
         logger.info(f"[CLEANUP_SESSIONS] 성공: {cleaned_count}개 정리")
         return EnvelopeResponse(
             success=True,
@@ -140,6 +140,7 @@ class SessionFilterRequest(BaseModel):
     end_date: datetime | None = None
     page: int = 1
     size: int = 20
+    cursor: str | None = None  # 지정 시 page 대신 커서 페이지네이션
 
 
 class SessionRevokeRequest(BaseModel):
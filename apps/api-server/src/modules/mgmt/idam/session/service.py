@@ -1,9 +1,18 @@
 import logging
+import time
 from datetime import datetime
 
-from sqlalchemy import and_, desc, func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.schemas.common.pagination import CursorPage
+from src.services.mgmt.session_cache import session_cache
+from src.services.mgmt.session_revocation import session_revocation
+from src.services.mgmt.session_stats import session_stats, snapshot
 
 from ..user.model import User
 from .model import Session as SessionModel
@@ -21,138 +30,235 @@ from .schemas import (
 # 로거 초기화
 logger = logging.getLogger(__name__)
 
+# 세션 통계 캐시: (만료 시각(monotonic), 통계)
+_stats_cache: tuple[float, SessionStatsResponse] | None = None
+
+
+def _session_stats_query():
+    """상태별 세션 수와 활성 세션의 고유 사용자/IP 수를 한 번에 계산"""
+    is_active = SessionModel.status == "ACTIVE"
+    return select(
+        func.count().filter(is_active).label("active_sessions"),
+        func.count()
+        .filter(SessionModel.status == "EXPIRED")
+        .label("expired_sessions"),
+        func.count()
+        .filter(SessionModel.status == "REVOKED")
+        .label("revoked_sessions"),
+        func.count(func.distinct(SessionModel.user_id))
+        .filter(is_active)
+        .label("unique_users"),
+        func.count(func.distinct(SessionModel.ip_address))
+        .filter(is_active)
+        .label("unique_ips"),
+        func.count()
+        .filter(is_active, SessionModel.mfa_verified == True)  # noqa: E712
+        .label("mfa_verified_sessions"),
+    )
+
+
+# 세션 목록 응답에 필요한 컬럼 (사용자 컬럼과 이름이 겹치지 않도록 명시)
+_SESSION_LIST_COLUMNS = (
+    SessionModel.id,
+    SessionModel.created_at,
+    SessionModel.updated_at,
+    SessionModel.created_by,
+    SessionModel.updated_by,
+    SessionModel.session_id,
+    SessionModel.user_id,
+    SessionModel.fingerprint,
+    SessionModel.user_agent,
+    SessionModel.ip_address,
+    SessionModel.country_code,
+    SessionModel.city,
+    SessionModel.status,
+    SessionModel.expires_at,
+    SessionModel.last_activity_at,
+    SessionModel.mfa_verified,
+    SessionModel.mfa_verified_at,
+)
+
 
 class SessionService:
     """세션 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_sessions(
-        db: Session,
+    async def get_sessions(
+        db: AsyncSession,
         filters: SessionFilterRequest,
-    ) -> SessionListResponse:
-        """세션 목록 조회"""
-        try:
-            query = db.query(SessionModel)
-
-            # 필터 적용
-            conditions = []
+    ) -> SessionListResponse | CursorPage[SessionResponse]:
+        """세션 목록 조회
 
-            if filters.user_id:
-                conditions.append(SessionModel.user_id == filters.user_id)
+        세션 컬럼과 사용자 정보(username/email/full_name)를 하나의 조인
+        쿼리로 조회하고, 전체 개수는 윈도우 함수(count(*) OVER ())로 함께
+        계산하여 페이지당 쿼리 수를 일정하게 유지합니다.
 
-            if filters.username:
-                # 서브쿼리를 사용하여 사용자명으로 필터링
-                user_subquery = (
-                    db.query(User.id)
-                    .filter(User.username.ilike(f"%{filters.username}%"))
-                    .subquery()
-                )
-                conditions.append(
-                    SessionModel.user_id.in_(db.query(user_subquery.c.id))
-                )
+        filters.cursor가 지정되면(빈 문자열은 첫 페이지)
+        (last_activity_at, id) 기준 커서 페이지네이션으로 조회하며 전체
+        개수는 계산하지 않습니다.
+        """
+        try:
+            conditions = SessionService._list_conditions(filters)
+            query = select(
+                *_SESSION_LIST_COLUMNS,
+                User.username,
+                User.email,
+                User.full_name,
+            ).outerjoin(User, User.id == SessionModel.user_id)
 
-            if filters.status:
-                conditions.append(SessionModel.status == filters.status)
+            if conditions:
+                query = query.filter(and_(*conditions))
 
-            if filters.ip_address:
-                conditions.append(
-                    SessionModel.ip_address.like(f"{filters.ip_address}%")
+            if filters.cursor is not None:
+                return await SessionService._get_session_cursor_page(
+                    db, query, filters
                 )
+            return await SessionService._get_session_offset_page(
+                db, query, conditions, filters
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"세션 목록 조회 중 데이터베이스 에러: {e}")
+            raise
 
-            if filters.start_date:
-                conditions.append(
-                    SessionModel.created_at >= filters.start_date
-                )
+    @staticmethod
+    def _list_conditions(filters: SessionFilterRequest) -> list:
+        """세션 목록 필터 조건"""
+        conditions = []
 
-            if filters.end_date:
-                conditions.append(SessionModel.created_at <= filters.end_date)
+        if filters.user_id:
+            conditions.append(SessionModel.user_id == filters.user_id)
 
-            if conditions:
-                query = query.filter(and_(*conditions))
+        if filters.username:
+            conditions.append(User.username.ilike(f"%{filters.username}%"))
 
-            # 전체 개수 조회
-            total = query.count()
+        if filters.status:
+            conditions.append(SessionModel.status == filters.status)
 
-            # 페이징 적용
-            offset = (filters.page - 1) * filters.size
-            items_query = (
-                query.order_by(desc(SessionModel.last_activity_at))
-                .offset(offset)
-                .limit(filters.size)
+        if filters.ip_address:
+            conditions.append(
+                SessionModel.ip_address.like(f"{filters.ip_address}%")
             )
 
-            items = items_query.all()
+        if filters.start_date:
+            conditions.append(SessionModel.created_at >= filters.start_date)
 
-            # 응답 데이터 생성
-            sessions = []
-            for session in items:
-                # User 정보 조회
-                user = (
-                    db.query(User).filter(User.id == session.user_id).first()
-                )
+        if filters.end_date:
+            conditions.append(SessionModel.created_at <= filters.end_date)
 
-                sessions.append(
-                    SessionResponse(
-                        id=session.id,
-                        created_at=session.created_at,
-                        updated_at=session.updated_at,
-                        created_by=session.created_by,
-                        updated_by=session.updated_by,
-                        session_id=(
-                            session.session_id[:20] + "..."
-                            if session.session_id
-                            and len(session.session_id) > 20
-                            else session.session_id
-                        ),
-                        user_id=session.user_id,
-                        fingerprint=session.fingerprint,
-                        user_agent=session.user_agent,
-                        ip_address=str(session.ip_address),
-                        country_code=session.country_code,
-                        city=session.city,
-                        status=session.status,
-                        expires_at=session.expires_at,
-                        last_activity_at=session.last_activity_at,
-                        mfa_verified=session.mfa_verified,
-                        mfa_verified_at=session.mfa_verified_at,
-                        username=user.username if user else None,
-                        email=user.email if user else None,
-                        full_name=user.full_name if user else None,
-                    )
-                )
+        return conditions
 
-            pages = (total + filters.size - 1) // filters.size
+    @staticmethod
+    async def _get_session_cursor_page(
+        db: AsyncSession, query, filters: SessionFilterRequest
+    ) -> CursorPage[SessionResponse]:
+        """(last_activity_at, id) 기준 커서 페이지 조회 (전체 개수 없음)"""
+        cursor_query = keyset_paginate(
+            query,
+            SessionModel.last_activity_at,
+            SessionModel.id,
+            filters.cursor,
+            filters.size,
+        )
+        rows = (await db.execute(cursor_query)).mappings().all()
+        return build_cursor_page(
+            rows,
+            filters.size,
+            key=lambda row: (row["last_activity_at"], row["id"]),
+            transform=SessionService._to_response,
+        )
 
-            return SessionListResponse(
-                items=sessions,
-                total=total,
-                page=filters.page,
-                size=filters.size,
-                pages=pages,
+    @staticmethod
+    async def _get_session_offset_page(
+        db: AsyncSession,
+        query,
+        conditions: list,
+        filters: SessionFilterRequest,
+    ) -> SessionListResponse:
+        """페이지 번호 기준 조회 (전체 개수는 윈도우 함수로 함께 계산)"""
+        offset = (filters.page - 1) * filters.size
+        items_query = (
+            query.add_columns(func.count().over().label("total_count"))
+            .order_by(desc(SessionModel.last_activity_at))
+            .offset(offset)
+            .limit(filters.size)
+        )
+
+        rows = (await db.execute(items_query)).mappings().all()
+
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset == 0:
+            total = 0
+        else:
+            # 마지막 페이지를 넘어선 요청만 별도 개수 조회
+            count_query = select(func.count(SessionModel.id)).outerjoin(
+                User, User.id == SessionModel.user_id
             )
-        except SQLAlchemyError as e:
-            logger.error(f"세션 목록 조회 중 데이터베이스 에러: {e}")
-            raise
+            if conditions:
+                count_query = count_query.filter(and_(*conditions))
+            total = await db.scalar(count_query) or 0
+
+        # 응답 데이터 생성
+        sessions = [SessionService._to_response(row) for row in rows]
+
+        pages = (total + filters.size - 1) // filters.size
+
+        return SessionListResponse(
+            items=sessions,
+            total=total,
+            page=filters.page,
+            size=filters.size,
+            pages=pages,
+        )
 
     @staticmethod
-    def get_session_by_id(db: Session, session_id: str) -> SessionModel | None:
+    def _to_response(row) -> SessionResponse:
+        """조회 행(mapping)을 세션 응답으로 변환"""
+        return SessionResponse(
+            id=row["id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            created_by=row["created_by"],
+            updated_by=row["updated_by"],
+            session_id=(
+                row["session_id"][:20] + "..."
+                if row["session_id"] and len(row["session_id"]) > 20
+                else row["session_id"]
+            ),
+            user_id=row["user_id"],
+            fingerprint=row["fingerprint"],
+            user_agent=row["user_agent"],
+            ip_address=str(row["ip_address"]),
+            country_code=row["country_code"],
+            city=row["city"],
+            status=row["status"],
+            expires_at=row["expires_at"],
+            last_activity_at=row["last_activity_at"],
+            mfa_verified=row["mfa_verified"],
+            mfa_verified_at=row["mfa_verified_at"],
+            username=row["username"],
+            email=row["email"],
+            full_name=row["full_name"],
+        )
+
+    @staticmethod
+    async def get_session_by_id(
+        db: AsyncSession, session_id: str
+    ) -> SessionModel | None:
         """
         ID로 특정 세션을 조회합니다.
         """
         try:
-            session = (
-                db.query(SessionModel)
-                .filter(SessionModel.id == session_id)
-                .first()
+            return await db.scalar(
+                select(SessionModel).filter(SessionModel.id == session_id)
             )
-            return session
         except SQLAlchemyError as e:
             logger.error(f"세션 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def create_session(
-        db: Session, session_data: SessionCreate | SessionCreateRequest
+    async def create_session(
+        db: AsyncSession, session_data: SessionCreate | SessionCreateRequest
     ) -> SessionModel:
         """
         새로운 세션을 생성합니다.
@@ -173,17 +279,18 @@ class SessionService:
                 mfa_verified_at=session_data.mfa_verified_at,
             )
             db.add(db_session)
-            db.commit()
-            db.refresh(db_session)
+            await db.commit()
+            await db.refresh(db_session)
+            session_stats.record((None, snapshot(db_session)))
             return db_session
         except SQLAlchemyError as e:
             logger.error(f"세션 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_session(
-        db: Session,
+    async def update_session(
+        db: AsyncSession,
         session_id: str,
         session_data: SessionUpdate | SessionUpdateRequest,
     ) -> SessionModel | None:
@@ -191,147 +298,149 @@ class SessionService:
         세션 정보를 수정합니다.
         """
         try:
-            db_session = (
-                db.query(SessionModel)
-                .filter(SessionModel.id == session_id)
-                .first()
+            db_session = await SessionService.get_session_by_id(
+                db, session_id
             )
             if not db_session:
                 return None
 
+            before = snapshot(db_session)
             update_data = session_data.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(db_session, field, value)
 
-            db.commit()
-            db.refresh(db_session)
+            await db.commit()
+            await db.refresh(db_session)
+            session_hash = str(db_session.session_id)
+            await run_in_threadpool(session_cache.invalidate, session_hash)
+            # 무효화뿐 아니라 액세스 토큰에 담긴 세션 속성 변경도 DB로 검증
+            await run_in_threadpool(session_revocation.revoke, session_hash)
+            session_stats.record((before, snapshot(db_session)))
             return db_session
         except SQLAlchemyError as e:
             logger.error(f"세션 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_session(db: Session, session_id: str) -> bool:
+    async def delete_session(db: AsyncSession, session_id: str) -> bool:
         """
         세션을 삭제합니다.
         """
         try:
-            db_session = (
-                db.query(SessionModel)
-                .filter(SessionModel.id == session_id)
-                .first()
+            db_session = await SessionService.get_session_by_id(
+                db, session_id
             )
             if not db_session:
                 return False
 
-            db.delete(db_session)
-            db.commit()
+            session_hash = str(db_session.session_id)
+            before = snapshot(db_session)
+            await db.delete(db_session)
+            await db.commit()
+            await run_in_threadpool(session_cache.invalidate, session_hash)
+            await run_in_threadpool(session_revocation.revoke, session_hash)
+            session_stats.record((before, None))
             return True
         except SQLAlchemyError as e:
             logger.error(f"세션 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def get_session_stats(db: Session) -> SessionStatsResponse:
-        """세션 통계 조회"""
-        try:
-            # 활성 세션 수
-            active_sessions = (
-                db.query(func.count(SessionModel.id))
-                .filter(SessionModel.status == "ACTIVE")
-                .scalar()
-            )
-
-            # 만료된 세션 수
-            expired_sessions = (
-                db.query(func.count(SessionModel.id))
-                .filter(SessionModel.status == "EXPIRED")
-                .scalar()
-            )
-
-            # 무효화된 세션 수
-            revoked_sessions = (
-                db.query(func.count(SessionModel.id))
-                .filter(SessionModel.status == "REVOKED")
-                .scalar()
-            )
+    async def get_session_stats(db: AsyncSession) -> SessionStatsResponse:
+        """세션 통계 조회
 
-            # 고유 사용자 수 (활성 세션 기준)
-            unique_users = (
-                db.query(func.count(func.distinct(SessionModel.user_id)))
-                .filter(SessionModel.status == "ACTIVE")
-                .scalar()
-            )
-
-            # 고유 IP 수 (활성 세션 기준)
-            unique_ips = (
-                db.query(func.count(func.distinct(SessionModel.ip_address)))
-                .filter(SessionModel.status == "ACTIVE")
-                .scalar()
-            )
+        SESSION_STATS_CACHE_TTL_SECONDS 동안 결과를 캐시합니다.
+        SESSION_STATS_COUNTERS_ENABLED이면 Redis 카운터에서 O(1)로 조회하고,
+        카운터를 사용할 수 없으면 단일 집계 쿼리로 계산합니다.
+        """
+        global _stats_cache
+        if _stats_cache and _stats_cache[0] > time.monotonic():
+            return _stats_cache[1]
 
-            # MFA 인증된 세션 수
-            mfa_verified_sessions = (
-                db.query(func.count(SessionModel.id))
-                .filter(
-                    SessionModel.status == "ACTIVE",
-                    SessionModel.mfa_verified == True,  # noqa: E712
-                )
-                .scalar()
-            )
+        try:
+            counts = await session_stats.get(db)
+            if counts is None:
+                row = (await db.execute(_session_stats_query())).one()
+                counts = row._asdict()
 
-            return SessionStatsResponse(
-                active_sessions=active_sessions or 0,
-                expired_sessions=expired_sessions or 0,
-                revoked_sessions=revoked_sessions or 0,
-                unique_users=unique_users or 0,
-                unique_ips=unique_ips or 0,
-                mfa_verified_sessions=mfa_verified_sessions or 0,
+            stats = SessionStatsResponse(
+                **{key: value or 0 for key, value in counts.items()}
             )
+            if settings.SESSION_STATS_CACHE_TTL_SECONDS > 0:
+                ttl = settings.SESSION_STATS_CACHE_TTL_SECONDS
+                _stats_cache = (time.monotonic() + ttl, stats)
+            return stats
         except SQLAlchemyError as e:
             logger.error(f"세션 통계 조회 중 데이터베이스 에러: {e}")
             raise
 
     @staticmethod
-    def revoke_sessions(db: Session, session_ids: list[str]) -> int:
+    async def revoke_sessions(
+        db: AsyncSession, session_ids: list[str]
+    ) -> int:
         """세션 무효화"""
         try:
             revoked_count = 0
+            revoked_hashes = []
+            changes = []
             for session_id in session_ids:
                 # session_id는 실제로는 DB의 id이므로 해당 세션 조회
-                session = (
-                    db.query(SessionModel)
-                    .filter(
+                session = await db.scalar(
+                    select(SessionModel).filter(
                         SessionModel.id == session_id,
                         SessionModel.status == "ACTIVE",
                     )
-                    .first()
                 )
 
                 if session:
+                    before = snapshot(session)
                     session.status = "REVOKED"  # type: ignore
                     session.updated_at = datetime.utcnow()  # type: ignore
+                    revoked_hashes.append(str(session.session_id))
+                    changes.append((before, snapshot(session)))
                     revoked_count += 1
 
-            db.commit()
+            await db.commit()
+            await run_in_threadpool(session_cache.invalidate, *revoked_hashes)
+            await run_in_threadpool(session_revocation.revoke, *revoked_hashes)
+            session_stats.record(*changes)
             return revoked_count
         except SQLAlchemyError as e:
             logger.error(f"세션 무효화 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def cleanup_expired_sessions(db: Session) -> int:
+    async def cleanup_expired_sessions(db: AsyncSession) -> int:
         """만료된 세션 정리"""
         try:
-            from src.services.mgmt.session_service import (
-                SessionService as SharedSessionService,
+            result = await db.scalars(
+                select(SessionModel).filter(
+                    SessionModel.status == "ACTIVE",
+                    SessionModel.expires_at < datetime.now(),
+                )
             )
 
-            return SharedSessionService.cleanup_expired_sessions(db)
+            cleaned_count = 0
+            expired_hashes = []
+            changes = []
+            for session in result.all():
+                before = snapshot(session)
+                session.status = "EXPIRED"  # type: ignore
+                session.updated_at = datetime.now()  # type: ignore
+                expired_hashes.append(str(session.session_id))
+                changes.append((before, snapshot(session)))
+                cleaned_count += 1
+
+            await db.commit()
+            # 무상태 검증(AUTH_STATELESS_JWT) 경로도 만료를 반영하도록 무효화
+            await run_in_threadpool(session_cache.invalidate, *expired_hashes)
+            await run_in_threadpool(session_revocation.revoke, *expired_hashes)
+            session_stats.record(*changes)
+            return cleaned_count
         except SQLAlchemyError as e:
             logger.error(f"세션 정리 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
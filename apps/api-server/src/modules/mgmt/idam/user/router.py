@@ -40,11 +40,12 @@ import logging
 import time
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import (
@@ -159,12 +160,18 @@ def _handle_database_error(
         )
 
 
-@router.get("", response_model=EnvelopeResponse[UsersListResponse])
-@router.get("/", response_model=EnvelopeResponse[UsersListResponse])
+_USERS_RESPONSE = EnvelopeResponse[
+    UsersListResponse | CursorPage[UserListItemResponse]
+]
+
+
+@router.get("", response_model=_USERS_RESPONSE)
+@router.get("/", response_model=_USERS_RESPONSE)
 async def get_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     사용자 목록 조회
@@ -174,18 +181,25 @@ async def get_users(
     **매개변수:**
     - **skip**: 건너뛸 레코드 수 (기본값: 0)
     - **limit**: 조회할 최대 레코드 수 (기본값: 100)
+    - **cursor**: 커서 페이지네이션 커서 (선택)
+      - 빈 값이면 첫 페이지, 지정 시 skip 대신 사용하며 total은 계산하지 않음
 
     **반환값:**
     - **success**: 요청 성공 여부
     - **data**: 사용자 정보 배열
+      - cursor 지정 시 items, next_cursor, has_more, size
     - **error**: 오류 정보 (실패 시)
 
     **예외:**
     - 500: 서버 내부 오류
     """
     try:
-        users = UserService.get_users(db, skip=skip, limit=limit)
-        total_count = UserService.get_user_count(db)
+        if cursor is not None:
+            page = await UserService.get_users(db, limit=limit, cursor=cursor)
+            return EnvelopeResponse(success=True, data=page, error=None)
+
+        users = await UserService.get_users(db, skip=skip, limit=limit)
+        total_count = await UserService.get_user_count(db)
 
         user_responses = [
             UserListItemResponse(**user_data) for user_data in users
@@ -204,7 +218,7 @@ async def get_users(
 @router.get("/{user_id}", response_model=EnvelopeResponse[UserResponse])
 async def get_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 사용자 조회
@@ -224,7 +238,7 @@ async def get_user(
     - 500: 서버 내부 오류
     """
     try:
-        user = UserService.get_user(db, user_id=user_id)
+        user = await UserService.get_user(db, user_id=user_id)
         if user is None:
             return EnvelopeResponse(
                 success=False,
@@ -245,7 +259,7 @@ async def get_user(
 )
 async def create_user(
     user: UserCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     새 사용자 생성
@@ -270,7 +284,7 @@ async def create_user(
     - 500: 서버 내부 오류
     """
     try:
-        created_user = UserService.create_user(db=db, user=user)
+        created_user = await UserService.create_user(db=db, user=user)
         return EnvelopeResponse(success=True, data=created_user, error=None)
     except Exception as e:
         return EnvelopeResponse(
@@ -282,7 +296,7 @@ async def create_user(
 async def update_user(
     user_id: str,
     user: UserUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     사용자 정보 수정
@@ -309,7 +323,7 @@ async def update_user(
     - 500: 서버 내부 오류
     """
     try:
-        updated_user = UserService.update_user(
+        updated_user = await UserService.update_user(
             db=db, user_id=user_id, user=user
         )
         if updated_user is None:
@@ -328,7 +342,7 @@ async def update_user(
 @router.delete("/{user_id}", response_model=EnvelopeResponse[dict])
 async def delete_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     사용자 삭제
@@ -352,7 +366,7 @@ async def delete_user(
     - 관련된 로그인 기록과 세션 정보도 함께 삭제될 수 있습니다
     """
     try:
-        success = UserService.delete_user(db=db, user_id=user_id)
+        success = await UserService.delete_user(db=db, user_id=user_id)
         if not success:
             return EnvelopeResponse(
                 success=False,
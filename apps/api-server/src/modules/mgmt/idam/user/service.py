@@ -8,8 +8,13 @@
 import logging
 import uuid
 
+from sqlalchemy import func, or_, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.schemas.common.pagination import CursorPage
 
 from .model import User as UserModel
 from .schemas import UserCreate, UserUpdate
@@ -21,58 +26,74 @@ class UserService:
     """사용자 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[dict]:
+    async def _get_user_with_roles(
+        db: AsyncSession, user_id: uuid.UUID
+    ) -> UserModel | None:
+        """역할 관계를 함께 로드하여 사용자 조회 (비동기 지연 로딩 방지)"""
+        return await db.scalar(
+            select(UserModel)
+            .options(selectinload(UserModel.roles))
+            .filter(UserModel.id == user_id)
+        )
+
+    @staticmethod
+    async def get_users(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[dict] | CursorPage[dict]:
         """
         전체 사용자 목록을 조회합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             skip (int): 건너뛸 레코드 수 (기본값: 0)
             limit (int): 조회할 최대 레코드 수 (기본값: 100)
+            cursor (str, optional): 지정 시 skip 대신 (created_at, id)
+                기준 커서 페이지네이션 (빈 문자열은 첫 페이지)
 
         Returns:
             List[dict]: 사용자 정보 딕셔너리 리스트
                 (username, email, full_name, user_type 포함)
+            CursorPage[dict]: cursor 지정 시 커서 페이지
 
         Raises:
             SQLAlchemyError: 데이터베이스 작업 중 에러 발생 시
         """
         try:
             logger.info(f"사용자 목록 조회 시작: skip={skip}, limit={limit}")
-            users = (
-                db.query(
-                    UserModel.id,
-                    UserModel.username,
-                    UserModel.email,
-                    UserModel.full_name,
-                    UserModel.user_type,
-                    UserModel.created_at,
-                    UserModel.last_login_at,
-                )
-                .offset(skip)
-                .limit(limit)
-                .all()
+            query = select(
+                UserModel.id,
+                UserModel.username,
+                UserModel.email,
+                UserModel.full_name,
+                UserModel.user_type,
+                UserModel.created_at,
+                UserModel.last_login_at,
             )
-            users_data = [
-                {
-                    "id": str(user.id),
-                    "username": user.username,
-                    "email": user.email,
-                    "full_name": user.full_name,
-                    "user_type": user.user_type,
-                    "created_at": (
-                        user.created_at.isoformat()
-                        if user.created_at
-                        else None
-                    ),
-                    "last_login_at": (
-                        user.last_login_at.isoformat()
-                        if user.last_login_at
-                        else None
-                    ),
-                }
-                for user in users
-            ]
+            if cursor is not None:
+                result = await db.execute(
+                    keyset_paginate(
+                        query,
+                        UserModel.created_at,
+                        UserModel.id,
+                        cursor,
+                        limit,
+                    )
+                )
+                page = build_cursor_page(
+                    result.all(),
+                    limit,
+                    key=lambda user: (user.created_at, user.id),
+                    transform=UserService._to_list_item,
+                )
+                logger.info(f"사용자 목록 조회 완료: {len(page.items)}명")
+                return page
+
+            result = await db.execute(query.offset(skip).limit(limit))
+            users = result.all()
+            users_data = [UserService._to_list_item(user) for user in users]
             logger.info(f"사용자 목록 조회 완료: {len(users_data)}명")
             return users_data
         except SQLAlchemyError as e:
@@ -80,12 +101,29 @@ class UserService:
             raise
 
     @staticmethod
-    def get_user_count(db: Session) -> int:
+    def _to_list_item(user) -> dict:
+        """조회 행을 사용자 목록 항목 딕셔너리로 변환"""
+        return {
+            "id": str(user.id),
+            "username": user.username,
+            "email": user.email,
+            "full_name": user.full_name,
+            "user_type": user.user_type,
+            "created_at": (
+                user.created_at.isoformat() if user.created_at else None
+            ),
+            "last_login_at": (
+                user.last_login_at.isoformat() if user.last_login_at else None
+            ),
+        }
+
+    @staticmethod
+    async def get_user_count(db: AsyncSession) -> int:
         """
         전체 사용자 수를 조회합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
 
         Returns:
             int: 전체 사용자 수
@@ -95,7 +133,9 @@ class UserService:
         """
         try:
             logger.info("전체 사용자 수 조회 시작")
-            count = db.query(UserModel).count()
+            count = await db.scalar(
+                select(func.count()).select_from(UserModel)
+            )
             logger.info(f"전체 사용자 수 조회 완료: {count}명")
             return count
         except SQLAlchemyError as e:
@@ -103,12 +143,12 @@ class UserService:
             raise
 
     @staticmethod
-    def get_user(db: Session, user_id: str) -> UserModel | None:
+    async def get_user(db: AsyncSession, user_id: str) -> UserModel | None:
         """
         ID로 특정 사용자를 조회합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             user_id (str): 사용자 ID (UUID 문자열)
 
         Returns:
@@ -121,7 +161,7 @@ class UserService:
         try:
             logger.info(f"사용자 조회 시작: user_id={user_id}")
             uuid_obj = uuid.UUID(user_id)
-            user = db.query(UserModel).filter(UserModel.id == uuid_obj).first()
+            user = await UserService._get_user_with_roles(db, uuid_obj)
 
             if user:
                 logger.info(f"사용자 조회 완료: {user.username}")
@@ -137,12 +177,12 @@ class UserService:
             raise
 
     @staticmethod
-    def create_user(db: Session, user: UserCreate) -> UserModel:
+    async def create_user(db: AsyncSession, user: UserCreate) -> UserModel:
         """
         새로운 사용자를 생성합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             user (UserCreate): 사용자 생성 데이터
 
         Returns:
@@ -155,13 +195,13 @@ class UserService:
         try:
             logger.info(f"사용자 생성 시작: username={user.username}")
 
-            existing_user = (
-                db.query(UserModel)
-                .filter(
-                    (UserModel.email == user.email)
-                    | (UserModel.username == user.username)
+            existing_user = await db.scalar(
+                select(UserModel).filter(
+                    or_(
+                        UserModel.email == user.email,
+                        UserModel.username == user.username,
+                    )
                 )
-                .first()
             )
 
             if existing_user:
@@ -178,28 +218,27 @@ class UserService:
             )
 
             db.add(db_user)
-            db.commit()
-            db.refresh(db_user)
+            await db.commit()
 
             logger.info(f"사용자 생성 완료: {db_user.username}")
-            return db_user
+            return await UserService._get_user_with_roles(db, db_user.id)
         except ValueError as e:
             logger.warning(f"사용자 생성 실패 (유효성 검사): {e}")
             raise
         except SQLAlchemyError as e:
             logger.error(f"사용자 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def update_user(  # noqa: C901
-        db: Session, user_id: str, user: UserUpdate
+    async def update_user(  # noqa: C901
+        db: AsyncSession, user_id: str, user: UserUpdate
     ) -> UserModel | None:
         """
         사용자 정보를 수정합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             user_id (str): 사용자 ID (UUID 문자열)
             user (UserUpdate): 사용자 수정 데이터
 
@@ -213,9 +252,7 @@ class UserService:
         try:
             logger.info(f"사용자 수정 시작: user_id={user_id}")
             uuid_obj = uuid.UUID(user_id)
-            db_user = (
-                db.query(UserModel).filter(UserModel.id == uuid_obj).first()
-            )
+            db_user = await UserService._get_user_with_roles(db, uuid_obj)
 
             if not db_user:
                 logger.warning(
@@ -237,11 +274,10 @@ class UserService:
                         UserModel.username == update_data["username"]
                     )
 
-                existing = (
-                    db.query(UserModel)
+                existing = await db.scalar(
+                    select(UserModel)
                     .filter(UserModel.id != uuid_obj)
-                    .filter(db.query(*conditions).exists())
-                    .first()
+                    .filter(or_(*conditions))
                 )
 
                 if existing:
@@ -253,8 +289,8 @@ class UserService:
                 if hasattr(db_user, field):
                     setattr(db_user, field, value)
 
-            db.commit()
-            db.refresh(db_user)
+            await db.commit()
+            await db.refresh(db_user)
 
             logger.info(f"사용자 수정 완료: {db_user.username}")
             return db_user
@@ -263,16 +299,16 @@ class UserService:
             raise
         except SQLAlchemyError as e:
             logger.error(f"사용자 수정 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_user(db: Session, user_id: str) -> bool:
+    async def delete_user(db: AsyncSession, user_id: str) -> bool:
         """
         사용자를 삭제합니다.
 
         Args:
-            db (Session): 데이터베이스 세션
+            db (AsyncSession): 데이터베이스 세션
             user_id (str): 사용자 ID (UUID 문자열)
 
         Returns:
@@ -285,8 +321,8 @@ class UserService:
         try:
             logger.info(f"사용자 삭제 시작: user_id={user_id}")
             uuid_obj = uuid.UUID(user_id)
-            db_user = (
-                db.query(UserModel).filter(UserModel.id == uuid_obj).first()
+            db_user = await db.scalar(
+                select(UserModel).filter(UserModel.id == uuid_obj)
             )
 
             if not db_user:
@@ -296,8 +332,8 @@ class UserService:
                 return False
 
             username = db_user.username
-            db.delete(db_user)
-            db.commit()
+            await db.delete(db_user)
+            await db.commit()
 
             logger.info(f"사용자 삭제 완료: {username}")
             return True
@@ -306,5 +342,5 @@ class UserService:
             raise
         except SQLAlchemyError as e:
             logger.error(f"사용자 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
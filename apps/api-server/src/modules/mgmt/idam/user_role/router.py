@@ -1,30 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async
+from src.core.pagination import InvalidCursorError
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
-from .schemas import UserRoleCreateRequest, UserRoleResponse
+from .schemas import UserRoleCreateRequest, UserRoleRead, UserRoleResponse
 from .service import UserRoleService
 
 router = APIRouter(prefix="/user-roles", tags=["IDAM - 사용자 역할 관리"])
 
+_CURSOR_DESCRIPTION = "커서 페이지네이션 커서 (빈 값이면 첫 페이지, 미지정 시 skip/limit)"
+
 
 @router.get(
-    "/users/{user_id}", response_model=EnvelopeResponse[list[UserRoleResponse]]
+    "/users/{user_id}",
+    response_model=EnvelopeResponse[
+        list[UserRoleRead] | CursorPage[UserRoleRead]
+    ],
 )
 async def get_user_roles(
     user_id: str,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 사용자의 역할 매핑 목록 조회
+
+    cursor 지정 시 next_cursor를 포함한 커서 페이지를 반환합니다.
     """
     try:
-        user_roles = UserRoleService.get_user_roles(db, user_id, skip, limit)
+        user_roles = await UserRoleService.get_user_roles(
+            db, user_id, skip, limit, cursor=cursor
+        )
         return EnvelopeResponse(success=True, data=user_roles, error=None)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -38,13 +54,15 @@ async def get_user_roles(
 )
 async def assign_role_to_user(
     user_role_data: UserRoleCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     사용자에게 역할 할당
     """
     try:
-        user_role = UserRoleService.assign_role_to_user(db, user_role_data)
+        user_role = await UserRoleService.assign_role_to_user(
+            db, user_role_data
+        )
         return EnvelopeResponse(success=True, data=user_role, error=None)
     except ValueError as e:
         raise HTTPException(
@@ -60,13 +78,15 @@ async def assign_role_to_user(
 async def unassign_role_from_user(
     user_id: str,
     role_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     사용자로부터 역할 해제
     """
     try:
-        success = UserRoleService.unassign_role_from_user(db, user_id, role_id)
+        success = await UserRoleService.unassign_role_from_user(
+            db, user_id, role_id
+        )
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
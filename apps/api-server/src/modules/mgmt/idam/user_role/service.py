@@ -1,8 +1,13 @@
 import logging
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.schemas.common.pagination import CursorPage
+from src.services.mgmt.permission_resolver import permission_resolver
 
 from ..role.model import Role as RoleModel
 from ..user.model import User as UserModel
@@ -22,21 +27,42 @@ class UserRoleService:
     """사용자-역할 매핑 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_user_roles(
-        db: Session, user_id: str, skip: int = 0, limit: int = 100
-    ) -> list[UserRoleModel]:
+    async def get_user_roles(
+        db: AsyncSession,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[UserRoleRead] | CursorPage[UserRoleRead]:
         """
         특정 사용자의 역할 매핑 목록을 조회합니다.
+
+        cursor 지정 시(빈 문자열은 첫 페이지) skip 대신
+        (created_at, id) 기준 커서 페이지를 반환합니다.
         """
         try:
-            user_roles = (
-                db.query(UserRoleModel)
-                .filter(UserRoleModel.user_id == user_id)
-                .offset(skip)
-                .limit(limit)
-                .all()
+            query = select(UserRoleModel).filter(
+                UserRoleModel.user_id == user_id
             )
-            return user_roles
+            if cursor is not None:
+                result = await db.scalars(
+                    keyset_paginate(
+                        query,
+                        UserRoleModel.created_at,
+                        UserRoleModel.id,
+                        cursor,
+                        limit,
+                    )
+                )
+                return build_cursor_page(
+                    result.all(),
+                    limit,
+                    key=lambda r: (r.created_at, r.id),
+                    transform=UserRoleRead.model_validate,
+                )
+
+            result = await db.scalars(query.offset(skip).limit(limit))
+            return [UserRoleRead.model_validate(r) for r in result.all()]
         except SQLAlchemyError as e:
             logger.error(
                 f"사용자 역할 매핑 목록 조회 중 데이터베이스 에러: {e}"
@@ -44,23 +70,23 @@ class UserRoleService:
             raise
 
     @staticmethod
-    def assign_role_to_user(
-        db: Session, user_role_data: UserRoleCreateRequest
+    async def assign_role_to_user(
+        db: AsyncSession, user_role_data: UserRoleCreateRequest
     ) -> UserRoleModel:
         """
         사용자에게 역할을 할당합니다.
         """
         try:
             # 사용자 및 역할 존재 여부 확인
-            user = (
-                db.query(UserModel)
-                .filter(UserModel.id == user_role_data.user_id)
-                .first()
+            user = await db.scalar(
+                select(UserModel).filter(
+                    UserModel.id == user_role_data.user_id
+                )
             )
-            role = (
-                db.query(RoleModel)
-                .filter(RoleModel.id == user_role_data.role_id)
-                .first()
+            role = await db.scalar(
+                select(RoleModel).filter(
+                    RoleModel.id == user_role_data.role_id
+                )
             )
 
             if not user:
@@ -73,13 +99,11 @@ class UserRoleService:
                 )
 
             # 이미 할당된 역할인지 확인
-            existing_user_role = (
-                db.query(UserRoleModel)
-                .filter(
+            existing_user_role = await db.scalar(
+                select(UserRoleModel).filter(
                     UserRoleModel.user_id == user_role_data.user_id,
                     UserRoleModel.role_id == user_role_data.role_id,
                 )
-                .first()
             )
             if existing_user_role:
                 raise ValueError("Role is already assigned to this user.")
@@ -88,60 +112,60 @@ class UserRoleService:
                 user_id=user_role_data.user_id, role_id=user_role_data.role_id
             )
             db.add(db_user_role)
-            db.commit()
-            db.refresh(db_user_role)
+            await db.commit()
+            await db.refresh(db_user_role)
+            permission_resolver.invalidate_user(db_user_role.user_id)
             return db_user_role
         except SQLAlchemyError as e:
             logger.error(f"사용자 역할 할당 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def unassign_role_from_user(
-        db: Session, user_id: str, role_id: str
+    async def unassign_role_from_user(
+        db: AsyncSession, user_id: str, role_id: str
     ) -> bool:
         """
         사용자로부터 역할을 해제합니다.
         """
         try:
-            db_user_role = (
-                db.query(UserRoleModel)
-                .filter(
+            db_user_role = await db.scalar(
+                select(UserRoleModel).filter(
                     UserRoleModel.user_id == user_id,
                     UserRoleModel.role_id == role_id,
                 )
-                .first()
             )
             if not db_user_role:
                 return False
 
-            db.delete(db_user_role)
-            db.commit()
+            await db.delete(db_user_role)
+            await db.commit()
+            permission_resolver.invalidate_user(user_id)
             return True
         except SQLAlchemyError as e:
             logger.error(f"사용자 역할 해제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     # New methods using the new schema classes
     @staticmethod
-    def create_user_role(
-        db: Session, user_role_data: UserRoleCreate
+    async def create_user_role(
+        db: AsyncSession, user_role_data: UserRoleCreate
     ) -> UserRoleRead:
         """
         새로운 사용자-역할 매핑을 생성합니다. (새로운 스키마 사용)
         """
         try:
             # 사용자 및 역할 존재 여부 확인
-            user = (
-                db.query(UserModel)
-                .filter(UserModel.id == user_role_data.user_id)
-                .first()
+            user = await db.scalar(
+                select(UserModel).filter(
+                    UserModel.id == user_role_data.user_id
+                )
             )
-            role = (
-                db.query(RoleModel)
-                .filter(RoleModel.id == user_role_data.role_id)
-                .first()
+            role = await db.scalar(
+                select(RoleModel).filter(
+                    RoleModel.id == user_role_data.role_id
+                )
             )
 
             if not user:
@@ -154,40 +178,37 @@ class UserRoleService:
                 )
 
             # 이미 할당된 역할인지 확인
-            existing_user_role = (
-                db.query(UserRoleModel)
-                .filter(
+            existing_user_role = await db.scalar(
+                select(UserRoleModel).filter(
                     UserRoleModel.user_id == user_role_data.user_id,
                     UserRoleModel.role_id == user_role_data.role_id,
                 )
-                .first()
             )
             if existing_user_role:
                 raise ValueError("Role is already assigned to this user.")
 
             db_user_role = UserRoleModel(**user_role_data.model_dump())
             db.add(db_user_role)
-            db.commit()
-            db.refresh(db_user_role)
+            await db.commit()
+            await db.refresh(db_user_role)
+            permission_resolver.invalidate_user(db_user_role.user_id)
 
             return UserRoleRead.model_validate(db_user_role)
         except SQLAlchemyError as e:
             logger.error(f"사용자 역할 생성 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def get_user_role_by_id(
-        db: Session, user_role_id: UUID
+    async def get_user_role_by_id(
+        db: AsyncSession, user_role_id: UUID
     ) -> UserRoleRead | None:
         """
         ID로 사용자-역할 매핑을 조회합니다.
         """
         try:
-            user_role = (
-                db.query(UserRoleModel)
-                .filter(UserRoleModel.id == user_role_id)
-                .first()
+            user_role = await db.scalar(
+                select(UserRoleModel).filter(UserRoleModel.id == user_role_id)
             )
             if user_role:
                 return UserRoleRead.model_validate(user_role)
@@ -197,67 +218,93 @@ class UserRoleService:
             raise
 
     @staticmethod
-    def update_user_role(
-        db: Session, user_role_id: UUID, user_role_data: UserRoleUpdate
+    async def update_user_role(
+        db: AsyncSession, user_role_id: UUID, user_role_data: UserRoleUpdate
     ) -> UserRoleRead | None:
         """
         사용자-역할 매핑을 업데이트합니다.
         """
         try:
-            db_user_role = (
-                db.query(UserRoleModel)
-                .filter(UserRoleModel.id == user_role_id)
-                .first()
+            db_user_role = await db.scalar(
+                select(UserRoleModel).filter(UserRoleModel.id == user_role_id)
             )
             if not db_user_role:
                 return None
 
+            previous_user_id = db_user_role.user_id
             update_data = user_role_data.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(db_user_role, field, value)
 
-            db.commit()
-            db.refresh(db_user_role)
+            await db.commit()
+            await db.refresh(db_user_role)
+            permission_resolver.invalidate_user(
+                previous_user_id, db_user_role.user_id
+            )
 
             return UserRoleRead.model_validate(db_user_role)
         except SQLAlchemyError as e:
             logger.error(f"사용자 역할 업데이트 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def delete_user_role(db: Session, user_role_id: UUID) -> bool:
+    async def delete_user_role(db: AsyncSession, user_role_id: UUID) -> bool:
         """
         사용자-역할 매핑을 삭제합니다.
         """
         try:
-            db_user_role = (
-                db.query(UserRoleModel)
-                .filter(UserRoleModel.id == user_role_id)
-                .first()
+            db_user_role = await db.scalar(
+                select(UserRoleModel).filter(UserRoleModel.id == user_role_id)
             )
             if not db_user_role:
                 return False
 
-            db.delete(db_user_role)
-            db.commit()
+            user_id = db_user_role.user_id
+            await db.delete(db_user_role)
+            await db.commit()
+            permission_resolver.invalidate_user(user_id)
             return True
         except SQLAlchemyError as e:
             logger.error(f"사용자 역할 삭제 중 데이터베이스 에러: {e}")
-            db.rollback()
+            await db.rollback()
             raise
 
     @staticmethod
-    def list_user_roles(
-        db: Session, skip: int = 0, limit: int = 100
-    ) -> list[UserRoleRead]:
+    async def list_user_roles(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[UserRoleRead] | CursorPage[UserRoleRead]:
         """
         사용자-역할 매핑 목록을 조회합니다.
+
+        cursor 지정 시(빈 문자열은 첫 페이지) skip 대신
+        (created_at, id) 기준 커서 페이지를 반환합니다.
         """
         try:
-            user_roles = (
-                db.query(UserRoleModel).offset(skip).limit(limit).all()
+            if cursor is not None:
+                result = await db.scalars(
+                    keyset_paginate(
+                        select(UserRoleModel),
+                        UserRoleModel.created_at,
+                        UserRoleModel.id,
+                        cursor,
+                        limit,
+                    )
+                )
+                return build_cursor_page(
+                    result.all(),
+                    limit,
+                    key=lambda r: (r.created_at, r.id),
+                    transform=UserRoleRead.model_validate,
+                )
+
+            result = await db.scalars(
+                select(UserRoleModel).offset(skip).limit(limit)
             )
+            user_roles = result.all()
             return [
                 UserRoleRead.model_validate(user_role)
                 for user_role in user_roles
@@ -1,4 +1,11 @@
-from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    TIMESTAMP,
+    Boolean,
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.models.base import BaseModel
@@ -55,3 +62,9 @@ class RateLimit(BaseModel):
     )
     total_requests = Column(Integer, default=0, comment="총 요청 수")
     blocked_requests = Column(Integer, default=0, comment="차단된 요청 수")
+    expires_at = Column(
+        TIMESTAMP(timezone=True), comment="제한 규칙 만료 시각"
+    )
+    deleted = Column(
+        Boolean, nullable=False, default=False, comment="논리적 삭제 여부"
+    )
@@ -1,11 +1,3 @@
-from .onboarding import model as onboarding_model
-from .subscription import model as subscription_model
-from .tenant_role import model as tenant_role_model
-from .tenant_user import model as tenant_user_model
+from .model import Onboarding, Subscription, TenantRole, TenantUser
 
-__all__ = [
-    "subscription_model",
-    "onboarding_model",
-    "tenant_role_model",
-    "tenant_user_model",
-]
+__all__ = ["Onboarding", "Subscription", "TenantRole", "TenantUser"]
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_mgmt_db_async, get_mgmt_db_readonly
+from src.schemas.common.pagination import CursorPage
 from src.schemas.common.response import EnvelopeResponse
 
 from .schemas import (
@@ -14,11 +15,17 @@ from .service import TenantService
 router = APIRouter(prefix="/tenants", tags=["TNNT - 테넌트 관리"])
 
 
-@router.get("/", response_model=EnvelopeResponse[list[TenantResponse]])
+@router.get(
+    "/",
+    response_model=EnvelopeResponse[
+        list[TenantResponse] | CursorPage[TenantResponse]
+    ],
+)
 async def get_tenants(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_mgmt_db_readonly),
 ):
     """
     테넌트 목록 조회
@@ -28,19 +35,24 @@ async def get_tenants(
     **매개변수:**
     - **skip**: 건너뛸 레코드 수 (기본값: 0)
     - **limit**: 조회할 최대 레코드 수 (기본값: 100)
+    - **cursor**: 커서 페이지네이션 커서 (선택)
+      - 빈 값이면 첫 페이지, 지정 시 skip 대신 사용
 
     **반환값:**
     - **success**: 요청 성공 여부
     - **data**: 테넌트 정보 배열
       - 각 테넌트의 상세 정보 포함
       - 비즈니스 정보, 주소, 상태 등
+      - cursor 지정 시 items, next_cursor, has_more, size
     - **error**: 오류 정보 (실패 시)
 
     **예외:**
     - 500: 서버 내부 오류
     """
     try:
-        tenants = TenantService.get_tenants(db, skip=skip, limit=limit)
+        tenants = await TenantService.get_tenants(
+            db, skip=skip, limit=limit, cursor=cursor
+        )
         return EnvelopeResponse(success=True, data=tenants, error=None)
     except Exception as e:
         return EnvelopeResponse(
@@ -51,7 +63,7 @@ async def get_tenants(
 @router.get("/{tenant_id}", response_model=EnvelopeResponse[TenantResponse])
 async def get_tenant(
     tenant_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     특정 테넌트 조회
@@ -75,7 +87,7 @@ async def get_tenant(
     - 404: 테넌트를 찾을 수 없음
     - 500: 서버 내부 오류
     """
-    tenant = TenantService.get_tenant(db, tenant_id)
+    tenant = await TenantService.get_tenant_response(db, tenant_id)
     if not tenant:
         return EnvelopeResponse(
             success=False,
@@ -92,7 +104,7 @@ async def get_tenant(
 )
 async def create_tenant(
     tenant_data: TenantCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     새 테넌트 생성
@@ -125,7 +137,9 @@ async def create_tenant(
     - 500: 서버 내부 오류
     """
     try:
-        tenant = TenantService.create_tenant_with_request(db, tenant_data)
+        tenant = await TenantService.create_tenant_with_request(
+            db, tenant_data
+        )
         return EnvelopeResponse(success=True, data=tenant, error=None)
     except Exception as e:
         return EnvelopeResponse(
@@ -137,7 +151,7 @@ async def create_tenant(
 async def update_tenant(
     tenant_id: str,
     tenant_data: TenantUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     테넌트 정보 수정
@@ -164,7 +178,7 @@ async def update_tenant(
     - 409: 테넌트 코드 또는 사업자등록번호 중복
     - 500: 서버 내부 오류
     """
-    tenant = TenantService.update_tenant_with_request(
+    tenant = await TenantService.update_tenant_with_request(
         db, tenant_id, tenant_data
     )
     if not tenant:
@@ -179,7 +193,7 @@ async def update_tenant(
 @router.delete("/{tenant_id}")
 async def delete_tenant(
     tenant_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     테넌트 삭제
@@ -203,7 +217,7 @@ async def delete_tenant(
     - 삭제된 테넌트는 일반 목록에서 노출되지 않습니다
     - 관련된 사용자 데이터도 영향을 받을 수 있습니다
     """
-    success = TenantService.delete_tenant(db, tenant_id)
+    success = await TenantService.delete_tenant(db, tenant_id)
     if not success:
         return EnvelopeResponse(
             success=False,
@@ -220,7 +234,7 @@ async def delete_tenant(
 @router.patch("/{tenant_id}/suspend")
 async def suspend_tenant(
     tenant_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     테넌트 일시정지
@@ -247,7 +261,7 @@ async def suspend_tenant(
     - 테넌트 사용자들의 세션이 무효화될 수 있습니다
     - 일시정지 해제는 activate 엔드포인트를 사용하여 가능합니다
     """
-    tenant = TenantService.suspend_tenant(db, tenant_id)
+    tenant = await TenantService.suspend_tenant(db, tenant_id)
     if not tenant:
         return EnvelopeResponse(
             success=False,
@@ -260,7 +274,7 @@ async def suspend_tenant(
 @router.patch("/{tenant_id}/activate")
 async def activate_tenant(
     tenant_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_mgmt_db_async),
 ):
     """
     테넌트 활성화
@@ -287,7 +301,7 @@ async def activate_tenant(
     - 기존 사용자 계정들이 복원되어 로그인할 수 있습니다
     - 일시정지 기간 중의 데이터는 그대로 보존됩니다
     """
-    tenant = TenantService.activate_tenant(db, tenant_id)
+    tenant = await TenantService.activate_tenant(db, tenant_id)
     if not tenant:
         return EnvelopeResponse(
             success=False,
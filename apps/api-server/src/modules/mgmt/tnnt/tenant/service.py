@@ -7,82 +7,132 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.pagination import build_cursor_page, keyset_paginate
+from src.core.tenant_resolver import tenant_resolver
+from src.schemas.common.pagination import CursorPage
+from src.services.shared.cache_service import cached
 
 from .model import Tenant
 from .schemas import (
     TenantCreate,
     TenantCreateRequest,
+    TenantResponse,
     TenantUpdate,
     TenantUpdateRequest,
 )
 
 
+def _tenant_cache_key(db: AsyncSession, tenant_id: str) -> str:
+    """테넌트 상세 캐시 키 (UUID 표기 차이를 정규화)"""
+    try:
+        return str(uuid.UUID(tenant_id))
+    except ValueError:
+        return tenant_id
+
+
 class TenantService:
     """테넌트 관련 비즈니스 로직을 처리하는 서비스"""
 
     @staticmethod
-    def get_tenants(
-        db: Session, skip: int = 0, limit: int = 100
-    ) -> list[Tenant]:
-        """활성화된 테넌트 목록 조회"""
-        return (
-            db.query(Tenant)
-            .filter(~Tenant.deleted)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+    async def get_tenants(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[Tenant] | CursorPage[TenantResponse]:
+        """활성화된 테넌트 목록 조회
+
+        cursor 지정 시(빈 문자열은 첫 페이지) skip 대신
+        (created_at, id) 기준 커서 페이지를 반환합니다.
+        """
+        query = select(Tenant).filter(~Tenant.deleted)
+        if cursor is not None:
+            result = await db.scalars(
+                keyset_paginate(
+                    query, Tenant.created_at, Tenant.id, cursor, limit
+                )
+            )
+            return build_cursor_page(
+                result.all(),
+                limit,
+                key=lambda t: (t.created_at, t.id),
+                transform=TenantResponse.model_validate,
+            )
+
+        result = await db.scalars(query.offset(skip).limit(limit))
+        return list(result.all())
 
     @staticmethod
-    def get_tenant_by_id(db: Session, tenant_id: uuid.UUID) -> Tenant | None:
+    async def get_tenant_by_id(
+        db: AsyncSession, tenant_id: uuid.UUID
+    ) -> Tenant | None:
         """ID로 테넌트 조회"""
-        return (
-            db.query(Tenant)
-            .filter(and_(Tenant.id == tenant_id, ~Tenant.deleted))
-            .first()
+        return await db.scalar(
+            select(Tenant).filter(
+                and_(Tenant.id == tenant_id, ~Tenant.deleted)
+            )
         )
 
     @staticmethod
-    def get_tenant(db: Session, tenant_id: str) -> Tenant | None:
+    async def get_tenant(
+        db: AsyncSession, tenant_id: str
+    ) -> Tenant | None:
         """문자열 ID로 테넌트 조회"""
         try:
             tenant_uuid = uuid.UUID(tenant_id)
-            return TenantService.get_tenant_by_id(db, tenant_uuid)
+            return await TenantService.get_tenant_by_id(db, tenant_uuid)
         except ValueError:
             return None
 
     @staticmethod
-    def get_tenant_by_code(db: Session, tenant_code: str) -> Tenant | None:
+    @cached("tenant", key=_tenant_cache_key, model=TenantResponse)
+    async def get_tenant_response(
+        db: AsyncSession, tenant_id: str
+    ) -> TenantResponse | None:
+        """테넌트 상세 조회 (공통 캐시 사용, 생성/수정/삭제 시 무효화)"""
+        return await TenantService.get_tenant(db, tenant_id)
+
+    @staticmethod
+    def _invalidate(tenant_id: uuid.UUID) -> None:
+        """테넌트 조회 색인과 상세 캐시 무효화"""
+        tenant_resolver.invalidate(tenant_id)
+        TenantService.get_tenant_response.invalidate(None, str(tenant_id))
+
+    @staticmethod
+    async def get_tenant_by_code(
+        db: AsyncSession, tenant_code: str
+    ) -> Tenant | None:
         """테넌트 코드로 테넌트 조회"""
-        return (
-            db.query(Tenant)
-            .filter(and_(Tenant.tenant_code == tenant_code, ~Tenant.deleted))
-            .first()
+        return await db.scalar(
+            select(Tenant).filter(
+                and_(Tenant.tenant_code == tenant_code, ~Tenant.deleted)
+            )
         )
 
     @staticmethod
-    def get_tenant_by_business_no(
-        db: Session, business_no: str
+    async def get_tenant_by_business_no(
+        db: AsyncSession, business_no: str
     ) -> Tenant | None:
         """사업자등록번호로 테넌트 조회"""
-        return (
-            db.query(Tenant)
-            .filter(and_(Tenant.business_no == business_no, ~Tenant.deleted))
-            .first()
+        return await db.scalar(
+            select(Tenant).filter(
+                and_(Tenant.business_no == business_no, ~Tenant.deleted)
+            )
         )
 
     @staticmethod
-    def create_tenant_with_request(
-        db: Session,
+    async def create_tenant_with_request(
+        db: AsyncSession,
         tenant_data: TenantCreateRequest,
         created_by: uuid.UUID | None = None,
     ) -> Tenant:
         """새 테넌트 생성 (Request 스키마 사용)"""
 
         # 테넌트 코드 중복 체크
-        existing_tenant = TenantService.get_tenant_by_code(
+        existing_tenant = await TenantService.get_tenant_by_code(
             db, tenant_data.tenant_code
         )
         if existing_tenant:
@@ -90,8 +140,10 @@ class TenantService:
 
         # 사업자등록번호 중복 체크 (제공된 경우)
         if tenant_data.business_no:
-            existing_business = TenantService.get_tenant_by_business_no(
-                db, tenant_data.business_no
+            existing_business = (
+                await TenantService.get_tenant_by_business_no(
+                    db, tenant_data.business_no
+                )
             )
             if existing_business:
                 raise ValueError("이미 등록된 사업자등록번호입니다")
@@ -104,21 +156,22 @@ class TenantService:
         )
 
         db.add(db_tenant)
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
     @staticmethod
-    def create_tenant(
-        db: Session,
+    async def create_tenant(
+        db: AsyncSession,
         tenant_data: TenantCreate,
         created_by: uuid.UUID | None = None,
     ) -> Tenant:
         """새 테넌트 생성 (새로운 PascalCase 스키마 사용)"""
 
         # 테넌트 코드 중복 체크
-        existing_tenant = TenantService.get_tenant_by_code(
+        existing_tenant = await TenantService.get_tenant_by_code(
             db, tenant_data.tenant_code
         )
         if existing_tenant:
@@ -126,8 +179,10 @@ class TenantService:
 
         # 사업자등록번호 중복 체크 (제공된 경우)
         if tenant_data.business_no:
-            existing_business = TenantService.get_tenant_by_business_no(
-                db, tenant_data.business_no
+            existing_business = (
+                await TenantService.get_tenant_by_business_no(
+                    db, tenant_data.business_no
+                )
             )
             if existing_business:
                 raise ValueError("이미 등록된 사업자등록번호입니다")
@@ -140,21 +195,22 @@ class TenantService:
         )
 
         db.add(db_tenant)
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
     @staticmethod
-    def update_tenant_with_request(
-        db: Session,
+    async def update_tenant_with_request(
+        db: AsyncSession,
         tenant_id: str,
         tenant_data: TenantUpdateRequest,
         updated_by: uuid.UUID | None = None,
     ) -> Tenant | None:
         """테넌트 정보 수정 (Request 스키마 사용)"""
 
-        db_tenant = TenantService.get_tenant(db, tenant_id)
+        db_tenant = await TenantService.get_tenant(db, tenant_id)
         if not db_tenant:
             return None
 
@@ -163,7 +219,7 @@ class TenantService:
             tenant_data.tenant_code
             and tenant_data.tenant_code != db_tenant.tenant_code
         ):
-            existing_tenant = TenantService.get_tenant_by_code(
+            existing_tenant = await TenantService.get_tenant_by_code(
                 db, tenant_data.tenant_code
             )
             if existing_tenant:
@@ -174,8 +230,10 @@ class TenantService:
             tenant_data.business_no
             and tenant_data.business_no != db_tenant.business_no
         ):
-            existing_business = TenantService.get_tenant_by_business_no(
-                db, tenant_data.business_no
+            existing_business = (
+                await TenantService.get_tenant_by_business_no(
+                    db, tenant_data.business_no
+                )
             )
             if existing_business:
                 raise ValueError("이미 등록된 사업자등록번호입니다")
@@ -189,21 +247,22 @@ class TenantService:
         db_tenant.updated_at = datetime.now()
         db_tenant.updated_by = updated_by
 
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
     @staticmethod
-    def update_tenant(
-        db: Session,
+    async def update_tenant(
+        db: AsyncSession,
         tenant_id: str,
         tenant_data: TenantUpdate,
         updated_by: uuid.UUID | None = None,
     ) -> Tenant | None:
         """테넌트 정보 수정 (새로운 PascalCase 스키마 사용)"""
 
-        db_tenant = TenantService.get_tenant(db, tenant_id)
+        db_tenant = await TenantService.get_tenant(db, tenant_id)
         if not db_tenant:
             return None
 
@@ -212,7 +271,7 @@ class TenantService:
             tenant_data.tenant_code
             and tenant_data.tenant_code != db_tenant.tenant_code
         ):
-            existing_tenant = TenantService.get_tenant_by_code(
+            existing_tenant = await TenantService.get_tenant_by_code(
                 db, tenant_data.tenant_code
             )
             if existing_tenant:
@@ -223,8 +282,10 @@ class TenantService:
             tenant_data.business_no
             and tenant_data.business_no != db_tenant.business_no
         ):
-            existing_business = TenantService.get_tenant_by_business_no(
-                db, tenant_data.business_no
+            existing_business = (
+                await TenantService.get_tenant_by_business_no(
+                    db, tenant_data.business_no
+                )
             )
             if existing_business:
                 raise ValueError("이미 등록된 사업자등록번호입니다")
@@ -238,69 +299,69 @@ class TenantService:
         db_tenant.updated_at = datetime.now()
         db_tenant.updated_by = updated_by
 
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
     @staticmethod
-    def delete_tenant(db: Session, tenant_id: str) -> bool:
+    async def delete_tenant(db: AsyncSession, tenant_id: str) -> bool:
         """테넌트 논리적 삭제"""
 
-        db_tenant = TenantService.get_tenant(db, tenant_id)
+        db_tenant = await TenantService.get_tenant(db, tenant_id)
         if not db_tenant:
             return False
 
         db_tenant.deleted = True
         db_tenant.updated_at = datetime.now()
 
-        db.commit()
+        await db.commit()
+        TenantService._invalidate(db_tenant.id)
 
         return True
 
     @staticmethod
-    def suspend_tenant(
-        db: Session,
+    async def suspend_tenant(
+        db: AsyncSession,
         tenant_id: str,
         updated_by: uuid.UUID | None = None,
     ) -> Tenant | None:
         """테넌트 정지"""
 
-        db_tenant = TenantService.get_tenant(db, tenant_id)
+        db_tenant = await TenantService.get_tenant(db, tenant_id)
         if not db_tenant:
             return None
 
-        from .model import TenantStatus
-
-        db_tenant.status = TenantStatus.SUSPENDED
+        db_tenant.status = "SUSPENDED"
         db_tenant.updated_at = datetime.now()
         db_tenant.updated_by = updated_by
 
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
     @staticmethod
-    def activate_tenant(
-        db: Session,
+    async def activate_tenant(
+        db: AsyncSession,
         tenant_id: str,
         updated_by: uuid.UUID | None = None,
     ) -> Tenant | None:
         """테넌트 활성화"""
 
-        db_tenant = TenantService.get_tenant(db, tenant_id)
+        db_tenant = await TenantService.get_tenant(db, tenant_id)
         if not db_tenant:
             return None
 
-        from .model import TenantStatus
-
-        db_tenant.status = TenantStatus.ACTIVE
+        db_tenant.status = "ACTIVE"
         db_tenant.updated_at = datetime.now()
         db_tenant.updated_by = updated_by
 
-        db.commit()
-        db.refresh(db_tenant)
+        await db.commit()
+        await db.refresh(db_tenant)
+        TenantService._invalidate(db_tenant.id)
 
         return db_tenant
 
@@ -0,0 +1,29 @@
+"""
+커서 페이지네이션 응답 스키마
+
+목록 API의 cursor 파라미터 사용 시 page/size 응답 대신 반환됩니다.
+"""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    커서 기반 페이지 응답
+
+    Attributes:
+        items (list[T]): 현재 페이지 항목
+        next_cursor (Optional[str]): 다음 페이지 요청 시 전달할 커서
+            (마지막 페이지이면 None)
+        has_more (bool): 다음 페이지 존재 여부
+        size (int): 요청한 페이지 크기
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    has_more: bool = False
+    size: int
@@ -0,0 +1,231 @@
+"""
+API 키 인증기
+
+API 키는 "<key_id>.<secret>" 형식입니다. key_id(ak_...)는 공개 식별자로
+idam.api_keys.key_id 유니크 인덱스로 조회하고, secret은 HMAC-SHA256 해시를
+상수 시간 비교로 검증합니다. (bcrypt 같은 느린 해시를 쓰지 않으므로 호출당
+검증 비용은 마이크로초 단위)
+
+초당 수천 건을 호출하는 기계 클라이언트가 요청마다 DB를 조회하지 않도록
+key_id별 조회 결과를 프로세스 내 LRU에 캐시합니다.
+
+- 양성 캐시: 키 행(해시, 상태, 만료 시각, 허용 IP 등) - API_KEY_CACHE_TTL
+- 음성 캐시: 존재하지 않는 key_id - API_KEY_NEGATIVE_CACHE_TTL
+
+비밀값이 틀린 요청은 캐시된 해시와의 비교로 거절되므로 DB를 조회하지
+않습니다. 키 수정/삭제 시에는 pub/sub 채널로 다른 워커의 캐시를 무효화하며,
+전파가 누락되더라도 TTL 이후에는 반영됩니다. 무효화 전에 시작된 DB 조회가
+무효화 후에 이전 키 행을 다시 캐시하지 않도록, 무효화마다 세대를 올리고
+조회 전에 읽은 세대가 그대로일 때만 저장합니다.
+"""
+
+import ipaddress
+import json
+import secrets
+import threading
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.lru import LRUCache
+from src.core.redis_client import InvalidationListener, RedisGuard
+from src.core.security import hash_api_key_secret, verify_api_key_secret
+
+KEY_ID_PREFIX = "ak_"
+_SEPARATOR = "."
+_MISSING = object()
+# 캐시하는 api_keys 컬럼 (사용 이력 컬럼은 제외)
+_CACHED_COLUMNS = (
+    "id",
+    "key_id",
+    "key_hash",
+    "key_name",
+    "user_id",
+    "tenant_context",
+    "service_account",
+    "scopes",
+    "allowed_ips",
+    "rate_limit_per_minute",
+    "rate_limit_per_hour",
+    "rate_limit_per_day",
+    "status",
+    "expires_at",
+)
+
+
+def generate_api_key() -> tuple[str, str, str]:
+    """새 API 키 생성 (key_id, 사용자에게 한 번만 보여줄 키, 저장용 해시)"""
+    key_id = KEY_ID_PREFIX + secrets.token_hex(8)
+    secret = secrets.token_urlsafe(32)
+    return key_id, key_id + _SEPARATOR + secret, hash_api_key_secret(secret)
+
+
+def split_api_key(raw_key: str) -> tuple[str, str] | None:
+    """API 키를 (key_id, secret)으로 분리 (형식이 맞지 않으면 None)"""
+    key_id, separator, secret = raw_key.strip().partition(_SEPARATOR)
+    if not separator or not secret or not key_id.startswith(KEY_ID_PREFIX):
+        return None
+    if len(key_id) > 100:
+        return None
+    return key_id, secret
+
+
+class ApiKeyAuthenticator:
+    """key_id 인덱스 조회 + HMAC 검증 + 양성/음성 LRU 캐시"""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: int,
+        negative_ttl: int,
+        channel: str,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.channel = channel
+
+        # key_id -> 컬럼 값 또는 None(존재하지 않음)
+        self._local: LRUCache[str, dict | None] = LRUCache(max_size)
+        self._lock = threading.Lock()
+        # 무효화마다 증가 (진행 중이던 조회 결과의 저장 방지)
+        self._generation = 0
+        self._redis = RedisGuard("API 키 캐시")
+        self._listener = InvalidationListener(
+            channel,
+            name="api-key-cache-invalidation",
+            label="API 키 캐시 무효화 구독",
+            on_message=self._drop_local,
+            # 재연결 사이에 놓친 무효화가 있을 수 있으므로 캐시를 비움
+            on_subscribe=lambda _client: self.clear(),
+        )
+
+    # ------------------------------------------------------------------
+    # 인증
+    # ------------------------------------------------------------------
+    async def authenticate(
+        self,
+        db: AsyncSession,
+        raw_key: str,
+        ip_address: str | None = None,
+    ):
+        """API 키 검증 (유효하면 ApiKey 모델, 아니면 None)
+
+        반환하는 모델은 캐시된 컬럼 값으로 만든 세션에 연결되지 않은
+        객체이므로 수정하거나 관계를 조회하지 마세요.
+        """
+        from src.modules.mgmt.idam.api_key.model import ApiKey
+
+        parsed = split_api_key(raw_key)
+        if parsed is None:
+            return None
+        key_id, secret = parsed
+
+        self._listener.start()
+        found, values, generation = self._get_local(key_id)
+        if not found:
+            row = await db.scalar(
+                select(ApiKey).where(ApiKey.key_id == key_id)
+            )
+            values = (
+                {column: getattr(row, column) for column in _CACHED_COLUMNS}
+                if row is not None
+                else None
+            )
+            self._store_local(key_id, values, generation)
+
+        if values is None or not verify_api_key_secret(
+            secret, values["key_hash"]
+        ):
+            return None
+        if values["status"] != "ACTIVE":
+            return None
+        expires_at = values["expires_at"]
+        if expires_at is not None and expires_at <= datetime.now(UTC):
+            return None
+        if not self._ip_allowed(values["allowed_ips"], ip_address):
+            return None
+        return ApiKey(**values)
+
+    @staticmethod
+    def _ip_allowed(allowed_ips, ip_address: str | None) -> bool:
+        """허용 IP 목록 확인 (목록이 비어 있으면 모든 IP 허용)"""
+        if not allowed_ips:
+            return True
+        if not ip_address:
+            return False
+        try:
+            address = ipaddress.ip_address(ip_address)
+        except ValueError:
+            return False
+        return any(
+            address in ipaddress.ip_network(str(allowed), strict=False)
+            for allowed in allowed_ips
+        )
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+    def invalidate(self, *key_ids: str) -> None:
+        """API 키 캐시 무효화 및 다른 워커로 전파 (키 수정/삭제 시)"""
+        key_ids = tuple(key_id for key_id in key_ids if key_id)
+        if not key_ids:
+            return
+
+        self._drop_local(key_ids)
+        self._redis.call(
+            lambda r: r.publish(self.channel, json.dumps(key_ids))
+        )
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 비우기"""
+        with self._lock:
+            self._local.clear()
+            self._generation += 1
+
+    def stop_listener(self) -> None:
+        """무효화 구독 스레드 종료"""
+        self._listener.stop()
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _get_local(self, key_id: str) -> tuple[bool, dict | None, int]:
+        """(캐시 적중 여부, 컬럼 값 또는 None, 현재 세대)"""
+        with self._lock:
+            values = self._local.get(key_id, _MISSING)
+            if values is _MISSING:
+                return False, None, self._generation
+            return True, values, self._generation
+
+    def _store_local(
+        self, key_id: str, values: dict | None, generation: int
+    ) -> None:
+        ttl = self.ttl if values is not None else self.negative_ttl
+        with self._lock:
+            if generation != self._generation:
+                return  # 조회 중 무효화됨
+            self._local.set(key_id, values, ttl)
+
+    def _drop_local(self, key_ids) -> None:
+        with self._lock:
+            for key_id in key_ids:
+                self._local.pop(key_id)
+            self._generation += 1
+
+
+api_key_authenticator = ApiKeyAuthenticator(
+    max_size=settings.API_KEY_CACHE_MAX_SIZE,
+    ttl=settings.API_KEY_CACHE_TTL_SECONDS,
+    negative_ttl=settings.API_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+    channel=settings.API_KEY_CACHE_CHANNEL,
+)
+
+__all__ = [
+    "ApiKeyAuthenticator",
+    "api_key_authenticator",
+    "generate_api_key",
+    "split_api_key",
+]
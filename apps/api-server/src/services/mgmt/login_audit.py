@@ -0,0 +1,348 @@
+"""
+로그인 감사 로그 일괄 기록 (write-behind)
+
+로그인/로그아웃/잠금 이벤트마다 idam.login_logs에 INSERT + COMMIT 하는 대신,
+이벤트를 메모리 버퍼에 모아 두었다가 백그라운드 스레드가 주기적으로(또는
+LOGIN_AUDIT_BATCH_SIZE에 도달하면 즉시) 한 번의 다중 행 INSERT로 반영합니다.
+
+- DB 장애로 반영에 실패한 이벤트는 워커별 로컬 스풀 파일(JSON Lines,
+  fsync)에 기록하고, 이후 반영에 성공하면 스풀을 먼저 재적재
+  (재적재는 fcntl 잠금으로 한 워커씩, 해석할 수 없는 행은 .corrupt로 격리)
+- 이벤트 id를 미리 생성하고 ON CONFLICT (id) DO NOTHING으로 적재하므로
+  스풀 재적재가 중복되어도 안전
+- 버퍼가 LOGIN_AUDIT_MAX_PENDING을 넘으면 DB를 기다리지 않고 스풀로 기록
+- 종료 시 남은 이벤트 반영 (실패 시 스풀)
+
+따라서 유실 범위는 프로세스가 비정상 종료된 경우의 마지막 플러시 주기
+(LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS) 이내 이벤트로 한정됩니다.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+
+from src.core.config import settings
+from src.core.database import mgmt_engine
+from src.modules.mgmt.idam.login_log.model import LoginLog
+
+logger = logging.getLogger(__name__)
+
+_INSERT_CHUNK_SIZE = 1000
+_SPOOL_PREFIX = "login_audit"
+_CORRUPT_SUFFIX = ".corrupt"
+_UUID_FIELDS = ("id", "user_id", "tenant_context")
+_DATETIME_FIELDS = ("created_at",)
+
+FLUSH_SIZE = Histogram(
+    "login_audit_flush_size",
+    "로그인 감사 로그 일괄 INSERT 건수",
+    buckets=(1, 5, 10, 50, 100, 500, 1000, 5000),
+)
+FLUSH_DURATION = Histogram(
+    "login_audit_flush_duration_seconds",
+    "로그인 감사 로그 일괄 INSERT 실행 시간",
+)
+SPOOLED = Counter(
+    "login_audit_spooled_total",
+    "DB 대신 로컬 스풀 파일에 기록된 로그인 감사 이벤트 수",
+)
+DROPPED = Counter(
+    "login_audit_dropped_total",
+    "DB가 거부하여 버려진 로그인 감사 이벤트 수",
+)
+QUARANTINED = Counter(
+    "login_audit_quarantined_total",
+    "해석할 수 없어 격리 파일로 옮긴 스풀 행 수",
+)
+PENDING = Gauge(
+    "login_audit_pending",
+    "DB 반영 대기 중인 로그인 감사 이벤트 수",
+)
+
+
+def _to_json(row: dict) -> str:
+    return json.dumps(
+        {
+            key: str(value) if isinstance(value, uuid.UUID) else value
+            for key, value in row.items()
+        },
+        default=lambda value: value.isoformat(),
+    )
+
+
+def _from_json(line: str) -> dict:
+    row = json.loads(line)
+    for field in _UUID_FIELDS:
+        if row.get(field):
+            row[field] = uuid.UUID(row[field])
+    for field in _DATETIME_FIELDS:
+        if row.get(field):
+            row[field] = datetime.fromisoformat(row[field])
+    return row
+
+
+class LoginAuditRecorder:
+    """로그인 감사 이벤트를 모아 일괄 반영하는 기록기"""
+
+    def __init__(
+        self,
+        flush_interval: float,
+        batch_size: int,
+        max_pending: int,
+        spool_dir: str,
+    ):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.spool_dir = Path(spool_dir)
+
+        self._pending: list[dict] = []
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+
+    def record(self, values: dict) -> LoginLog:
+        """감사 이벤트 기록 (DB에 연결되지 않은 LoginLog 반환)"""
+        values.setdefault("id", uuid.uuid4())
+        values.setdefault("created_at", datetime.now())
+
+        overflow = None
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                # DB 반영이 밀려 있으면 메모리를 늘리지 않고 스풀로 기록
+                overflow = [values]
+            else:
+                self._pending.append(values)
+                if len(self._pending) >= self.batch_size:
+                    self._wakeup.set()
+            PENDING.set(len(self._pending))
+
+        if overflow:
+            self._spool(overflow)
+        self._ensure_worker()
+        return LoginLog(**values)
+
+    def flush(self) -> int:
+        """대기 중인 이벤트와 스풀을 DB에 반영하고 반영 건수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                PENDING.set(0)
+
+            if not self._replay_spool():
+                # DB를 사용할 수 없으면 이번 이벤트도 스풀로 보존
+                if rows:
+                    self._spool(rows)
+                return 0
+
+            if not rows:
+                return 0
+            started = time.perf_counter()
+            try:
+                self._insert(rows)
+            except SQLAlchemyError as e:
+                logger.warning(
+                    f"로그인 감사 로그 반영 실패 ({len(rows)}건), 스풀 기록: {e}"
+                )
+                self._spool(rows)
+                return 0
+
+            FLUSH_DURATION.observe(time.perf_counter() - started)
+            FLUSH_SIZE.observe(len(rows))
+            return len(rows)
+
+    def stop(self) -> None:
+        """플러시 스레드 종료 및 남은 이벤트 반영"""
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.flush_interval + 5)
+            self._worker = None
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # DB 반영
+    # ------------------------------------------------------------------
+    def _insert(self, rows: list[dict]) -> None:
+        """다중 행 INSERT (id 충돌은 무시하여 재적재를 멱등하게 처리)
+
+        DB가 특정 행을 거부하면(제약 조건/데이터 오류) 행 단위로 다시
+        적재하여 거부된 행만 버립니다.
+        """
+        stmt = insert(LoginLog.__table__).on_conflict_do_nothing(
+            index_elements=["id"]
+        )
+        try:
+            with mgmt_engine.begin() as conn:
+                for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+                    conn.execute(stmt, rows[i : i + _INSERT_CHUNK_SIZE])
+        except (IntegrityError, DataError):
+            for row in rows:
+                try:
+                    with mgmt_engine.begin() as conn:
+                        conn.execute(stmt, [row])
+                except (IntegrityError, DataError) as e:
+                    DROPPED.inc()
+                    logger.error(f"로그인 감사 로그 거부됨: {row} - {e}")
+
+    # ------------------------------------------------------------------
+    # 스풀
+    # ------------------------------------------------------------------
+    @property
+    def _active_spool(self) -> Path:
+        # 워커 프로세스마다 별도 파일에 기록 (여러 워커가 같은 파일에 쓰지 않음)
+        return self.spool_dir / f"{_SPOOL_PREFIX}.{os.getpid()}.jsonl"
+
+    def _spool(self, rows: list[dict]) -> None:
+        """이벤트를 스풀 파일에 추가하고 디스크에 동기화"""
+        try:
+            with self._spool_lock:
+                self.spool_dir.mkdir(parents=True, exist_ok=True)
+                with self._active_spool.open("a", encoding="utf-8") as f:
+                    for row in rows:
+                        f.write(_to_json(row) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            SPOOLED.inc(len(rows))
+        except OSError as e:
+            DROPPED.inc(len(rows))
+            logger.error(
+                f"로그인 감사 로그 스풀 기록 실패, {len(rows)}건 유실: {e}"
+            )
+
+    def _rotate_spool(self, path: Path) -> None:
+        """재적재할 스풀 파일로 이름 변경 (이후 스풀은 새 파일에 기록)"""
+        path.rename(
+            self.spool_dir
+            / f"{_SPOOL_PREFIX}-{os.getpid()}-{time.time_ns()}.jsonl"
+        )
+
+    def _rotate_orphans(self) -> None:
+        """종료된 워커가 남긴 스풀 파일도 재적재 대상으로 이동"""
+        for path in self.spool_dir.glob(f"{_SPOOL_PREFIX}.*.jsonl"):
+            pid = path.name.split(".")[1]
+            if not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            try:
+                os.kill(int(pid), 0)
+                continue  # 실행 중인 워커의 파일
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                continue  # 다른 사용자의 실행 중인 프로세스
+            try:
+                self._rotate_spool(path)
+            except FileNotFoundError:
+                pass  # 다른 워커가 먼저 이동
+
+    def _read_spool(self, path: Path) -> list[dict]:
+        """스풀 파일 읽기 (해석할 수 없는 행은 격리 파일로 이동)"""
+        rows, corrupt = [], []
+        with path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(_from_json(line))
+                except (ValueError, TypeError):
+                    corrupt.append(line.rstrip("\n") + "\n")
+        if corrupt:
+            quarantine = path.with_suffix(_CORRUPT_SUFFIX)
+            with quarantine.open("a", encoding="utf-8") as f:
+                f.writelines(corrupt)
+                f.flush()
+                os.fsync(f.fileno())
+            QUARANTINED.inc(len(corrupt))
+            logger.error(
+                f"로그인 감사 로그 스풀 손상 행 {len(corrupt)}건 격리: "
+                f"{quarantine}"
+            )
+        return rows
+
+    def _replay_spool(self) -> bool:
+        """스풀 파일을 DB에 재적재 (DB를 사용할 수 없으면 False)"""
+        with self._spool_lock:
+            if self._active_spool.exists():
+                self._rotate_spool(self._active_spool)
+        if not self.spool_dir.exists():
+            return True
+
+        # 여러 워커가 같은 스풀 파일을 동시에 재적재하지 않도록 잠금
+        with (self.spool_dir / f"{_SPOOL_PREFIX}.lock").open("a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True  # 다른 워커가 재적재 중
+            try:
+                self._rotate_orphans()
+                return self._replay_rotated()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _replay_rotated(self) -> bool:
+        for path in sorted(self.spool_dir.glob(f"{_SPOOL_PREFIX}-*.jsonl")):
+            try:
+                rows = self._read_spool(path)
+            except OSError as e:
+                logger.error(f"로그인 감사 로그 스풀 읽기 실패: {path} - {e}")
+                continue
+            try:
+                self._insert(rows)
+            except SQLAlchemyError as e:
+                logger.warning(f"로그인 감사 로그 스풀 재적재 실패: {e}")
+                return False
+            path.unlink(missing_ok=True)
+            logger.info(f"로그인 감사 로그 스풀 재적재: {len(rows)}건")
+        return True
+
+    # ------------------------------------------------------------------
+    # 플러시 스레드
+    # ------------------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._worker is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._run,
+                name="login-audit-flusher",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(
+                    f"로그인 감사 로그 플러시 중 예외: {e}", exc_info=True
+                )
+
+
+login_audit = LoginAuditRecorder(
+    flush_interval=settings.LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS,
+    batch_size=settings.LOGIN_AUDIT_BATCH_SIZE,
+    max_pending=settings.LOGIN_AUDIT_MAX_PENDING,
+    spool_dir=settings.LOGIN_AUDIT_SPOOL_DIR,
+)
+
+__all__ = ["LoginAuditRecorder", "login_audit"]
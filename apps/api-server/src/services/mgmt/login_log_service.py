@@ -4,7 +4,9 @@ from datetime import datetime
 from fastapi import Request
 from sqlalchemy.orm import Session
 
+from src.core.config import settings
 from src.modules.mgmt.idam.login_log.model import LoginLog
+from src.services.mgmt.login_audit import login_audit
 
 
 class LoginLogService:
@@ -20,8 +22,14 @@ class LoginLogService:
         failure_reason: str | None = None,
         mfa_used: bool = False,
         mfa_method: str | None = None,
+        commit: bool = True,
     ) -> LoginLog:
-        """로그인 로그 생성"""
+        """로그인 로그 생성
+
+        LOGIN_AUDIT_WRITE_BEHIND이면 이벤트를 일괄 기록 버퍼에 넣고 DB에
+        연결되지 않은 LoginLog를 반환합니다. (db 세션은 사용하지 않음)
+        commit=False 이면 db 세션에 추가만 하고 호출자의 커밋에 포함합니다.
+        """
         ip_address = None
         user_agent = None
 
@@ -37,21 +45,26 @@ class LoginLogService:
             # User-Agent 추출
             user_agent = request.headers.get("User-Agent")
 
-        login_log = LoginLog(
-            user_id=user_id,
-            username=username,
-            attempt_type=attempt_type,
-            success=success,
-            failure_reason=failure_reason,
-            session_id=session_id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            mfa_used=mfa_used,
-            mfa_method=mfa_method,
-            created_at=datetime.now(),
-        )
+        values = {
+            "user_id": user_id,
+            "username": username,
+            "attempt_type": attempt_type,
+            "success": success,
+            "failure_reason": failure_reason,
+            "session_id": session_id,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "mfa_used": mfa_used,
+            "mfa_method": mfa_method,
+            "created_at": datetime.now(),
+        }
+        if settings.LOGIN_AUDIT_WRITE_BEHIND:
+            return login_audit.record(values)
 
+        login_log = LoginLog(**values)
         db.add(login_log)
+        if not commit:
+            return login_log
         db.commit()
         db.refresh(login_log)
 
@@ -66,6 +79,7 @@ class LoginLogService:
         session_id: str | None = None,
         mfa_used: bool = False,
         mfa_method: str | None = None,
+        commit: bool = True,
     ) -> LoginLog:
         """성공적인 로그인 기록"""
         return LoginLogService.create_login_log(
@@ -78,6 +92,7 @@ class LoginLogService:
             session_id=session_id,
             mfa_used=mfa_used,
             mfa_method=mfa_method,
+            commit=commit,
         )
 
     @staticmethod
@@ -87,6 +102,7 @@ class LoginLogService:
         username: str,
         failure_reason: str,
         request: Request | None = None,
+        commit: bool = True,
     ) -> LoginLog:
         """실패한 로그인 기록"""
         return LoginLogService.create_login_log(
@@ -97,6 +113,7 @@ class LoginLogService:
             success=False,
             request=request,
             failure_reason=failure_reason,
+            commit=commit,
         )
 
     @staticmethod
@@ -124,6 +141,7 @@ class LoginLogService:
         user_id: uuid.UUID,
         username: str,
         request: Request | None = None,
+        commit: bool = True,
     ) -> LoginLog:
         """계정 잠금 기록"""
         return LoginLogService.create_login_log(
@@ -134,6 +152,7 @@ class LoginLogService:
             success=False,
             request=request,
             failure_reason="ACCOUNT_LOCKED",
+            commit=commit,
         )
 
     @staticmethod
@@ -0,0 +1,199 @@
+"""
+로그인 무차별 대입 제한
+
+사용자명별/IP별 로그인 실패를 슬라이딩 윈도우
+(LOGIN_THROTTLE_WINDOW_SECONDS)로 집계하여, 한도를 넘은 요청은 사용자
+조회·비밀번호 검증·로그인 로그 기록 없이 즉시 거절합니다. 실패 횟수를
+users 행에 기록하지 않으므로 크리덴셜 스터핑이 특정 사용자 행의 잠금
+경합이나 DB 쓰기로 이어지지 않습니다.
+
+- redis 백엔드: 키별 정렬 집합(시도 시각)을 여러 워커가 공유
+- memory 백엔드: 프로세스 내 deque (테스트/단일 프로세스용)
+- Redis 장애 시에는 일정 시간 동안 memory 백엔드로 대체 (워커별 집계)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+
+import redis
+
+from src.core.config import settings
+from src.core.redis_client import RedisGuard
+
+logger = logging.getLogger(__name__)
+
+_USER_KEY_PREFIX = "idam:login:failures:user:"
+_IP_KEY_PREFIX = "idam:login:failures:ip:"
+_MAX_LOCAL_KEYS = 100000
+
+
+class LoginThrottledError(RuntimeError):
+    """로그인 실패 한도 초과"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요."
+        )
+        self.retry_after = retry_after
+
+
+class LoginThrottle:
+    """사용자명/IP별 슬라이딩 윈도우 로그인 실패 제한"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        backend: str,
+        window_seconds: int,
+        max_per_username: int,
+        max_per_ip: int,
+    ):
+        self.enabled = enabled
+        self.backend = backend
+        self.window_seconds = window_seconds
+        self.max_per_username = max_per_username
+        self.max_per_ip = max_per_ip
+
+        # key -> 실패 시각(epoch) 목록 (memory 백엔드 및 Redis 장애 시)
+        self._local: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+        self._redis = RedisGuard("로그인 실패 제한")
+
+    def check(self, username: str, ip_address: str | None = None) -> None:
+        """한도를 넘었으면 LoginThrottledError (DB 조회 전에 호출)"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        retry_after = 0
+        for key, limit in self._limits((username,), ip_address):
+            oldest, count = self._window(key, now)
+            if count >= limit:
+                retry_after = max(
+                    retry_after, int(oldest + self.window_seconds - now) + 1
+                )
+        if retry_after:
+            raise LoginThrottledError(retry_after)
+
+    def record_failure(
+        self,
+        username: str,
+        ip_address: str | None = None,
+        aliases: tuple[str, ...] = (),
+    ) -> bool:
+        """로그인 실패 기록 (사용자명 한도에 도달했으면 True)
+
+        aliases에 계정의 다른 식별자(사용자명/이메일)를 주면 같은 계정을
+        식별자를 바꿔 가며 시도해도 함께 집계됩니다.
+        """
+        if not self.enabled:
+            return False
+
+        now = time.time()
+        locked = False
+        for key, limit in self._limits((username, *aliases), ip_address):
+            count = self._add(key, now)
+            if key.startswith(_USER_KEY_PREFIX) and count == limit:
+                locked = True
+        return locked
+
+    def reset(self, *usernames: str) -> None:
+        """로그인 성공 시 사용자명 실패 기록 초기화 (IP 기록은 유지)"""
+        if not self.enabled:
+            return
+
+        keys = {self._username_key(username) for username in usernames}
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+        if self.backend == "redis":
+            self._redis.call(lambda r: r.delete(*keys))
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return _USER_KEY_PREFIX + username.strip().lower()
+
+    def _limits(self, usernames: tuple[str, ...], ip_address: str | None):
+        keys = {self._username_key(username) for username in usernames}
+        for key in keys:
+            yield key, self.max_per_username
+        if ip_address:
+            yield _IP_KEY_PREFIX + ip_address, self.max_per_ip
+
+    def _window(self, key: str, now: float) -> tuple[float, int]:
+        """윈도우 내 (가장 오래된 실패 시각, 실패 수)"""
+        if self.backend == "redis":
+
+            def read(r: redis.Redis):
+                pipe = r.pipeline(transaction=True)
+                pipe.zremrangebyscore(key, "-inf", now - self.window_seconds)
+                pipe.zrange(key, 0, 0, withscores=True)
+                pipe.zcard(key)
+                return pipe.execute()
+
+            result = self._redis.call(read)
+            if result is not None:
+                _, oldest, count = result
+                return (oldest[0][1] if oldest else now), count
+
+        with self._lock:
+            attempts = self._prune(key, now)
+            if not attempts:
+                return now, 0
+            return attempts[0], len(attempts)
+
+    def _add(self, key: str, now: float) -> int:
+        """실패 추가 후 윈도우 내 실패 수 반환"""
+        if self.backend == "redis":
+
+            def write(r: redis.Redis):
+                pipe = r.pipeline(transaction=True)
+                pipe.zremrangebyscore(key, "-inf", now - self.window_seconds)
+                pipe.zadd(key, {uuid.uuid4().hex: now})
+                pipe.zcard(key)
+                pipe.expire(key, self.window_seconds)
+                return pipe.execute()
+
+            result = self._redis.call(write)
+            if result is not None:
+                return result[2]
+
+        with self._lock:
+            if len(self._local) >= _MAX_LOCAL_KEYS:
+                # 무작위 사용자명 대입으로 키가 쌓이면 지난 항목 일괄 정리
+                for stale in list(self._local):
+                    self._prune(stale, now)
+            attempts = self._prune(key, now)
+            if attempts is None:
+                attempts = self._local[key] = deque()
+            attempts.append(now)
+            return len(attempts)
+
+    def _prune(self, key: str, now: float) -> deque[float] | None:
+        """윈도우가 지난 실패 제거 (self._lock 안에서 호출)"""
+        attempts = self._local.get(key)
+        if attempts is None:
+            return None
+        while attempts and attempts[0] <= now - self.window_seconds:
+            attempts.popleft()
+        if not attempts:
+            del self._local[key]
+            return None
+        return attempts
+
+
+login_throttle = LoginThrottle(
+    enabled=settings.LOGIN_THROTTLE_ENABLED,
+    backend=settings.LOGIN_THROTTLE_BACKEND,
+    window_seconds=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+    max_per_username=settings.LOGIN_THROTTLE_MAX_PER_USERNAME,
+    max_per_ip=settings.LOGIN_THROTTLE_MAX_PER_IP,
+)
+
+__all__ = ["LoginThrottle", "LoginThrottledError", "login_throttle"]
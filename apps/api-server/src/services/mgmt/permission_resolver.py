@@ -0,0 +1,338 @@
+"""
+사용자 유효 권한 조회기
+
+user_roles → roles → role_permissions → permissions 4개 테이블 조인을
+요청마다 수행하지 않도록 사용자별 유효 권한 코드 집합(frozenset)을
+2단계로 캐시합니다.
+
+- L1: 프로세스 내 LRU (짧은 TTL, 최대 항목 수 제한)
+- L2: Redis 해시 (사용자별 키, 테넌트 컨텍스트별 필드)
+
+무효화 범위는 두 가지입니다.
+- 사용자 단위: 사용자-역할 매핑 변경 시 해당 사용자 키 삭제 및 사용자
+  버전 증가
+- 전체: 역할-권한 매핑, 역할/권한 수정·삭제 시 세대(generation)를 올려
+  기존 L2 항목을 모두 무효화
+
+두 경우 모두 pub/sub 채널로 다른 워커의 L1에 전파하며, 전파가 누락되더라도
+L1 TTL(PERMISSION_CACHE_LOCAL_TTL_SECONDS) 이후에는 반영됩니다.
+
+무효화 전에 시작된 조회가 무효화 후에 이전 권한을 다시 저장하지 않도록,
+L1은 프로세스 내 세대를, L2는 조회 전에 읽은 세대/사용자 버전이 그대로일
+때만 저장합니다 (Lua 스크립트로 확인 후 저장).
+"""
+
+import json
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+
+import redis
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.lru import LRUCache
+from src.core.redis_client import InvalidationListener, RedisGuard
+
+_KEY_PREFIX = "idam:permissions:"
+_GENERATION_KEY = _KEY_PREFIX + "generation"
+_USER_VERSION_PREFIX = _KEY_PREFIX + "ver:"
+_GLOBAL_CONTEXT = "global"
+_INVALIDATE_ALL = "*"
+
+# KEYS: 권한 키, 세대 키, 사용자 버전 키
+# ARGV: 세대, 사용자 버전, 필드, 직렬화 데이터, TTL
+# 조회 후 무효화가 있었으면(세대/버전 변경) 저장하지 않음
+_SET_IF_VERSION_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[2]) or '0') ~= tonumber(ARGV[1])
+    or tonumber(redis.call('GET', KEYS[3]) or '0') ~= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[3], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+
+def _context(tenant_id: uuid.UUID | str | None) -> str:
+    return str(tenant_id) if tenant_id else _GLOBAL_CONTEXT
+
+
+class PermissionResolver:
+    """사용자 유효 권한의 2단계(L1 LRU + Redis) 캐시"""
+
+    def __init__(
+        self,
+        max_size: int,
+        local_ttl: int,
+        redis_ttl: int,
+        channel: str,
+    ):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.channel = channel
+
+        # (user_id, context) -> 권한 코드 집합
+        self._local: LRUCache[tuple[str, str], frozenset] = LRUCache(
+            max_size
+        )
+        self._lock = threading.Lock()
+        # 무효화마다 증가 (진행 중이던 조회 결과의 L1 저장 방지)
+        self._generation = 0
+        self._script = None
+        self._redis = RedisGuard("권한 캐시")
+        self._listener = InvalidationListener(
+            channel,
+            name="permission-cache-invalidation",
+            label="권한 캐시 무효화 구독",
+            on_message=self._apply,
+            # 재연결 사이에 놓친 무효화가 있을 수 있으므로 L1을 비움
+            on_subscribe=lambda _client: self.clear(),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def resolve(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID | str,
+        tenant_id: uuid.UUID | str | None = None,
+    ) -> frozenset[str]:
+        """사용자의 유효 권한 코드 집합
+
+        글로벌 역할(tenant_context 없음)과, tenant_id가 주어지면 해당
+        테넌트 범위 역할의 활성 권한을 합칩니다.
+        """
+        self._listener.start()
+        key = (str(user_id), _context(tenant_id))
+
+        with self._lock:
+            codes = self._local.get(key)
+            if codes is not None:
+                return codes
+            local_generation = self._generation
+
+        cached, versions = self._redis_get(*key)
+        if cached is not None:
+            codes, expires_ts = cached
+            self._store_local(key, codes, expires_ts, local_generation)
+            return codes
+
+        codes, expires_at = await self._load(db, user_id, tenant_id)
+        expires_ts = expires_at.timestamp() if expires_at else None
+        self._store_local(key, codes, expires_ts, local_generation)
+        if versions is not None:
+            self._redis_set(*key, codes, versions, expires_ts)
+        return codes
+
+    async def has_permissions(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID | str,
+        *permission_codes: str,
+        tenant_id: uuid.UUID | str | None = None,
+    ) -> bool:
+        """사용자가 지정한 권한을 모두 보유했는지 여부"""
+        granted = await self.resolve(db, user_id, tenant_id)
+        return granted.issuperset(permission_codes)
+
+    @staticmethod
+    async def _load(
+        db: AsyncSession,
+        user_id: uuid.UUID | str,
+        tenant_id: uuid.UUID | str | None,
+    ) -> tuple[frozenset[str], datetime | None]:
+        """DB에서 유효 권한과 가장 이른 역할 만료 시각 조회"""
+        # 각 모듈 패키지가 서비스(→ 이 모듈)를 import하므로 순환 방지를 위해
+        # 모델은 호출 시점에 import
+        from src.modules.mgmt.idam.permission.model import Permission
+        from src.modules.mgmt.idam.role.model import Role
+        from src.modules.mgmt.idam.role_permission.model import (
+            RolePermission,
+        )
+        from src.modules.mgmt.idam.user_role.model import UserRole
+
+        now = datetime.now(UTC)
+        tenant_filter = UserRole.tenant_context.is_(None)
+        if tenant_id:
+            tenant_filter = or_(
+                tenant_filter, UserRole.tenant_context == tenant_id
+            )
+
+        rows = await db.execute(
+            select(
+                Permission.permission_code,
+                func.min(UserRole.expires_at),
+            )
+            .join(Role, Role.id == UserRole.role_id)
+            .join(RolePermission, RolePermission.role_id == Role.id)
+            .join(Permission, Permission.id == RolePermission.permission_id)
+            .filter(
+                UserRole.user_id == user_id,
+                UserRole.status == "ACTIVE",
+                or_(UserRole.expires_at.is_(None), UserRole.expires_at > now),
+                tenant_filter,
+                Role.status == "ACTIVE",
+                Permission.status == "ACTIVE",
+            )
+            .group_by(Permission.permission_code)
+        )
+
+        codes = set()
+        earliest = None
+        for code, expires_at in rows:
+            codes.add(code)
+            if expires_at and (earliest is None or expires_at < earliest):
+                earliest = expires_at
+        return frozenset(codes), earliest
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+    def invalidate_user(self, *user_ids: uuid.UUID | str) -> None:
+        """사용자 권한 캐시 무효화 및 다른 워커로 전파 (역할 매핑 변경 시)"""
+        user_ids = tuple(str(user_id) for user_id in user_ids if user_id)
+        if not user_ids:
+            return
+
+        self._drop_local(user_ids)
+        self._redis.call(lambda r: self._invalidate_users(r, user_ids))
+
+    def invalidate_all(self) -> None:
+        """전체 권한 캐시 무효화 (역할-권한 매핑, 역할/권한 변경 시)"""
+        self.clear()
+        self._redis.call(lambda r: r.incr(_GENERATION_KEY))
+        self._redis.call(
+            lambda r: r.publish(self.channel, json.dumps([_INVALIDATE_ALL]))
+        )
+
+    def _invalidate_users(self, r: redis.Redis, user_ids) -> None:
+        # 버전을 올려 진행 중인 조회가 이전 권한을 다시 저장하지 못하게 함
+        pipe = r.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.incr(_USER_VERSION_PREFIX + user_id)
+            pipe.expire(_USER_VERSION_PREFIX + user_id, self.redis_ttl)
+        pipe.delete(*[_KEY_PREFIX + user_id for user_id in user_ids])
+        pipe.publish(self.channel, json.dumps(user_ids))
+        pipe.execute()
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 비우기"""
+        with self._lock:
+            self._local.clear()
+            self._generation += 1
+
+    def stop_listener(self) -> None:
+        """무효화 구독 스레드 종료"""
+        self._listener.stop()
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _apply(self, user_ids: list[str]) -> None:
+        """다른 워커의 무효화 메시지를 L1에 반영"""
+        if _INVALIDATE_ALL in user_ids:
+            self.clear()
+        else:
+            self._drop_local(user_ids)
+
+    def _store_local(
+        self,
+        key: tuple[str, str],
+        codes: frozenset,
+        expires_ts: float | None,
+        generation: int,
+    ) -> None:
+        # 역할 만료 시각 이후에는 캐시된 권한을 사용하지 않음
+        ttl = self.local_ttl
+        if expires_ts is not None:
+            ttl = min(ttl, expires_ts - time.time())
+        with self._lock:
+            if generation != self._generation:
+                return  # 조회 중 무효화됨
+            self._local.set(key, codes, ttl)
+
+    def _drop_local(self, user_ids) -> None:
+        user_ids = set(user_ids)
+        with self._lock:
+            for key, _codes in self._local.items():
+                if key[0] in user_ids:
+                    self._local.pop(key)
+            self._generation += 1
+
+    def _redis_get(
+        self, user_id: str, context: str
+    ) -> tuple[
+        tuple[frozenset, float | None] | None, tuple[int, int] | None
+    ]:
+        """L2 조회 결과(권한, 만료 시각)와 현재 (세대, 사용자 버전) 반환
+
+        세대가 다르거나 역할 만료 시각이 지난 항목은 무시합니다.
+        Redis 호출에 실패하면 버전은 None입니다.
+        """
+
+        def read(r: redis.Redis):
+            pipe = r.pipeline(transaction=False)
+            pipe.hget(_KEY_PREFIX + user_id, context)
+            pipe.get(_GENERATION_KEY)
+            pipe.get(_USER_VERSION_PREFIX + user_id)
+            return pipe.execute()
+
+        result = self._redis.call(read)
+        if result is None:
+            return None, None
+
+        raw, generation, user_version = result
+        versions = (int(generation or 0), int(user_version or 0))
+        if not raw:
+            return None, versions
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None, versions
+        expires_ts = data.get("exp")
+        if data.get("gen") != versions[0] or (
+            expires_ts is not None and expires_ts <= time.time()
+        ):
+            return None, versions
+        return (frozenset(data["codes"]), expires_ts), versions
+
+    def _redis_set(
+        self,
+        user_id: str,
+        context: str,
+        codes: frozenset,
+        versions: tuple[int, int],
+        expires_ts: float | None,
+    ) -> None:
+        generation, user_version = versions
+        data = json.dumps(
+            {"gen": generation, "exp": expires_ts, "codes": sorted(codes)}
+        )
+        self._redis.call(
+            lambda r: self._set_script(r)(
+                keys=[
+                    _KEY_PREFIX + user_id,
+                    _GENERATION_KEY,
+                    _USER_VERSION_PREFIX + user_id,
+                ],
+                args=[generation, user_version, context, data, self.redis_ttl],
+            )
+        )
+
+    def _set_script(self, r: redis.Redis):
+        if self._script is None:
+            self._script = r.register_script(_SET_IF_VERSION_SCRIPT)
+        return self._script
+
+
+permission_resolver = PermissionResolver(
+    max_size=settings.PERMISSION_CACHE_MAX_SIZE,
+    local_ttl=settings.PERMISSION_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.PERMISSION_CACHE_REDIS_TTL_SECONDS,
+    channel=settings.PERMISSION_CACHE_CHANNEL,
+)
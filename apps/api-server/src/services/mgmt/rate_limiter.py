@@ -0,0 +1,425 @@
+"""
+API 호출 제한 (intg.rate_limits)
+
+intg.rate_limits의 제한 규칙을 메모리에 적재하여 요청마다 DB를 조회하지
+않고 토큰 버킷으로 집행합니다.
+
+- 규칙: 대상(tenant_id/user_id/api_key_id/client_ip) 중 지정된 값이 모두
+  요청과 일치하면 적용. 대상이 없는 규칙은 전체 요청에 적용
+- 버킷: 규칙당 하나. 용량 = limit_value + burst_allowance,
+  충전 속도 = limit_value / window_size (초당)
+- 한 요청에 여러 규칙이 적용되면 하나의 Lua 스크립트로 모든 버킷을
+  원자적으로 확인하여, 차단된 요청은 어떤 버킷의 토큰도 소모하지 않음
+- action_on_exceed: BLOCK(429), THROTTLE(RATE_LIMIT_THROTTLE_MAX_DELAY_SECONDS
+  이내면 대기 후 재시도), LOG_ONLY(기록만 하고 통과)
+- total_requests/blocked_requests/last_access_at은 메모리에 누적했다가
+  RATE_LIMIT_STATS_FLUSH_SECONDS마다 한 번의 UPDATE로 반영
+
+RATE_LIMIT_BACKEND=memory이면 프로세스 내 버킷을 사용합니다 (단일 노드).
+redis 백엔드에서 Redis 장애 시에도 일정 시간 동안 프로세스 내 버킷으로
+대체합니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+
+import redis
+from prometheus_client import Counter
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.config import settings
+from src.core.database import mgmt_engine
+from src.core.redis_client import RedisGuard
+from src.modules.mgmt.intg.rate_limit.model import RateLimit
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "intg:rate_limits:bucket:"
+_TARGET_FIELDS = ("tenant_id", "user_id", "api_key_id", "client_ip")
+# 요청 수 기반이 아닌 제한 유형은 이 미들웨어에서 집행하지 않음
+_UNSUPPORTED_LIMIT_TYPES = ("BANDWIDTH",)
+
+DECISIONS = Counter(
+    "rate_limit_decisions_total",
+    "API 호출 제한 판정 수",
+    ["result"],
+)
+
+# KEYS: 버킷 키 목록
+# ARGV: (용량, 초당 충전량, 집행 여부) 반복
+# 반환: {허용 여부, 대기 초(문자열), 규칙별 초과 여부...}
+# 집행 규칙 중 하나라도 토큰이 부족하면 어떤 버킷도 차감하지 않음
+_TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local tokens = {}
+local exceeded = {}
+local allowed = 1
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local base = (i - 1) * 3
+    local capacity = tonumber(ARGV[base + 1])
+    local rate = tonumber(ARGV[base + 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local current = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    current = math.min(capacity, current + math.max(0, now - ts) * rate)
+    tokens[i] = current
+    exceeded[i] = 0
+    if current < 1 then
+        exceeded[i] = 1
+        if ARGV[base + 3] == '1' then
+            allowed = 0
+            retry_after = math.max(retry_after, (1 - current) / rate)
+        end
+    end
+end
+for i, key in ipairs(KEYS) do
+    local base = (i - 1) * 3
+    local current = tokens[i]
+    if allowed == 1 and exceeded[i] == 0 then
+        current = current - 1
+    end
+    local ttl = math.ceil(tonumber(ARGV[base + 1]) / tonumber(ARGV[base + 2]))
+    redis.call('HSET', key, 'tokens', tostring(current), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.max(ttl, 1))
+end
+local result = {allowed, tostring(retry_after)}
+for i = 1, #KEYS do
+    result[#result + 1] = exceeded[i]
+end
+return result
+"""
+
+
+class RateLimitRule:
+    """메모리에 적재한 제한 규칙"""
+
+    __slots__ = ("id", "targets", "capacity", "rate", "limit", "action")
+
+    def __init__(
+        self,
+        id: str,
+        targets: tuple[tuple[str, str], ...],
+        limit: int,
+        window_size: int,
+        burst_allowance: int,
+        action: str,
+    ):
+        self.id = id
+        self.targets = targets
+        self.limit = limit
+        self.capacity = limit + burst_allowance
+        self.rate = limit / window_size
+        self.action = action
+
+    def matches(self, subject: dict[str, str]) -> bool:
+        return all(
+            subject.get(field) == value for field, value in self.targets
+        )
+
+
+class RateLimitDecision:
+    """제한 판정 결과"""
+
+    __slots__ = ("allowed", "retry_after", "rule", "throttle")
+
+    def __init__(
+        self,
+        allowed: bool,
+        retry_after: float = 0.0,
+        rule: RateLimitRule | None = None,
+        throttle: bool = False,
+    ):
+        self.allowed = allowed
+        self.retry_after = retry_after
+        self.rule = rule
+        # 초과한 집행 규칙이 모두 THROTTLE이면 대기 후 재시도 가능
+        self.throttle = throttle
+
+
+ALLOWED = RateLimitDecision(True)
+
+
+class RateLimiter:
+    """intg.rate_limits 규칙을 토큰 버킷으로 집행"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        backend: str,
+        rules_refresh_seconds: int,
+        stats_flush_seconds: int,
+    ):
+        self.enabled = enabled
+        self.backend = backend
+        self.rules_refresh_seconds = rules_refresh_seconds
+        self.stats_flush_seconds = stats_flush_seconds
+
+        # (대상 필드, 값) -> 규칙 목록 (규칙의 첫 번째 대상으로 색인)
+        self._index: dict[tuple[str, str], list[RateLimitRule]] = {}
+        self._global: list[RateLimitRule] = []
+        # rule_id -> [총 요청 수, 차단 수, 마지막 접근 시각(epoch)]
+        self._stats: dict[str, list] = {}
+        # 프로세스 내 버킷: rule_id -> (토큰, 갱신 시각(monotonic))
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._script = None
+        self._redis = RedisGuard("API 호출 제한")
+        self._worker: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    # ------------------------------------------------------------------
+    # 판정
+    # ------------------------------------------------------------------
+    def check(self, subject: dict[str, str]) -> RateLimitDecision:
+        """요청 대상에 적용되는 규칙의 토큰을 소모하고 판정 반환"""
+        if not self.enabled:
+            return ALLOWED
+        self._ensure_worker()
+
+        rules = self._match(subject)
+        if not rules:
+            return ALLOWED
+
+        result = None
+        if self.backend == "redis":
+            result = self._redis.call(lambda r: self._take_redis(r, rules))
+        if result is None:
+            result = self._take_local(rules)
+        allowed, retry_after, exceeded = result
+
+        now = time.time()
+        blocking = None
+        with self._lock:
+            for rule, over in zip(rules, exceeded):
+                stats = self._stats.setdefault(rule.id, [0, 0, now])
+                stats[0] += 1
+                stats[2] = now
+                if over:
+                    stats[1] += 1
+                    if rule.action == "LOG_ONLY":
+                        logger.info(f"API 호출 제한 초과 (기록만): {rule.id}")
+                    elif blocking is None or rule.action == "BLOCK":
+                        blocking = rule
+
+        if allowed:
+            DECISIONS.labels(result="allowed").inc()
+            return ALLOWED
+        DECISIONS.labels(result="limited").inc()
+        throttle = all(
+            rule.action == "THROTTLE"
+            for rule, over in zip(rules, exceeded)
+            if over and rule.action != "LOG_ONLY"
+        )
+        return RateLimitDecision(False, retry_after, blocking, throttle)
+
+    def _match(self, subject: dict[str, str]) -> list[RateLimitRule]:
+        rules = list(self._global)
+        for item in subject.items():
+            for rule in self._index.get(item, ()):
+                if rule.matches(subject):
+                    rules.append(rule)
+        return rules
+
+    def _take_redis(self, r: redis.Redis, rules: list[RateLimitRule]):
+        if self._script is None:
+            self._script = r.register_script(_TOKEN_BUCKET_SCRIPT)
+        args = []
+        for rule in rules:
+            args += [
+                rule.capacity,
+                rule.rate,
+                0 if rule.action == "LOG_ONLY" else 1,
+            ]
+        result = self._script(
+            keys=[_KEY_PREFIX + rule.id for rule in rules], args=args
+        )
+        allowed, retry_after, *exceeded = result
+        return bool(allowed), float(retry_after), [bool(x) for x in exceeded]
+
+    def _take_local(self, rules: list[RateLimitRule]):
+        """프로세스 내 토큰 버킷 (_TOKEN_BUCKET_SCRIPT와 같은 규칙)"""
+        now = time.monotonic()
+        with self._lock:
+            current = []
+            for rule in rules:
+                tokens, ts = self._buckets.get(rule.id, (rule.capacity, now))
+                current.append(
+                    min(rule.capacity, tokens + (now - ts) * rule.rate)
+                )
+            exceeded = [tokens < 1 for tokens in current]
+            retry_after = max(
+                (
+                    (1 - tokens) / rule.rate
+                    for rule, tokens, over in zip(rules, current, exceeded)
+                    if over and rule.action != "LOG_ONLY"
+                ),
+                default=0.0,
+            )
+            allowed = retry_after == 0.0
+            for rule, tokens, over in zip(rules, current, exceeded):
+                if allowed and not over:
+                    tokens -= 1
+                self._buckets[rule.id] = (tokens, now)
+        return allowed, retry_after, exceeded
+
+    # ------------------------------------------------------------------
+    # 규칙 적재
+    # ------------------------------------------------------------------
+    def load_rules(self) -> int:
+        """intg.rate_limits에서 유효한 규칙을 다시 적재하고 규칙 수 반환"""
+        stmt = select(
+            RateLimit.id,
+            *(getattr(RateLimit, field) for field in _TARGET_FIELDS),
+            RateLimit.limit_value,
+            RateLimit.window_size,
+            RateLimit.burst_allowance,
+            RateLimit.action_on_exceed,
+        ).filter(
+            RateLimit.deleted == False,  # noqa: E712
+            or_(
+                RateLimit.expires_at.is_(None),
+                RateLimit.expires_at > func.now(),
+            ),
+            RateLimit.limit_type.notin_(_UNSUPPORTED_LIMIT_TYPES),
+            RateLimit.limit_value > 0,
+            RateLimit.window_size > 0,
+        )
+        with mgmt_engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+
+        index: dict[tuple[str, str], list[RateLimitRule]] = {}
+        global_rules = []
+        for row in rows:
+            targets = tuple(
+                (field, str(value))
+                for field, value in zip(_TARGET_FIELDS, row[1:5])
+                if value is not None
+            )
+            rule = RateLimitRule(
+                id=str(row.id),
+                targets=targets,
+                limit=row.limit_value,
+                window_size=row.window_size,
+                burst_allowance=row.burst_allowance or 0,
+                action=row.action_on_exceed,
+            )
+            if targets:
+                index.setdefault(targets[0], []).append(rule)
+            else:
+                global_rules.append(rule)
+
+        self._index, self._global = index, global_rules
+        with self._lock:
+            # 삭제된 규칙의 프로세스 내 버킷 정리
+            live = {str(row.id) for row in rows}
+            self._buckets = {
+                k: v for k, v in self._buckets.items() if k in live
+            }
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # 통계 반영
+    # ------------------------------------------------------------------
+    def flush_stats(self) -> int:
+        """누적한 요청/차단 수를 한 번의 UPDATE로 반영하고 규칙 수 반환"""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        if not stats:
+            return 0
+
+        values = []
+        params = {}
+        for i, (rule_id, (total, blocked, last)) in enumerate(stats.items()):
+            values.append(
+                f"(CAST(:id{i} AS uuid), :t{i}, :b{i}, "
+                f"CAST(:a{i} AS timestamptz))"
+            )
+            params[f"id{i}"] = rule_id
+            params[f"t{i}"] = total
+            params[f"b{i}"] = blocked
+            params[f"a{i}"] = datetime.fromtimestamp(last, tz=UTC)
+        sql = f"""
+UPDATE intg.rate_limits AS r
+SET total_requests = COALESCE(r.total_requests, 0) + v.total,
+    blocked_requests = COALESCE(r.blocked_requests, 0) + v.blocked,
+    last_access_at = GREATEST(r.last_access_at, v.last_access_at)
+FROM (VALUES {", ".join(values)})
+    AS v(id, total, blocked, last_access_at)
+WHERE r.id = v.id
+"""
+        try:
+            with mgmt_engine.begin() as conn:
+                conn.execute(text(sql), params)
+        except SQLAlchemyError as e:
+            logger.warning(f"API 호출 제한 통계 반영 실패, 재시도 예정: {e}")
+            self._requeue(stats)
+            return 0
+        return len(stats)
+
+    def stop(self) -> None:
+        """백그라운드 스레드 종료 및 남은 통계 반영"""
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.stats_flush_seconds + 5)
+            self._worker = None
+        self.flush_stats()
+
+    def _requeue(self, stats: dict[str, list]) -> None:
+        with self._lock:
+            for rule_id, (total, blocked, last) in stats.items():
+                current = self._stats.setdefault(rule_id, [0, 0, last])
+                current[0] += total
+                current[1] += blocked
+                current[2] = max(current[2], last)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드 (규칙 갱신 + 통계 반영)
+    # ------------------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._worker is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._run,
+                name="rate-limit-worker",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        refresh_at = 0.0
+        while not self._stop_event.is_set():
+            if time.monotonic() >= refresh_at:
+                try:
+                    count = self.load_rules()
+                    logger.debug(f"API 호출 제한 규칙 적재: {count}개")
+                    refresh_at = time.monotonic() + self.rules_refresh_seconds
+                except SQLAlchemyError as e:
+                    # 적재 실패 시 기존 규칙을 유지하고 다음 주기에 재시도
+                    logger.warning(f"API 호출 제한 규칙 적재 실패: {e}")
+                    refresh_at = time.monotonic() + self.stats_flush_seconds
+            if self._stop_event.wait(self.stats_flush_seconds):
+                break
+            try:
+                self.flush_stats()
+            except Exception as e:
+                logger.error(
+                    f"API 호출 제한 통계 반영 중 예외: {e}", exc_info=True
+                )
+
+
+rate_limiter = RateLimiter(
+    enabled=settings.RATE_LIMIT_ENABLED,
+    backend=settings.RATE_LIMIT_BACKEND,
+    rules_refresh_seconds=settings.RATE_LIMIT_RULES_REFRESH_SECONDS,
+    stats_flush_seconds=settings.RATE_LIMIT_STATS_FLUSH_SECONDS,
+)
+
+__all__ = ["RateLimitDecision", "RateLimiter", "rate_limiter"]
@@ -0,0 +1,192 @@
+"""
+세션 활동 시각 지연 기록 (write-behind)
+
+요청마다 idam.sessions.last_activity_at을 커밋하는 대신, 활동 시각을 메모리에
+세션 해시 단위로 모아 두었다가 주기적으로 한 번의
+UPDATE ... FROM (VALUES ...) 문으로 일괄 반영합니다.
+
+- 마지막 활동 시각이 SESSION_ACTIVITY_MIN_INTERVAL_SECONDS 이내이면 기록하지 않음
+- 같은 세션의 여러 요청은 최신 시각 하나로 병합
+- 플러시 실패 시 다음 주기에 재시도, 종료 시 남은 항목 플러시
+"""
+
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.config import settings
+from src.core.database import mgmt_engine
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_CHUNK_SIZE = 1000
+
+FLUSH_SIZE = Histogram(
+    "session_activity_flush_size",
+    "세션 활동 시각 일괄 반영 시 갱신 대상 세션 수",
+    buckets=(1, 5, 10, 50, 100, 500, 1000, 5000),
+)
+FLUSH_LAG = Histogram(
+    "session_activity_flush_lag_seconds",
+    "가장 오래된 미반영 활동이 기록된 후 DB에 반영되기까지의 시간",
+    buckets=(1, 5, 10, 15, 30, 60, 120, 300),
+)
+FLUSH_DURATION = Histogram(
+    "session_activity_flush_duration_seconds",
+    "세션 활동 시각 일괄 UPDATE 실행 시간",
+)
+FLUSH_FAILURES = Counter(
+    "session_activity_flush_failures_total",
+    "세션 활동 시각 일괄 반영 실패 횟수",
+)
+PENDING = Gauge(
+    "session_activity_pending",
+    "DB 반영 대기 중인 세션 수",
+)
+
+_UPDATE_SQL = """
+UPDATE idam.sessions AS s
+SET last_activity_at = v.last_activity_at
+FROM (VALUES {values}) AS v(session_id, last_activity_at)
+WHERE s.session_id = v.session_id
+  AND s.status = 'ACTIVE'
+  AND s.last_activity_at < v.last_activity_at
+"""
+
+
+class SessionActivityRecorder:
+    """세션 활동 시각을 모아 주기적으로 일괄 반영하는 기록기"""
+
+    def __init__(self, min_interval: int, flush_interval: int):
+        self.min_interval = min_interval
+        self.flush_interval = flush_interval
+
+        self._pending: dict[str, float] = {}  # session_hash -> epoch
+        self._touched: dict[str, float] = {}  # 최근 기록 시각 (중복 억제)
+        self._oldest_pending: float | None = None
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def touch(
+        self, session_hash: str, last_activity_at: datetime | None = None
+    ) -> None:
+        """세션 활동 기록 (최소 간격 이내의 반복 활동은 무시)"""
+        now = time.time()
+        known = last_activity_at.timestamp() if last_activity_at else 0.0
+
+        with self._lock:
+            known = max(known, self._touched.get(session_hash, 0.0))
+            if now - known < self.min_interval:
+                return
+
+            self._pending[session_hash] = now
+            self._touched[session_hash] = now
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            PENDING.set(len(self._pending))
+
+        self._ensure_worker()
+
+    def flush(self) -> int:
+        """대기 중인 활동 시각을 DB에 일괄 반영하고 반영 건수 반환"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = self._pending
+            oldest = self._oldest_pending
+            self._pending = {}
+            self._oldest_pending = None
+            self._prune_touched()
+            PENDING.set(0)
+
+        items = list(pending.items())
+        started = time.perf_counter()
+        try:
+            with mgmt_engine.begin() as conn:
+                for i in range(0, len(items), _FLUSH_CHUNK_SIZE):
+                    chunk = items[i : i + _FLUSH_CHUNK_SIZE]
+                    conn.execute(*self._build_update(chunk))
+        except SQLAlchemyError as e:
+            FLUSH_FAILURES.inc()
+            logger.warning(
+                f"세션 활동 시각 반영 실패 ({len(items)}건), 재시도 예정: {e}"
+            )
+            self._requeue(pending, oldest)
+            return 0
+
+        FLUSH_DURATION.observe(time.perf_counter() - started)
+        FLUSH_SIZE.observe(len(items))
+        if oldest is not None:
+            FLUSH_LAG.observe(time.time() - oldest)
+        return len(items)
+
+    def stop(self) -> None:
+        """플러시 스레드 종료 및 남은 항목 반영"""
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.flush_interval + 5)
+            self._worker = None
+        self.flush()
+
+    @staticmethod
+    def _build_update(chunk: list[tuple[str, float]]):
+        values = []
+        params = {}
+        for i, (session_hash, ts) in enumerate(chunk):
+            values.append(f"(:h{i}, CAST(:t{i} AS timestamptz))")
+            params[f"h{i}"] = session_hash
+            params[f"t{i}"] = datetime.fromtimestamp(ts, tz=UTC)
+        sql = _UPDATE_SQL.format(values=", ".join(values))
+        return text(sql), params
+
+    def _requeue(self, pending: dict[str, float], oldest: float | None):
+        with self._lock:
+            for session_hash, ts in pending.items():
+                if ts > self._pending.get(session_hash, 0.0):
+                    self._pending[session_hash] = ts
+            if oldest is not None and (
+                self._oldest_pending is None or oldest < self._oldest_pending
+            ):
+                self._oldest_pending = oldest
+            PENDING.set(len(self._pending))
+
+    def _prune_touched(self) -> None:
+        # 최소 간격이 지난 항목은 다시 기록되어야 하므로 제거
+        threshold = time.time() - self.min_interval
+        self._touched = {
+            h: ts for h, ts in self._touched.items() if ts > threshold
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._run,
+                name="session-activity-flusher",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"세션 활동 플러시 중 예외: {e}", exc_info=True)
+
+
+session_activity = SessionActivityRecorder(
+    min_interval=settings.SESSION_ACTIVITY_MIN_INTERVAL_SECONDS,
+    flush_interval=settings.SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS,
+)
+
+__all__ = ["SessionActivityRecorder", "session_activity"]
@@ -0,0 +1,267 @@
+"""
+세션 검증 캐시
+
+get_current_session 경로에서 매 요청마다 idam.sessions를 조회하지 않도록
+세션 해시(SHA-256) 기준으로 검증 결과를 2단계로 캐시합니다.
+
+- L1: 프로세스 내 LRU (짧은 TTL, 최대 항목 수 제한)
+- L2: Redis (워커/인스턴스 간 공유)
+
+세션 무효화(revoke) 시 Redis 키를 삭제하고 pub/sub 채널로 해시를 전파하여
+다른 워커의 L1 항목도 즉시 제거합니다. 전파가 누락되더라도 L1 TTL
+(SESSION_CACHE_LOCAL_TTL_SECONDS) 이후에는 무효화된 토큰이 거부됩니다.
+
+무효화 전에 시작된 조회가 무효화 후에 세션을 다시 저장하지 않도록,
+무효화 시 묘비(tombstone) 키를 남기고 저장은 묘비가 없을 때만 수행합니다.
+"""
+
+import json
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import redis
+
+from src.core.config import settings
+from src.core.lru import LRUCache
+from src.core.redis_client import InvalidationListener, RedisGuard
+from src.modules.mgmt.idam.session.model import Session
+
+_KEY_PREFIX = "idam:sessions:"
+_TOMBSTONE_PREFIX = "idam:sessions:revoked:"
+
+# KEYS: 세션 키, 묘비 키 / ARGV: TTL, 직렬화 데이터
+# 무효화된 세션(묘비 존재)은 저장하지 않음
+_SET_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('SETEX', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+_UUID_FIELDS = ("id", "user_id", "tenant_context", "created_by", "updated_by")
+_DATETIME_FIELDS = (
+    "created_at",
+    "updated_at",
+    "expires_at",
+    "last_activity_at",
+    "mfa_verified_at",
+)
+
+
+def _serialize_session(session: Session) -> dict:
+    """세션 모델을 JSON 직렬화 가능한 dict로 변환"""
+    data = {}
+    for column in Session.__table__.columns:
+        value = getattr(session, column.key)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        elif value is not None and not isinstance(value, str | bool | int):
+            value = str(value)  # INET 등
+        data[column.key] = value
+    return data
+
+
+def _deserialize_session(data: dict) -> Session:
+    """캐시된 dict를 DB에 연결되지 않은(transient) 세션 모델로 복원"""
+    values = dict(data)
+    for field in _UUID_FIELDS:
+        if values.get(field):
+            values[field] = uuid.UUID(values[field])
+    for field in _DATETIME_FIELDS:
+        if values.get(field):
+            values[field] = datetime.fromisoformat(values[field])
+    return Session(**values)
+
+
+class SessionCache:
+    """세션 검증 결과의 2단계(L1 LRU + Redis) 캐시"""
+
+    def __init__(
+        self,
+        max_size: int,
+        local_ttl: int,
+        redis_ttl: int,
+        channel: str,
+    ):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.channel = channel
+
+        # session_hash -> (세션 만료 시각(epoch), 직렬화 데이터)
+        self._local: LRUCache[str, tuple[float, dict]] = LRUCache(max_size)
+        # 최근 무효화한 session_hash (redis_ttl 동안 기록)
+        self._revoked: LRUCache[str, bool] = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self._script = None
+        self._redis = RedisGuard("세션 캐시")
+        self._listener = InvalidationListener(
+            channel,
+            name="session-cache-invalidation",
+            label="세션 캐시 무효화 구독",
+            on_message=self._apply,
+            # 재연결 사이에 놓친 무효화가 있을 수 있으므로 L1을 비움
+            on_subscribe=lambda _client: self.clear(),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+    def get(self, session_hash: str) -> Session | None:
+        """캐시된 유효 세션 조회 (만료되었거나 없으면 None)"""
+        self._listener.start()
+        now = time.time()
+
+        with self._lock:
+            entry = self._local.get(session_hash)
+            if entry is not None:
+                expires_ts, data = entry
+                if expires_ts > now:
+                    return _deserialize_session(data)
+                self._local.pop(session_hash)
+
+        data = self._redis_get(session_hash)
+        if data is None:
+            return None
+
+        expires_ts = datetime.fromisoformat(data["expires_at"]).timestamp()
+        if expires_ts <= now:
+            return None
+
+        if not self._store_local(session_hash, expires_ts, data):
+            return None  # 이 워커에서 방금 무효화한 세션
+        return _deserialize_session(data)
+
+    def set(self, session_hash: str, session: Session) -> None:
+        """검증된 활성 세션을 L1/L2에 저장"""
+        if session.status != "ACTIVE" or session.expires_at is None:
+            return
+
+        expires_ts = session.expires_at.timestamp()
+        remaining = int(expires_ts - time.time())
+        if remaining <= 0:
+            return
+
+        data = _serialize_session(session)
+        if not self._store_local(session_hash, expires_ts, data):
+            return
+        self._redis.call(
+            lambda r: self._set_script(r)(
+                keys=[
+                    _KEY_PREFIX + session_hash,
+                    _TOMBSTONE_PREFIX + session_hash,
+                ],
+                args=[min(self.redis_ttl, remaining), json.dumps(data)],
+            )
+        )
+
+    def invalidate(self, *session_hashes: str) -> None:
+        """세션 캐시 무효화 및 다른 워커로 전파"""
+        if not session_hashes:
+            return
+
+        self._drop_local(session_hashes, revoked=True)
+        self._redis.call(
+            lambda r: self._invalidate(r, session_hashes, revoked=True)
+        )
+
+    def drop(self, *session_hashes: str) -> None:
+        """세션 캐시 항목 삭제 (세션 갱신용, 묘비를 남기지 않음)
+
+        연장/MFA 인증처럼 세션이 유효한 채로 속성만 바뀐 경우에 사용합니다.
+        다음 조회에서 DB의 최신 값이 다시 캐시됩니다.
+        """
+        if not session_hashes:
+            return
+
+        self._drop_local(session_hashes)
+        self._redis.call(
+            lambda r: self._invalidate(r, session_hashes, revoked=False)
+        )
+
+    def _invalidate(
+        self, r: redis.Redis, session_hashes, revoked: bool
+    ) -> None:
+        pipe = r.pipeline(transaction=False)
+        if revoked:
+            # 묘비를 먼저 남겨 진행 중인 set()이 세션을 다시 저장하지 못하게 함
+            for session_hash in session_hashes:
+                pipe.setex(
+                    _TOMBSTONE_PREFIX + session_hash, self.redis_ttl, 1
+                )
+        pipe.delete(*[_KEY_PREFIX + h for h in session_hashes])
+        pipe.publish(
+            self.channel,
+            json.dumps({"hashes": list(session_hashes), "revoked": revoked}),
+        )
+        pipe.execute()
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 비우기"""
+        with self._lock:
+            self._local.clear()
+
+    def stop_listener(self) -> None:
+        """무효화 구독 스레드 종료"""
+        self._listener.stop()
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _apply(self, payload) -> None:
+        """다른 워커의 무효화 메시지를 L1에 반영
+
+        이전 형식인 해시 목록은 무효화로 취급합니다.
+        """
+        if isinstance(payload, list):
+            self._drop_local(payload, revoked=True)
+        else:
+            self._drop_local(payload["hashes"], revoked=payload["revoked"])
+
+    def _set_script(self, r: redis.Redis):
+        if self._script is None:
+            self._script = r.register_script(_SET_SCRIPT)
+        return self._script
+
+    def _store_local(
+        self, session_hash: str, expires_ts: float, data: dict
+    ) -> bool:
+        """L1 저장 (최근 무효화된 세션이면 저장하지 않고 False)"""
+        with self._lock:
+            if session_hash in self._revoked:
+                return False
+            self._local.set(
+                session_hash, (expires_ts, data), self.local_ttl
+            )
+        return True
+
+    def _drop_local(self, session_hashes, revoked: bool = False) -> None:
+        with self._lock:
+            for session_hash in session_hashes:
+                self._local.pop(session_hash)
+                if revoked:
+                    self._revoked.set(session_hash, True, self.redis_ttl)
+
+    def _redis_get(self, session_hash: str) -> dict | None:
+        raw = self._redis.call(lambda r: r.get(_KEY_PREFIX + session_hash))
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_MAX_SIZE,
+    local_ttl=settings.SESSION_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.SESSION_CACHE_REDIS_TTL_SECONDS,
+    channel=settings.SESSION_CACHE_CHANNEL,
+)
+
+__all__ = ["SessionCache", "session_cache"]
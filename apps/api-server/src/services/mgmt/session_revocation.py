@@ -0,0 +1,220 @@
+"""
+무효화된 세션 필터 (JWT 무상태 검증용)
+
+AUTH_STATELESS_JWT 모드에서는 액세스 토큰(JWT)의 서명/만료만 로컬에서
+검증하고 DB를 조회하지 않습니다. 대신 무효화(revoke/만료 처리/삭제)된
+세션 해시를 프로세스 내 블룸 필터에 유지하여, 필터에 걸린 토큰만 DB로
+다시 검증합니다. (블룸 필터는 거짓 음성이 없으므로 무효화된 세션이
+통과하지 않고, 거짓 양성은 DB 검증으로 처리됨)
+
+- Redis 정렬 집합(idam:sessions:revoked): 해시 → 보관 기한(epoch)
+  JWT 최대 수명(ACCESS_TOKEN_EXPIRE_MINUTES)이 지나면 더 이상 일치하는
+  유효 토큰이 없으므로 제거
+- pub/sub 채널로 다른 워커의 필터에 즉시 전파
+- 구독 (재)연결 시와 SESSION_REVOCATION_REBUILD_SECONDS마다 정렬 집합으로
+  필터를 다시 구성 (블룸 필터는 삭제가 불가능하므로 기한이 지난 항목 정리)
+
+구독이 끊겨 있거나 필터가 아직 구성되지 않았으면 모든 토큰을 "무효화됐을
+수 있음"으로 간주하여 DB 검증 경로를 사용합니다. 무효화를 Redis에 기록하지
+못한 경우에도 기록에 성공할 때까지 필터를 사용하지 않습니다.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+
+import redis
+
+from src.core.config import settings
+from src.core.redis_client import InvalidationListener, RedisGuard
+
+logger = logging.getLogger(__name__)
+
+_REVOKED_KEY = "idam:sessions:revoked"
+# 토큰 발급과 보관 기한 계산 사이의 시계 오차 여유
+_RETENTION_SLACK_SECONDS = 60
+
+
+class BloomFilter:
+    """SHA-256 16진 해시를 원소로 하는 블룸 필터
+
+    원소가 이미 균일한 해시이므로 앞부분 128비트를 두 개의 64비트 값으로
+    나누어 이중 해싱(h1 + i * h2)으로 비트 위치를 구합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        h1 = int(item[:16], 16)
+        h2 = int(item[16:32], 16) | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class SessionRevocationFilter:
+    """Redis와 동기화되는 무효화 세션 블룸 필터"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        capacity: int,
+        error_rate: float,
+        rebuild_seconds: int,
+        retention_seconds: int,
+        channel: str,
+    ):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self.retention_seconds = retention_seconds
+        self.channel = channel
+
+        self._filter: BloomFilter | None = None
+        # Redis에 아직 기록하지 못한 무효화 (기록될 때까지 필터 사용 안 함)
+        self._unpublished: set[str] = set()
+        self._lock = threading.Lock()
+        self._rebuild_at = 0.0
+        self._redis = RedisGuard("세션 무효화 필터")
+        self._listener = InvalidationListener(
+            channel,
+            name="session-revocation-sync",
+            label="세션 무효화 필터 동기화",
+            on_message=self._apply,
+            on_subscribe=self._on_subscribe,
+            on_tick=self._on_tick,
+            on_error=self._on_error,
+        )
+
+    def might_be_revoked(self, session_hash: str) -> bool:
+        """무효화됐을 수 있는 세션인지 여부 (True이면 DB로 검증)"""
+        if not self.enabled:
+            return True
+        self._listener.start()
+        bloom = self._filter
+        if bloom is None:
+            return True
+        return session_hash in bloom
+
+    def revoke(self, *session_hashes: str) -> None:
+        """세션 무효화 기록 및 다른 워커로 전파
+
+        Redis에 기록하지 못하면 필터를 비워 이 워커는 DB로 검증하고,
+        동기화 스레드가 기록에 성공한 뒤 필터를 다시 구성합니다.
+        """
+        if not self.enabled or not session_hashes:
+            return
+        self._listener.start()
+
+        with self._lock:
+            if self._filter is not None:
+                for session_hash in session_hashes:
+                    self._filter.add(session_hash)
+
+        if self._redis.call(lambda r: self._write(r, session_hashes)) is None:
+            with self._lock:
+                self._unpublished.update(session_hashes)
+                self._filter = None
+            logger.error(
+                f"세션 무효화 전파 실패 ({len(session_hashes)}건), "
+                "Redis에 기록될 때까지 DB로 검증"
+            )
+
+    def _write(self, r: redis.Redis, session_hashes) -> list:
+        retain_until = (
+            time.time() + self.retention_seconds + _RETENTION_SLACK_SECONDS
+        )
+        pipe = r.pipeline(transaction=False)
+        pipe.zadd(_REVOKED_KEY, dict.fromkeys(session_hashes, retain_until))
+        pipe.publish(self.channel, json.dumps(list(session_hashes)))
+        return pipe.execute()
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+    def stop_listener(self) -> None:
+        """동기화 스레드 종료"""
+        self._listener.stop()
+
+    def _on_subscribe(self, client: redis.Redis) -> None:
+        # 구독 후 재구성해야 그 사이의 무효화가 누락되지 않음
+        self._flush_unpublished(client)
+        self._rebuild(client)
+        self._rebuild_at = time.monotonic() + self.rebuild_seconds
+
+    def _on_tick(self, client: redis.Redis) -> None:
+        """전파하지 못한 무효화 기록 및 주기적 필터 재구성"""
+        if self._unpublished:
+            self._flush_unpublished(client)
+            self._rebuild_at = 0.0
+        if time.monotonic() >= self._rebuild_at:
+            self._rebuild(client)
+            self._rebuild_at = time.monotonic() + self.rebuild_seconds
+
+    def _on_error(self) -> None:
+        # 동기화되지 않은 필터는 사용하지 않음 (DB 검증)
+        self._filter = None
+
+    def _apply(self, session_hashes: list[str]) -> None:
+        """다른 워커의 무효화를 필터에 반영"""
+        with self._lock:
+            if self._filter is not None:
+                for session_hash in session_hashes:
+                    self._filter.add(session_hash)
+
+    def _flush_unpublished(self, client: redis.Redis) -> None:
+        """전파하지 못한 무효화를 Redis에 기록 (실패하면 RedisError)"""
+        with self._lock:
+            session_hashes = tuple(self._unpublished)
+        if session_hashes:
+            self._write(client, session_hashes)
+            with self._lock:
+                self._unpublished.difference_update(session_hashes)
+
+    def _rebuild(self, client: redis.Redis) -> None:
+        """보관 기한이 남은 무효화 세션으로 필터를 새로 구성"""
+        now = time.time()
+        client.zremrangebyscore(_REVOKED_KEY, "-inf", now)
+        revoked = client.zrangebyscore(_REVOKED_KEY, now, "+inf")
+
+        bloom = BloomFilter(
+            max(self.capacity, len(revoked) * 2), self.error_rate
+        )
+        for session_hash in revoked:
+            bloom.add(session_hash)
+        with self._lock:
+            if self._unpublished:
+                return  # 전파하지 못한 무효화가 남아 있으면 DB 검증 유지
+            self._filter = bloom
+        logger.debug(f"세션 무효화 필터 재구성: {len(revoked)}건")
+
+
+session_revocation = SessionRevocationFilter(
+    enabled=settings.AUTH_STATELESS_JWT,
+    capacity=settings.SESSION_REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.SESSION_REVOCATION_BLOOM_ERROR_RATE,
+    rebuild_seconds=settings.SESSION_REVOCATION_REBUILD_SECONDS,
+    retention_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    channel=settings.SESSION_REVOCATION_CHANNEL,
+)
+
+__all__ = ["BloomFilter", "SessionRevocationFilter", "session_revocation"]
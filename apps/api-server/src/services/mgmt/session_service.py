@@ -4,9 +4,17 @@ import uuid
 from datetime import datetime, timedelta
 
 from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
+from src.core.config import settings
 from src.modules.mgmt.idam.session.model import Session
+from src.services.mgmt.session_activity import session_activity
+from src.services.mgmt.session_cache import session_cache
+from src.services.mgmt.session_revocation import session_revocation
+from src.services.mgmt.session_stats import session_stats, snapshot
 
 
 class SessionService:
@@ -63,8 +71,14 @@ class SessionService:
         request: Request | None = None,
         expires_in_hours: int = 24,
         mfa_verified: bool = False,
+        commit: bool = True,
     ) -> tuple[str, Session]:
-        """새 세션 생성"""
+        """새 세션 생성
+
+        commit=False 이면 호출자의 트랜잭션 안에서 INSERT ... RETURNING으로
+        세션 행을 기록하고 커밋하지 않습니다. 이 경우 호출자가 커밋한 뒤
+        session_stats.record((None, snapshot(session)))를 호출해야 합니다.
+        """
         # 세션 토큰 생성
         session_token = SessionService.generate_session_token()
         session_id_hash = SessionService.hash_session_token(session_token)
@@ -92,23 +106,32 @@ class SessionService:
         expires_at = datetime.now() + timedelta(hours=expires_in_hours)
 
         # 세션 생성
-        session = Session(
-            session_id=session_id_hash,
-            user_id=user_id,
-            fingerprint=fingerprint,
-            user_agent=user_agent,
-            ip_address=ip_address,
-            status="ACTIVE",
-            expires_at=expires_at,
-            last_activity_at=datetime.now(),
-            mfa_verified=mfa_verified,
-            mfa_verified_at=datetime.now() if mfa_verified else None,
-            created_at=datetime.now(),
-        )
-
+        values = {
+            "session_id": session_id_hash,
+            "user_id": user_id,
+            "fingerprint": fingerprint,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "status": "ACTIVE",
+            "expires_at": expires_at,
+            "last_activity_at": datetime.now(),
+            "mfa_verified": mfa_verified,
+            "mfa_verified_at": datetime.now() if mfa_verified else None,
+            "created_at": datetime.now(),
+        }
+
+        if not commit:
+            # 별도 refresh SELECT 없이 INSERT 결과 행으로 세션 객체 구성
+            session = db.scalars(
+                insert(Session).returning(Session), [values]
+            ).one()
+            return session_token, session
+
+        session = Session(**values)
         db.add(session)
         db.commit()
         db.refresh(session)
+        session_stats.record((None, snapshot(session)))
 
         return session_token, session
 
@@ -117,10 +140,27 @@ class SessionService:
         db: DBSession,
         session_token: str,
         update_activity: bool = True,
+        use_cache: bool = False,
     ) -> Session | None:
-        """세션 유효성 검증"""
+        """세션 유효성 검증
+
+        use_cache=True 이면 세션 검증 캐시를 먼저 조회합니다. 캐시 적중 시
+        DB에 연결되지 않은 세션 객체가 반환되므로 읽기 전용으로만 사용해야
+        합니다. last_activity_at은 SESSION_ACTIVITY_WRITE_BEHIND 설정 시
+        session_activity를 통해 주기적으로 일괄 반영됩니다.
+        """
         session_id_hash = SessionService.hash_session_token(session_token)
 
+        if use_cache and settings.SESSION_CACHE_ENABLED:
+            cached = session_cache.get(session_id_hash)
+            if cached is not None:
+                if update_activity and settings.SESSION_ACTIVITY_WRITE_BEHIND:
+                    session_activity.touch(
+                        session_id_hash,
+                        cached.last_activity_at,  # type: ignore
+                    )
+                return cached
+
         session = (
             db.query(Session)
             .filter(
@@ -135,14 +175,91 @@ class SessionService:
 
         # 만료 시간 체크
         if session.expires_at < datetime.now():  # type: ignore
+            before = snapshot(session)
             session.status = "EXPIRED"  # type: ignore
             db.commit()
+            session_cache.invalidate(session_id_hash)
+            session_revocation.revoke(session_id_hash)
+            session_stats.record((before, snapshot(session)))
             return None
 
-        # 마지막 활동 시간 업데이트
+        # 마지막 활동 시간 업데이트 (지연 기록 사용 시 일괄 반영)
         if update_activity:
-            session.last_activity_at = datetime.now()  # type: ignore
-            db.commit()
+            if settings.SESSION_ACTIVITY_WRITE_BEHIND:
+                session_activity.touch(
+                    session_id_hash,
+                    session.last_activity_at,  # type: ignore
+                )
+            else:
+                session.last_activity_at = datetime.now()  # type: ignore
+                db.commit()
+
+        if use_cache and settings.SESSION_CACHE_ENABLED:
+            session_cache.set(session_id_hash, session)
+
+        return session
+
+    @staticmethod
+    async def validate_session_async(
+        db: AsyncSession,
+        session_token: str,
+        update_activity: bool = True,
+        use_cache: bool = True,
+    ) -> Session | None:
+        """세션 유효성 검증 (비동기)
+
+        validate_session과 동일한 규칙으로 검증하며, 요청 경로의 인증
+        의존성에서 이벤트 루프를 막지 않도록 AsyncSession을 사용합니다.
+        """
+        session_id_hash = SessionService.hash_session_token(session_token)
+
+        if use_cache and settings.SESSION_CACHE_ENABLED:
+            cached = await run_in_threadpool(
+                session_cache.get, session_id_hash
+            )
+            if cached is not None:
+                if update_activity and settings.SESSION_ACTIVITY_WRITE_BEHIND:
+                    session_activity.touch(
+                        session_id_hash,
+                        cached.last_activity_at,  # type: ignore
+                    )
+                return cached
+
+        session = await db.scalar(
+            select(Session).filter(
+                Session.session_id == session_id_hash,
+                Session.status == "ACTIVE",
+            )
+        )
+
+        if not session:
+            return None
+
+        # 만료 시간 체크
+        if session.expires_at < datetime.now():  # type: ignore
+            before = snapshot(session)
+            session.status = "EXPIRED"  # type: ignore
+            await db.commit()
+            await run_in_threadpool(session_cache.invalidate, session_id_hash)
+            await run_in_threadpool(session_revocation.revoke, session_id_hash)
+            session_stats.record((before, snapshot(session)))
+            return None
+
+        # 마지막 활동 시간 업데이트 (지연 기록 사용 시 일괄 반영)
+        if update_activity:
+            if settings.SESSION_ACTIVITY_WRITE_BEHIND:
+                session_activity.touch(
+                    session_id_hash,
+                    session.last_activity_at,  # type: ignore
+                )
+            else:
+                session.last_activity_at = datetime.now()  # type: ignore
+                await db.commit()
+
+        if use_cache and settings.SESSION_CACHE_ENABLED:
+            await run_in_threadpool(
+                session_cache.set, session_id_hash, session
+            )
 
         return session
 
@@ -166,9 +283,13 @@ class SessionService:
         if not session:
             return False
 
+        before = snapshot(session)
         session.status = "REVOKED"  # type: ignore
         session.updated_at = datetime.now()  # type: ignore
         db.commit()
+        session_cache.invalidate(session_id_hash)
+        session_revocation.revoke(session_id_hash)
+        session_stats.record((before, snapshot(session)))
 
         return True
 
@@ -193,13 +314,21 @@ class SessionService:
 
         sessions = query.all()
         revoked_count = 0
+        revoked_hashes = []
+        changes = []
 
         for session in sessions:
+            before = snapshot(session)
             session.status = "REVOKED"  # type: ignore
             session.updated_at = datetime.now()  # type: ignore
+            revoked_hashes.append(str(session.session_id))
+            changes.append((before, snapshot(session)))
             revoked_count += 1
 
         db.commit()
+        session_cache.invalidate(*revoked_hashes)
+        session_revocation.revoke(*revoked_hashes)
+        session_stats.record(*changes)
         return revoked_count
 
     @staticmethod
@@ -215,12 +344,21 @@ class SessionService:
         )
 
         cleaned_count = 0
+        expired_hashes = []
+        changes = []
         for session in expired_sessions:
+            before = snapshot(session)
             session.status = "EXPIRED"  # type: ignore
             session.updated_at = datetime.now()  # type: ignore
+            expired_hashes.append(str(session.session_id))
+            changes.append((before, snapshot(session)))
             cleaned_count += 1
 
         db.commit()
+        # 무상태 검증(AUTH_STATELESS_JWT) 경로도 만료를 반영하도록 무효화
+        session_cache.invalidate(*expired_hashes)
+        session_revocation.revoke(*expired_hashes)
+        session_stats.record(*changes)
         return cleaned_count
 
     @staticmethod
@@ -243,6 +381,7 @@ class SessionService:
         session.updated_at = datetime.now()  # type: ignore
 
         db.commit()
+        session_cache.drop(str(session.session_id))
         return True
 
     @staticmethod
@@ -275,9 +414,14 @@ class SessionService:
         if not session:
             return False
 
+        before = snapshot(session)
         session.mfa_verified = True  # type: ignore
         session.mfa_verified_at = datetime.now()  # type: ignore
         session.updated_at = datetime.now()  # type: ignore
 
         db.commit()
+        session_cache.drop(str(session.session_id))
+        # 이미 발급된 액세스 토큰의 세션 속성이 바뀌었으므로 DB로 검증
+        session_revocation.revoke(str(session.session_id))
+        session_stats.record((before, snapshot(session)))
         return True
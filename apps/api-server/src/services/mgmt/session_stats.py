@@ -0,0 +1,236 @@
+"""
+세션 통계 카운터
+
+세션 통계 API가 idam.sessions 크기와 관계없이 O(1)로 응답하도록 상태별
+세션 수와 활성 세션의 고유 사용자/IP 수를 Redis에 유지합니다.
+
+- idam:sessions:stats:status: 상태별 세션 수 (+ 활성 MFA 인증 세션 수)
+- idam:sessions:stats:users / :ips: 활성 세션의 사용자/IP별 세션 수
+  (0이 되면 필드를 삭제하므로 HLEN이 고유 수)
+
+세션 생성/무효화/만료/삭제 시 변경 전후 상태를 Lua 스크립트로 원자적으로
+반영합니다. 카운터가 없거나 SESSION_STATS_COUNTERS_RECONCILE_SECONDS가
+지나면 DB 집계로 다시 구성하므로, Redis 장애나 카운터를 거치지 않은 변경
+(직접 SQL 등)으로 생긴 오차는 그 주기 안에서 보정됩니다.
+"""
+
+import logging
+import time
+
+import redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.redis_client import RedisGuard
+from src.modules.mgmt.idam.session.model import Session
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "idam:sessions:stats:"
+_STATUS_KEY = _KEY_PREFIX + "status"
+_USERS_KEY = _KEY_PREFIX + "users"
+_IPS_KEY = _KEY_PREFIX + "ips"
+_READY_KEY = _KEY_PREFIX + "ready"
+_MFA_FIELD = "MFA_VERIFIED"
+
+# (상태, 사용자 ID, IP, MFA 인증 여부)
+SessionState = tuple[str, str, str, bool]
+
+# KEYS: status, users, ips, ready
+# ARGV: 변경 수, (부호, 상태, 사용자, IP, MFA) 반복
+# 카운터가 구성되지 않은 상태면 아무것도 하지 않음 (다음 조회 시 재구성)
+_APPLY_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then
+    return 0
+end
+for i = 0, tonumber(ARGV[1]) - 1 do
+    local base = 2 + i * 5
+    local sign = tonumber(ARGV[base])
+    local status = ARGV[base + 1]
+    redis.call('HINCRBY', KEYS[1], status, sign)
+    if status == 'ACTIVE' then
+        if ARGV[base + 4] == '1' then
+            redis.call('HINCRBY', KEYS[1], 'MFA_VERIFIED', sign)
+        end
+        local members = {{KEYS[2], ARGV[base + 2]}, {KEYS[3], ARGV[base + 3]}}
+        for _, member in ipairs(members) do
+            if member[2] ~= '' then
+                local count = redis.call('HINCRBY', member[1], member[2], sign)
+                if count <= 0 then
+                    redis.call('HDEL', member[1], member[2])
+                end
+            end
+        end
+    end
+end
+return 1
+"""
+
+
+def snapshot(session: Session | None) -> SessionState | None:
+    """카운터 반영용 세션 상태 스냅샷 (변경 전후 비교에 사용)"""
+    if session is None or session.status is None:
+        return None
+    return (
+        str(session.status),
+        str(session.user_id) if session.user_id else "",
+        str(session.ip_address) if session.ip_address else "",
+        bool(session.mfa_verified),
+    )
+
+
+class SessionStatsCounters:
+    """Redis에 유지하는 세션 통계 카운터"""
+
+    def __init__(self, enabled: bool, reconcile_seconds: int):
+        self.enabled = enabled
+        self.reconcile_seconds = reconcile_seconds
+
+        self._script = None
+        self._redis = RedisGuard("세션 통계 카운터")
+        # 반영 실패 시 다음 조회에서 카운터를 재구성하도록 표시
+        self._dirty = False
+
+    def record(
+        self, *changes: tuple[SessionState | None, SessionState | None]
+    ) -> None:
+        """세션 상태 변경 반영 (commit 이후 호출)
+
+        Args:
+            changes: (변경 전, 변경 후) 스냅샷 쌍. 생성은 (None, 후),
+                삭제는 (전, None)
+        """
+        if not self.enabled:
+            return
+
+        args: list = []
+        for before, after in changes:
+            if before == after:
+                continue
+            for sign, state in ((-1, before), (1, after)):
+                if state is not None:
+                    status, user_id, ip_address, mfa = state
+                    args += [sign, status, user_id, ip_address, int(mfa)]
+        if not args:
+            return
+
+        if self._redis.call(
+            lambda r: self._apply(r)(
+                keys=[_STATUS_KEY, _USERS_KEY, _IPS_KEY, _READY_KEY],
+                args=[len(args) // 5, *args],
+            )
+        ) is None:
+            self._dirty = True
+
+    async def get(self, db: AsyncSession) -> dict | None:
+        """카운터 기반 통계 (카운터를 사용할 수 없으면 None)
+
+        카운터가 구성되지 않았거나 보정 주기가 지났으면 DB 집계로 다시
+        구성한 뒤 반환합니다.
+        """
+        if not self.enabled:
+            return None
+
+        if self._dirty:
+            if self._redis.call(lambda r: r.delete(_READY_KEY)) is None:
+                return None
+            self._dirty = False
+
+        result = self._redis.call(self._read)
+        if result is None:
+            return None
+        ready, status_counts, unique_users, unique_ips = result
+        if not ready:
+            return await self.rebuild(db)
+
+        return {
+            "active_sessions": int(status_counts.get("ACTIVE", 0)),
+            "expired_sessions": int(status_counts.get("EXPIRED", 0)),
+            "revoked_sessions": int(status_counts.get("REVOKED", 0)),
+            "unique_users": unique_users,
+            "unique_ips": unique_ips,
+            "mfa_verified_sessions": int(status_counts.get(_MFA_FIELD, 0)),
+        }
+
+    async def rebuild(self, db: AsyncSession) -> dict | None:
+        """DB 집계로 카운터를 다시 구성하고 통계 반환
+
+        집계와 Redis 기록 사이에 일어난 변경은 누락될 수 있으며 다음
+        보정 주기에 바로잡힙니다.
+        """
+        is_active = Session.status == "ACTIVE"
+        status_rows = await db.execute(
+            select(Session.status, func.count()).group_by(Session.status)
+        )
+        status_counts = {status: count for status, count in status_rows}
+        status_counts[_MFA_FIELD] = (
+            await db.scalar(
+                select(func.count()).filter(
+                    is_active,
+                    Session.mfa_verified == True,  # noqa: E712
+                )
+            )
+            or 0
+        )
+        user_rows = await db.execute(
+            select(Session.user_id, func.count())
+            .filter(is_active, Session.user_id.isnot(None))
+            .group_by(Session.user_id)
+        )
+        users = {str(user_id): count for user_id, count in user_rows}
+        ip_rows = await db.execute(
+            select(Session.ip_address, func.count())
+            .filter(is_active, Session.ip_address.isnot(None))
+            .group_by(Session.ip_address)
+        )
+        ips = {str(ip_address): count for ip_address, count in ip_rows}
+
+        def write(r: redis.Redis) -> bool:
+            pipe = r.pipeline(transaction=True)
+            pipe.delete(_STATUS_KEY, _USERS_KEY, _IPS_KEY)
+            pipe.hset(_STATUS_KEY, mapping=status_counts)
+            if users:
+                pipe.hset(_USERS_KEY, mapping=users)
+            if ips:
+                pipe.hset(_IPS_KEY, mapping=ips)
+            pipe.set(_READY_KEY, int(time.time()), ex=self.reconcile_seconds)
+            pipe.execute()
+            return True
+
+        if self._redis.call(write) is None:
+            return None
+        logger.info(
+            f"세션 통계 카운터 재구성: 활성 {status_counts.get('ACTIVE', 0)}개"
+        )
+        return {
+            "active_sessions": status_counts.get("ACTIVE", 0),
+            "expired_sessions": status_counts.get("EXPIRED", 0),
+            "revoked_sessions": status_counts.get("REVOKED", 0),
+            "unique_users": len(users),
+            "unique_ips": len(ips),
+            "mfa_verified_sessions": status_counts[_MFA_FIELD],
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _apply(self, r: redis.Redis):
+        if self._script is None:
+            self._script = r.register_script(_APPLY_SCRIPT)
+        return self._script
+
+    @staticmethod
+    def _read(r: redis.Redis) -> tuple:
+        pipe = r.pipeline(transaction=False)
+        pipe.exists(_READY_KEY)
+        pipe.hgetall(_STATUS_KEY)
+        pipe.hlen(_USERS_KEY)
+        pipe.hlen(_IPS_KEY)
+        return tuple(pipe.execute())
+
+
+session_stats = SessionStatsCounters(
+    enabled=settings.SESSION_STATS_COUNTERS_ENABLED,
+    reconcile_seconds=settings.SESSION_STATS_COUNTERS_RECONCILE_SECONDS,
+)
@@ -0,0 +1,692 @@
+"""
+공통 캐시 서비스
+
+IDAM, 테넌트, 설정 서비스의 읽기 전용 조회 결과를 2단계로 캐시합니다.
+
+- L1: 프로세스 내 LRU (짧은 TTL, 최대 항목 수 제한)
+- L2: Redis (워커/인스턴스 간 공유, 네임스페이스별 TTL)
+
+값은 CACHE_SERIALIZER(orjson/msgpack/json)로 직렬화하며, 모듈이 설치되어
+있지 않으면 표준 json으로 대체합니다. pydantic 모델은 model_dump(mode="json")
+결과로 저장하고 조회 시 model_validate로 복원합니다.
+
+캐시 스탬피드 방지:
+- 단일 비행(single-flight): 같은 프로세스에서 같은 키를 동시에 놓친 요청은
+  하나의 로더 호출 결과를 함께 기다립니다.
+- 확률적 조기 갱신(XFetch): 만료가 가까워질수록 높은 확률로 한 요청이 미리
+  다시 계산하므로, 인기 키가 모든 워커에서 동시에 만료되지 않습니다.
+
+무효화는 키 단위와 태그 단위가 있습니다. 태그별 키 목록은 Redis 집합
+(cache:tag:<tag>)에 보관하고, pub/sub 채널로 다른 워커의 L1 항목도 제거합니다.
+전파가 누락되더라도 L1 TTL(CACHE_LOCAL_TTL_SECONDS) 이후에는 반영됩니다.
+
+로더 실행 중에 무효화된 값이 다시 저장되지 않도록, 무효화할 때마다 키/태그의
+버전(cache:ver:*)을 올리고 get_or_set은 로더 호출 전에 읽은 버전이 그대로일
+때만 Redis에 저장합니다. (프로세스 내에서는 무효화 세대 번호로 확인)
+
+get_or_set은 이벤트 루프를 막지 않도록 Redis 호출(조회, 버전 확인, 저장)을
+작업 스레드에서 실행합니다. 로더를 실행하던 요청이 취소되면 함께 기다리던
+요청 중 하나가 로드를 이어받습니다.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, TypeVar
+from uuid import UUID
+
+import redis
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as OrmSession
+
+from src.core.config import settings
+from src.core.lru import LRUCache
+from src.core.redis_client import (
+    InvalidationListener,
+    RedisGuard,
+    get_binary_redis,
+    get_redis,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_KEY_PREFIX = "cache:"
+_TAG_PREFIX = "cache:tag:"
+_VERSION_PREFIX = "cache:ver:"
+# 버전 키는 로더 실행 중의 무효화만 확인하면 되므로 짧게 유지
+_VERSION_TTL_SECONDS = 3600
+_MAX_KEY_LENGTH = 200
+
+
+# 읽은 버전이 그대로일 때만 값 저장
+# KEYS[1]: 캐시 키, KEYS[2..]: 버전 키
+# ARGV[1]: 값, ARGV[2]: TTL(초), ARGV[3..]: 로더 호출 전에 읽은 버전
+_SET_IF_VERSION_SCRIPT = """
+for i = 2, #KEYS do
+    if (redis.call('GET', KEYS[i]) or '') ~= ARGV[i + 1] then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+
+class _LoaderCancelledError(Exception):
+    """단일 비행 로더를 실행하던 요청이 취소됨 (기다리던 요청이 이어받음)"""
+
+
+# ----------------------------------------------------------------------
+# 직렬화
+# ----------------------------------------------------------------------
+def _default(value: Any) -> Any:
+    """기본 직렬화기가 처리하지 못하는 값을 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    raise TypeError(f"캐시에 저장할 수 없는 타입: {type(value).__name__}")
+
+
+class Serializer:
+    """캐시 값 직렬화기 (orjson, msgpack, json)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        if name == "orjson":
+            try:
+                import orjson
+            except ImportError:
+                logger.warning("orjson이 설치되지 않아 json 직렬화를 사용합니다")
+                self.name = "json"
+            else:
+                self.dumps = lambda value: orjson.dumps(
+                    value, default=_default
+                )
+                self.loads = orjson.loads
+                return
+        elif name == "msgpack":
+            try:
+                import msgpack
+            except ImportError:
+                logger.warning(
+                    "msgpack이 설치되지 않아 json 직렬화를 사용합니다"
+                )
+                self.name = "json"
+            else:
+                self.dumps = lambda value: msgpack.packb(
+                    value, default=_default, use_bin_type=True
+                )
+                self.loads = lambda raw: msgpack.unpackb(raw, raw=False)
+                return
+        elif name != "json":
+            raise ValueError(f"지원하지 않는 캐시 직렬화 방식: {name}")
+
+        self.dumps = lambda value: json.dumps(
+            value, default=_default, separators=(",", ":")
+        ).encode()
+        self.loads = json.loads
+
+
+# ----------------------------------------------------------------------
+# 캐시 서비스
+# ----------------------------------------------------------------------
+class CacheService:
+    """네임스페이스별 TTL을 갖는 2단계(L1 LRU + Redis) 캐시"""
+
+    def __init__(
+        self,
+        serializer: str,
+        default_ttl: int,
+        namespace_ttls: dict[str, int],
+        max_size: int,
+        local_ttl: int,
+        early_refresh_beta: float,
+        channel: str,
+        enabled: bool = True,
+    ):
+        self.serializer = Serializer(serializer)
+        self.default_ttl = default_ttl
+        self.namespace_ttls = dict(namespace_ttls)
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.early_refresh_beta = early_refresh_beta
+        self.channel = channel
+        self.enabled = enabled
+
+        # 캐시 키 -> (직렬화 값, 태그)
+        self._local: LRUCache[str, tuple[bytes, frozenset]] = LRUCache(
+            max_size
+        )
+        self._lock = threading.Lock()
+        # 캐시 키 -> 진행 중인 로더 결과 (단일 비행)
+        self._inflight: dict[str, asyncio.Future] = {}
+        # 무효화마다 증가 (진행 중이던 로더 결과 저장 방지)
+        self._generation = 0
+        self._script = None
+        self._redis = RedisGuard("캐시", client=get_binary_redis)
+        self._listener = InvalidationListener(
+            channel,
+            name="cache-invalidation",
+            label="캐시 무효화 구독",
+            on_message=self._apply,
+            # 재연결 사이에 놓친 무효화가 있을 수 있으므로 L1을 비움
+            on_subscribe=lambda _client: self.clear(),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+    def ttl_for(self, namespace: str) -> int:
+        """네임스페이스의 Redis TTL (초)"""
+        return self.namespace_ttls.get(namespace, self.default_ttl)
+
+    def get(
+        self,
+        namespace: str,
+        key: str,
+        model: type[T] | None = None,
+        default: Any = None,
+    ) -> T | Any:
+        """캐시 조회 (없으면 default, model을 주면 해당 타입으로 복원)"""
+        envelope = self._get_envelope(_cache_key(namespace, key))
+        if envelope is None:
+            return default
+        return _restore(envelope["v"], model)
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """캐시 저장 (L1/L2)"""
+        self._set_envelope(namespace, key, value, ttl, tags, delta=0.0)
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        model: type[T] | None = None,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> T | Any:
+        """읽기 통과(read-through) 조회
+
+        캐시에 없거나 조기 갱신 대상이면 loader를 호출해 저장합니다. 같은
+        키의 동시 호출은 하나의 loader 호출을 공유합니다.
+        """
+        if not self.enabled:
+            return _restore(_to_plain(await loader()), model)
+
+        cache_key = _cache_key(namespace, key)
+        envelope = self._get_local_envelope(cache_key)
+        if envelope is None:
+            envelope = await run_in_threadpool(
+                self._get_redis_envelope, cache_key
+            )
+        if envelope is not None and (
+            # 다른 요청이 이미 갱신 중이면 기존 값을 그대로 사용
+            not self._should_refresh(envelope) or cache_key in self._inflight
+        ):
+            return _restore(envelope["v"], model)
+
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            try:
+                return _restore(await asyncio.shield(inflight), model)
+            except _LoaderCancelledError:
+                continue  # 로더를 실행하던 요청이 취소됨: 이어받아 로드
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await self._load(
+                namespace, key, loader, ttl, frozenset(tags)
+            )
+            future.set_result(value)
+        except asyncio.CancelledError:
+            # 기다리던 요청까지 취소하지 않고 그중 하나가 이어받게 함
+            future.set_exception(_LoaderCancelledError())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 방지
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+        return _restore(value, model)
+
+    async def _load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None,
+        tags: frozenset,
+    ) -> Any:
+        """loader 호출 후, 호출 전에 읽은 버전이 그대로이면 저장"""
+        cache_key = _cache_key(namespace, key)
+        generation = self._generation
+        versions = await run_in_threadpool(
+            self._read_versions, cache_key, tags
+        )
+        started = time.monotonic()
+        value = _to_plain(await loader())
+        if generation == self._generation:
+            # 로더 실행 중 무효화가 있었으면 저장하지 않음
+            await run_in_threadpool(
+                self._set_envelope,
+                namespace,
+                key,
+                value,
+                ttl,
+                tags,
+                delta=time.monotonic() - started,
+                versions=versions,
+                conditional=True,
+                generation=generation,
+            )
+        return value
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+    def invalidate(self, namespace: str, *keys: str) -> None:
+        """키 단위 무효화 및 다른 워커로 전파"""
+        cache_keys = [_cache_key(namespace, key) for key in keys]
+        if not cache_keys:
+            return
+
+        self._drop_local(cache_keys)
+
+        def _delete(r: redis.Redis) -> None:
+            pipe = r.pipeline(transaction=False)
+            pipe.delete(*cache_keys)
+            _bump_versions(pipe, [_key_version(k) for k in cache_keys])
+            pipe.execute()
+
+        self._redis.call(_delete)
+        self._publish({"keys": cache_keys})
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """태그 단위 무효화 (해당 태그로 저장된 모든 키) 및 전파"""
+        tags = tuple(tag for tag in tags if tag)
+        if not tags:
+            return
+
+        self._drop_local_tags(tags)
+        tag_keys = [_TAG_PREFIX + tag for tag in tags]
+
+        def _delete_tagged(r: redis.Redis) -> None:
+            cache_keys = r.sunion(tag_keys)
+            pipe = r.pipeline(transaction=False)
+            if cache_keys:
+                pipe.delete(*cache_keys)
+            pipe.delete(*tag_keys)
+            _bump_versions(pipe, [_tag_version(tag) for tag in tags])
+            pipe.execute()
+
+        self._redis.call(_delete_tagged)
+        self._publish({"tags": list(tags)})
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 비우기"""
+        with self._lock:
+            self._local.clear()
+            self._generation += 1
+
+    def stop_listener(self) -> None:
+        """무효화 구독 스레드 종료"""
+        self._listener.stop()
+
+    def _apply(self, payload: dict) -> None:
+        """다른 워커의 무효화 메시지를 L1에 반영"""
+        self._drop_local(payload.get("keys", ()))
+        self._drop_local_tags(payload.get("tags", ()))
+
+    def _publish(self, payload: dict) -> None:
+        self._redis.call(
+            lambda r: r.publish(self.channel, json.dumps(payload)),
+            client=get_redis,
+        )
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _get_envelope(self, cache_key: str) -> dict | None:
+        """L1 → Redis 순서로 조회 (논리적 만료가 지난 값은 None)"""
+        envelope = self._get_local_envelope(cache_key)
+        if envelope is None:
+            envelope = self._get_redis_envelope(cache_key)
+        return envelope
+
+    def _get_local_envelope(self, cache_key: str) -> dict | None:
+        """L1 조회 (없거나 논리적 만료가 지났으면 None)"""
+        if not self.enabled:
+            return None
+        self._listener.start()
+
+        with self._lock:
+            entry = self._local.get(cache_key)
+        if entry is None:
+            return None
+        return self._decode(entry[0])
+
+    def _get_redis_envelope(self, cache_key: str) -> dict | None:
+        """Redis 조회 후 L1에 저장 (없거나 논리적 만료가 지났으면 None)"""
+        if not self.enabled:
+            return None
+        raw = self._redis.call(lambda r: r.get(cache_key))
+        if not raw:
+            return None
+        envelope = self._decode(raw)
+        if envelope is not None:
+            self._store_local(
+                cache_key,
+                raw,
+                frozenset(envelope.get("t", ())),
+                envelope["e"] - time.time(),
+            )
+        return envelope
+
+    def _decode(self, raw: bytes) -> dict | None:
+        try:
+            envelope = self.serializer.loads(raw)
+        except ValueError:
+            return None
+        if envelope["e"] <= time.time():
+            return None
+        return envelope
+
+    def _set_envelope(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: int | None,
+        tags: Iterable[str],
+        delta: float,
+        versions: list[bytes] | None = None,
+        conditional: bool = False,
+        generation: int | None = None,
+    ) -> None:
+        """L1/L2 저장
+
+        conditional이면(get_or_set) 키/태그 버전이 versions와 같을 때만
+        Redis에 저장하고, 다른 워커가 그 사이 무효화했으면 L1에도 두지
+        않습니다. 버전을 읽지 못했으면(Redis 장애) L1에만 저장합니다.
+        generation을 주면 그 사이 이 프로세스에서 무효화가 있었을 때 L1에
+        저장하지 않습니다.
+        """
+        if not self.enabled:
+            return
+        ttl = ttl if ttl is not None else self.ttl_for(namespace)
+        if ttl <= 0:
+            return
+
+        cache_key = _cache_key(namespace, key)
+        tags = frozenset(tags)
+        # v: 값, d: 계산 시간(초, 조기 갱신 확률 계산용), e: 논리적 만료(epoch)
+        envelope = {"v": value, "d": delta, "e": time.time() + ttl}
+        if tags:
+            envelope["t"] = sorted(tags)
+        raw = self.serializer.dumps(envelope)
+        if conditional and versions is None:
+            self._store_local(cache_key, raw, tags, ttl, generation)
+            return
+
+        def _write(r: redis.Redis) -> bool:
+            if conditional and not self._set_if_version(
+                r, cache_key, tags, raw, ttl, versions
+            ):
+                return False
+            pipe = r.pipeline(transaction=False)
+            if not conditional:
+                pipe.set(cache_key, raw, ex=ttl)
+            for tag in tags:
+                tag_key = _TAG_PREFIX + tag
+                pipe.sadd(tag_key, cache_key)
+                # 태그 집합은 가장 늦게 만료되는 키보다 오래 유지
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            pipe.execute()
+            return True
+
+        if self._redis.call(_write) is False:
+            return  # 로더 실행 중 다른 워커가 무효화함
+        self._store_local(cache_key, raw, tags, ttl, generation)
+
+    def _read_versions(
+        self, cache_key: str, tags: frozenset
+    ) -> list[bytes] | None:
+        """키/태그의 현재 버전 (Redis를 사용할 수 없으면 None)"""
+        version_keys = _version_keys(cache_key, tags)
+        versions = self._redis.call(lambda r: r.mget(version_keys))
+        if versions is None:
+            return None
+        return [version or b"" for version in versions]
+
+    def _set_if_version(
+        self,
+        r: redis.Redis,
+        cache_key: str,
+        tags: frozenset,
+        raw: bytes,
+        ttl: int,
+        versions: list[bytes],
+    ) -> bool:
+        if self._script is None:
+            self._script = r.register_script(_SET_IF_VERSION_SCRIPT)
+        return bool(
+            self._script(
+                keys=[cache_key, *_version_keys(cache_key, tags)],
+                args=[raw, ttl, *versions],
+                client=r,
+            )
+        )
+
+    def _should_refresh(self, envelope: dict) -> bool:
+        """XFetch: 만료까지 남은 시간이 계산 시간 대비 짧을수록 갱신 확률 증가"""
+        if self.early_refresh_beta <= 0 or envelope["d"] <= 0:
+            return False
+        gap = -envelope["d"] * self.early_refresh_beta * math.log(
+            1.0 - random.random()
+        )
+        return time.time() + gap >= envelope["e"]
+
+    def _store_local(
+        self,
+        cache_key: str,
+        raw: bytes,
+        tags: frozenset,
+        remaining: float,
+        generation: int | None = None,
+    ) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return  # 저장 전에 무효화됨
+            self._local.set(
+                cache_key, (raw, tags), min(self.local_ttl, remaining)
+            )
+
+    def _drop_local(self, cache_keys) -> None:
+        with self._lock:
+            self._generation += 1
+            for cache_key in cache_keys:
+                self._local.pop(cache_key)
+
+    def _drop_local_tags(self, tags) -> None:
+        tags = frozenset(tags)
+        if not tags:
+            return
+        with self._lock:
+            self._generation += 1
+            for cache_key, (_raw, entry_tags) in self._local.items():
+                if entry_tags & tags:
+                    self._local.pop(cache_key)
+
+
+def _cache_key(namespace: str, key: str) -> str:
+    return f"{_KEY_PREFIX}{namespace}:{key}"
+
+
+def _key_version(cache_key: str) -> str:
+    return _VERSION_PREFIX + cache_key[len(_KEY_PREFIX) :]
+
+
+def _tag_version(tag: str) -> str:
+    return f"{_VERSION_PREFIX}tag:{tag}"
+
+
+def _version_keys(cache_key: str, tags: Iterable[str]) -> list[str]:
+    return [_key_version(cache_key), *(_tag_version(tag) for tag in tags)]
+
+
+def _bump_versions(pipe, version_keys: list[str]) -> None:
+    for version_key in version_keys:
+        pipe.incr(version_key)
+        pipe.expire(version_key, _VERSION_TTL_SECONDS)
+
+
+def _to_plain(value: Any) -> Any:
+    """pydantic 모델을 직렬화 가능한 dict/list로 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, list | tuple) and value and isinstance(
+        value[0], BaseModel
+    ):
+        return [item.model_dump(mode="json") for item in value]
+    return value
+
+
+def _restore(value: Any, model: type | None) -> Any:
+    """캐시된 값을 model 타입으로 복원 (model이 없으면 그대로 반환)"""
+    if model is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [model.model_validate(item) for item in value]
+    return model.model_validate(value)
+
+
+# ----------------------------------------------------------------------
+# 읽기 통과 데코레이터
+# ----------------------------------------------------------------------
+def _default_key(*args, **kwargs) -> str:
+    """DB 세션을 제외한 인자로 캐시 키 생성 (길면 해시)"""
+    parts = [
+        str(arg)
+        for arg in args
+        if not isinstance(arg, AsyncSession | OrmSession)
+    ]
+    parts.extend(
+        f"{name}={value}"
+        for name, value in sorted(kwargs.items())
+        if not isinstance(value, AsyncSession | OrmSession)
+    )
+    key = ":".join(parts)
+    if len(key) > _MAX_KEY_LENGTH:
+        key = hashlib.sha256(key.encode()).hexdigest()
+    return key
+
+
+def cached(
+    namespace: str,
+    key: Callable[..., str] | None = None,
+    tags: Callable[..., Iterable[str]] | Iterable[str] = (),
+    model: type | None = None,
+    ttl: int | None = None,
+    cache: "CacheService | None" = None,
+):
+    """서비스 정적 메서드용 읽기 통과 캐시 데코레이터
+
+    key/tags 호출 가능 객체는 원래 함수와 같은 인자를 받습니다. key를
+    생략하면 DB 세션을 제외한 인자로 키를 만듭니다. model을 주면 캐시 적중
+    여부와 관계없이 model 인스턴스(목록이면 목록)를 반환합니다.
+
+        class TenantService:
+            @staticmethod
+            @cached("tenant", key=lambda db, tenant_id: str(tenant_id),
+                    model=TenantResponse)
+            async def get_tenant(db, tenant_id): ...
+
+        TenantService.get_tenant.invalidate(None, tenant_id)
+    """
+
+    def decorator(fn):
+        def _key(*args, **kwargs) -> str:
+            return (key or _default_key)(*args, **kwargs)
+
+        def _tags(*args, **kwargs) -> Iterable[str]:
+            return tags(*args, **kwargs) if callable(tags) else tags
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            service = cache or cache_service
+            return await service.get_or_set(
+                namespace,
+                _key(*args, **kwargs),
+                lambda: _load(*args, **kwargs),
+                model=model,
+                ttl=ttl,
+                tags=_tags(*args, **kwargs),
+            )
+
+        async def _load(*args, **kwargs):
+            result = await fn(*args, **kwargs)
+            if model is None or result is None:
+                return result
+            if isinstance(result, list):
+                return [
+                    model.model_validate(item, from_attributes=True)
+                    for item in result
+                ]
+            return model.model_validate(result, from_attributes=True)
+
+        def invalidate(*args, **kwargs) -> None:
+            """같은 인자로 만든 키를 무효화"""
+            (cache or cache_service).invalidate(
+                namespace, _key(*args, **kwargs)
+            )
+
+        wrapper.cache_key = _key
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
+
+
+cache_service = CacheService(
+    serializer=settings.CACHE_SERIALIZER,
+    default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+    namespace_ttls=settings.CACHE_NAMESPACE_TTLS,
+    max_size=settings.CACHE_LOCAL_MAX_SIZE,
+    local_ttl=settings.CACHE_LOCAL_TTL_SECONDS,
+    early_refresh_beta=settings.CACHE_EARLY_REFRESH_BETA,
+    channel=settings.CACHE_CHANNEL,
+    enabled=settings.CACHE_ENABLED,
+)
+
+__all__ = ["CacheService", "Serializer", "cache_service", "cached"]
@@ -0,0 +1,105 @@
+"""
+테스트 공통 설정
+
+PostgreSQL/Redis 없이 실행할 수 있도록 aiosqlite 메모리 DB에 필요한
+테이블만 만들고(스키마 이름 제거), Redis를 사용하는 기능은 끕니다.
+"""
+
+import os
+
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SESSION_CACHE_ENABLED", "false")
+os.environ.setdefault("LOGIN_THROTTLE_ENABLED", "false")
+os.environ.setdefault("ROUTER_WARMUP", "false")
+
+import uuid  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import ARRAY  # noqa: E402
+from sqlalchemy.dialects.postgresql import INET, JSONB, UUID  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from src.core.query_stats import instrument_query_stats  # noqa: E402
+from src.models.base import Base  # noqa: E402
+from src.models.registry import register_models  # noqa: E402
+
+
+@compiles(INET, "sqlite")
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_as_text(type_, compiler, **kw):
+    return "TEXT"
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    """idam 테이블만 만든 메모리 DB (SQL 문장 수 집계 등록)"""
+    register_models()
+    from src.modules.mgmt.idam.session.model import Session
+    from src.modules.mgmt.idam.user.model import User
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        execution_options={"schema_translate_map": {"idam": None}},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[User.__table__, Session.__table__],
+        )
+    instrument_query_stats("test", engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session_local(db_engine):
+    return async_sessionmaker(db_engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def db(db_session_local):
+    async with db_session_local() as session:
+        yield session
+
+
+@pytest_asyncio.fixture
+async def sessions(db):
+    """사용자 5명, 사용자별 세션 5개"""
+    from src.modules.mgmt.idam.session.model import Session
+    from src.modules.mgmt.idam.user.model import User
+
+    now = datetime.utcnow()
+    for i in range(5):
+        user = User(
+            id=uuid.uuid4(),
+            full_name=f"사용자 {i}",
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+        )
+        db.add(user)
+        for j in range(5):
+            db.add(
+                Session(
+                    id=uuid.uuid4(),
+                    session_id=f"session-{i}-{j}",
+                    user_id=user.id,
+                    ip_address=f"10.0.{i}.{j}",
+                    status="ACTIVE",
+                    expires_at=now + timedelta(hours=1),
+                    last_activity_at=now - timedelta(minutes=i * 5 + j),
+                )
+            )
+    await db.commit()
@@ -0,0 +1,31 @@
+"""라우터 import 및 OpenAPI 스키마 생성 스모크 테스트"""
+
+import pytest
+from fastapi import APIRouter
+
+from src.api.mgmt.v1 import ROUTERS as MGMT_V1_ROUTERS
+from src.api.tnnt.v1 import ROUTERS as TNNT_V1_ROUTERS
+from src.main import create_app
+from src.models.registry import register_models
+
+
+@pytest.mark.parametrize(
+    "spec",
+    MGMT_V1_ROUTERS + TNNT_V1_ROUTERS,
+    ids=lambda spec: spec.module,
+)
+def test_router_module_imports(spec):
+    register_models()
+    assert isinstance(spec.import_router(), APIRouter)
+
+
+def test_openapi_schema_includes_all_routers():
+    app = create_app()
+    app.state.routers.load_all()
+
+    paths = app.openapi()["paths"]
+
+    assert not app.state.routers.pending
+    assert "/api/v1/mgmt/idam/permissions/" in paths
+    assert "/api/v1/mgmt/idam/user-roles/users/{user_id}" in paths
+    assert "/api/v1/mgmt/tnnt/tenants/" in paths
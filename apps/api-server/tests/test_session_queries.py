@@ -0,0 +1,65 @@
+"""세션 목록 조회 SQL 문장 수 (사용자 정보 N+1 회귀 방지)"""
+
+import httpx
+
+from src.core.database import get_mgmt_db_readonly
+from src.core.query_stats import track_queries
+from src.main import create_app
+from src.modules.mgmt.idam.session.schemas import SessionFilterRequest
+from src.modules.mgmt.idam.session.service import SessionService
+
+
+async def test_get_sessions_offset_page_uses_one_statement(db, sessions):
+    with track_queries() as stats:
+        result = await SessionService.get_sessions(
+            db, SessionFilterRequest(page=1, size=20)
+        )
+
+    assert len(result.items) == 20
+    assert result.total == 25
+    assert all(item.username for item in result.items)
+    assert stats.statements == 1
+
+
+async def test_get_sessions_cursor_page_uses_one_statement(db, sessions):
+    with track_queries() as stats:
+        first = await SessionService.get_sessions(
+            db, SessionFilterRequest(size=10, cursor="")
+        )
+        second = await SessionService.get_sessions(
+            db, SessionFilterRequest(size=10, cursor=first.next_cursor)
+        )
+
+    assert len(first.items) == len(second.items) == 10
+    assert not {item.id for item in first.items} & {
+        item.id for item in second.items
+    }
+    assert stats.statements == 2
+
+
+async def test_list_sessions_endpoint_uses_one_statement(
+    db_session_local, sessions
+):
+    app = create_app()
+    app.state.routers.load_all()
+
+    async def override_db():
+        async with db_session_local() as session:
+            yield session
+
+    app.dependency_overrides[get_mgmt_db_readonly] = override_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        with track_queries() as stats:
+            response = await client.get(
+                "/api/v1/mgmt/idam/sessions/", params={"page": 1, "size": 20}
+            )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"]
+    assert len(body["data"]["items"]) == 20
+    assert body["data"]["total"] == 25
+    assert stats.statements == 1
@@ -665,6 +665,10 @@ CREATE INDEX IF NOT EXISTS ix_sessions__last_activity_at
     ON idam.sessions (last_activity_at)
  WHERE status = 'ACTIVE';
 
+-- 커서 페이지네이션용 인덱스 (last_activity_at, id 키셋)
+CREATE INDEX IF NOT EXISTS ix_sessions__last_activity_id
+    ON idam.sessions (last_activity_at DESC, id DESC);
+
 -- IP 주소 조회용 인덱스 (보안 모니터링용)
 CREATE INDEX IF NOT EXISTS ix_sessions__ip_address
     ON idam.sessions (ip_address)
@@ -752,6 +756,10 @@ CREATE INDEX IF NOT EXISTS ix_login_logs__user_id
 CREATE INDEX IF NOT EXISTS ix_login_logs__created_at
     ON idam.login_logs (created_at DESC);
 
+-- 커서 페이지네이션용 인덱스 (created_at, id 키셋)
+CREATE INDEX IF NOT EXISTS ix_login_logs__created_id
+    ON idam.login_logs (created_at DESC, id DESC);
+
 CREATE INDEX IF NOT EXISTS ix_login_logs__user_type
 	ON idam.login_logs (user_type);
 
@@ -791,3 +799,40 @@ CREATE INDEX IF NOT EXISTS ix_login_logs__mfa_used
 CREATE INDEX IF NOT EXISTS ix_login_logs__user_created
     ON idam.login_logs (user_id, created_at DESC)
  WHERE user_id IS NOT NULL;
+
+-- ============================================================================
+-- 로그인 통계 일 단위 집계 (LOGIN_STATS_ROLLUP_ENABLED 사용 시)
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS idam.login_log_daily_stats
+(
+    stat_date                   DATE                     PRIMARY KEY,
+    total_attempts              INTEGER                  NOT NULL DEFAULT 0,
+    successful_logins           INTEGER                  NOT NULL DEFAULT 0,
+    failed_logins               INTEGER                  NOT NULL DEFAULT 0,
+    failure_reasons             JSONB                    NOT NULL DEFAULT '{}'::jsonb,
+    refreshed_at                TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE idam.login_log_daily_stats                    IS '로그인 통계 일 단위 집계 (Asia/Seoul 일자 기준)';
+COMMENT ON COLUMN idam.login_log_daily_stats.stat_date         IS '집계 일자';
+COMMENT ON COLUMN idam.login_log_daily_stats.total_attempts    IS '총 로그인 시도 수';
+COMMENT ON COLUMN idam.login_log_daily_stats.successful_logins IS '성공한 로그인 수';
+COMMENT ON COLUMN idam.login_log_daily_stats.failed_logins     IS '실패한 로그인 수';
+COMMENT ON COLUMN idam.login_log_daily_stats.failure_reasons   IS '실패 사유별 건수';
+COMMENT ON COLUMN idam.login_log_daily_stats.refreshed_at      IS '마지막 집계 일시';
+
+CREATE TABLE IF NOT EXISTS idam.login_log_daily_actors
+(
+    stat_date                   DATE                     NOT NULL,
+    actor_type                  VARCHAR(10)              NOT NULL,
+    actor                       VARCHAR(100)             NOT NULL,
+
+    PRIMARY KEY (stat_date, actor_type, actor),
+    CONSTRAINT ck_login_log_daily_actors__actor_type
+        CHECK (actor_type IN ('USER', 'IP'))
+);
+
+COMMENT ON TABLE idam.login_log_daily_actors             IS '일자별 고유 사용자/IP 목록 (기간 고유 수 계산용)';
+COMMENT ON COLUMN idam.login_log_daily_actors.stat_date  IS '집계 일자';
+COMMENT ON COLUMN idam.login_log_daily_actors.actor_type IS '구분 (USER: 로그인 성공 사용자, IP: 시도 IP)';
+COMMENT ON COLUMN idam.login_log_daily_actors.actor      IS '사용자 ID 또는 IP 주소';